@@ -26,7 +26,7 @@ if SRC.exists() and str(SRC) not in sys.path:
 from src.app.interfaces.http.api import account_routes, market_routes, system_routes, tasks_routes, trading_routes, ws_routes
 from src.app.interfaces.http.api import qrl_routes, trading_api
 from src.app.interfaces.http.pages import dashboard_routes
-from src.app.interfaces.http.dependencies import build_exchange_factory
+from src.app.interfaces.http.dependencies import build_exchange_factory, exchange_lifespan
 
 load_dotenv()
 
@@ -36,6 +36,7 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="QRL/USDT Trading Bot",
         version="0.1.0",
+        lifespan=exchange_lifespan,
     )
 
     static_dir = Path(__file__).parent / "src" / "app" / "interfaces" / "http" / "pages" / "static"
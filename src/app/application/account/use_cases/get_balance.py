@@ -14,6 +14,18 @@ def _mid(price: Price) -> Decimal:
     return (price.bid + price.ask) / Decimal("2")
 
 
+def _mid_from_ticker(ticker: dict) -> Decimal | None:
+    """Mid price from a raw 24h ticker, or None when bid/ask are not quotable."""
+    try:
+        bid = Decimal(str(ticker.get("bidPrice") or ticker.get("bid")))
+        ask = Decimal(str(ticker.get("askPrice") or ticker.get("ask")))
+    except (ArithmeticError, ValueError):
+        return None
+    if bid <= 0 or ask <= 0:
+        return None
+    return (bid + ask) / Decimal("2")
+
+
 def _aggregate_balances(account: Account) -> dict:
     usdt_free = usdt_locked = Decimal("0")
     qrl_free = qrl_locked = Decimal("0")
@@ -93,6 +105,10 @@ def _serialize_account(account: Account, valuation: dict) -> dict:
     }
 
 
+def _balance_view(account: Account, mid_price: Decimal | None) -> dict:
+    return _serialize_account(account, _valuation(_aggregate_balances(account), mid_price))
+
+
 @dataclass
 class GetBalanceUseCase:
     exchange_factory: ExchangeServiceFactory
@@ -107,6 +123,4 @@ class GetBalanceUseCase:
                 price = None
                 mid = None
 
-        agg = _aggregate_balances(account)
-        valuation = _valuation(agg, mid)
-        return _serialize_account(account, valuation)
+        return _balance_view(account, mid)
@@ -1,4 +1,5 @@
 from src.app.application.ports.exchange_service import ExchangeServiceFactory
+from src.app.domain.value_objects.kline import KLine
 from src.app.domain.value_objects.symbol import Symbol
 
 
@@ -15,14 +16,18 @@ class GetQrlKline:
             klines = await exchange.get_kline(
                 Symbol("QRLUSDT"), interval=self._interval, limit=self._limit
             )
-        return [
-            [
-                int(k.timestamp.value.timestamp() * 1000),
-                str(k.open),
-                str(k.high),
-                str(k.low),
-                str(k.close),
-                str(k.volume),
-            ]
-            for k in klines
+        return _serialize_qrl_klines(klines)
+
+
+def _serialize_qrl_klines(klines: list[KLine]) -> list:
+    return [
+        [
+            int(k.timestamp.value.timestamp() * 1000),
+            str(k.open),
+            str(k.high),
+            str(k.low),
+            str(k.close),
+            str(k.volume),
         ]
+        for k in klines
+    ]
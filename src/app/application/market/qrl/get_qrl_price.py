@@ -27,21 +27,25 @@ class GetQrlPrice:
     async def execute(self) -> QrlPriceSnapshot:
         async with self._exchange_factory() as exchange:
             ticker = await exchange.get_ticker_24h(Symbol(QrlUsdtPair.symbol()))
-        bid = ticker.get("bidPrice") or ticker.get("bid")
-        ask = ticker.get("askPrice") or ticker.get("ask")
-        last = ticker.get("lastPrice") or ticker.get("last")
-        if last is None:
-            raise ValueError("QRL price unavailable")
-        price_vo = QrlPrice(last)
-        timestamp = (
-            ticker.get("time")
-            or ticker.get("timestamp")
-            or ticker.get("closeTime")
-            or ticker.get("t")  # some SDKs return shorthand
-        )
-        return QrlPriceSnapshot(
-            bid=str(bid) if bid is not None else None,
-            ask=str(ask) if ask is not None else None,
-            last=str(price_vo.value),
-            timestamp=timestamp,
-        )
+        return _snapshot_from_ticker(ticker)
+
+
+def _snapshot_from_ticker(ticker: dict) -> QrlPriceSnapshot:
+    bid = ticker.get("bidPrice") or ticker.get("bid")
+    ask = ticker.get("askPrice") or ticker.get("ask")
+    last = ticker.get("lastPrice") or ticker.get("last")
+    if last is None:
+        raise ValueError("QRL price unavailable")
+    price_vo = QrlPrice(last)
+    timestamp = (
+        ticker.get("time")
+        or ticker.get("timestamp")
+        or ticker.get("closeTime")
+        or ticker.get("t")  # some SDKs return shorthand
+    )
+    return QrlPriceSnapshot(
+        bid=str(bid) if bid is not None else None,
+        ask=str(ask) if ask is not None else None,
+        last=str(price_vo.value),
+        timestamp=timestamp,
+    )
@@ -0,0 +1,70 @@
+import asyncio
+from dataclasses import dataclass
+
+from src.app.application.account.use_cases.get_balance import _balance_view, _mid_from_ticker
+from src.app.application.market.qrl.get_qrl_kline import _serialize_qrl_klines
+from src.app.application.market.qrl.get_qrl_price import QrlPriceSnapshot, _snapshot_from_ticker
+from src.app.application.market.use_cases.get_depth import _serialize_depth
+from src.app.application.ports.exchange_service import ExchangeServiceFactory
+from src.app.application.trading.use_cases.list_trades import _serialize_trade
+from src.app.application.trading.use_cases.place_order import _serialize_order
+from src.app.domain.value_objects.qrl_usdt_pair import QrlUsdtPair
+from src.app.domain.value_objects.symbol import Symbol
+
+
+@dataclass(frozen=True)
+class QrlSummary:
+    price: QrlPriceSnapshot
+    klines: list
+    depth: dict
+    balance: dict
+    orders: list[dict]
+    trades: list[dict]
+    market_trades: list[dict]
+
+
+class GetQrlSummary:
+    """
+    Assemble the dashboard summary over a single exchange session.
+
+    Each upstream resource is fetched exactly once; the 24h ticker backs both
+    the price snapshot and the balance valuation.
+    """
+
+    def __init__(
+        self,
+        exchange_factory: ExchangeServiceFactory,
+        *,
+        interval: str = "1m",
+        kline_limit: int = 50,
+        depth_limit: int = 50,
+        trades_limit: int = 50,
+    ):
+        self._exchange_factory = exchange_factory
+        self._interval = interval
+        self._kline_limit = kline_limit
+        self._depth_limit = depth_limit
+        self._trades_limit = trades_limit
+
+    async def execute(self) -> QrlSummary:
+        symbol = Symbol(QrlUsdtPair.symbol())
+        async with self._exchange_factory() as exchange:
+            ticker, klines, book, account, orders, trades, market_trades = await asyncio.gather(
+                exchange.get_ticker_24h(symbol),
+                exchange.get_kline(symbol, interval=self._interval, limit=self._kline_limit),
+                exchange.get_depth(symbol, limit=self._depth_limit),
+                exchange.get_account(),
+                exchange.list_open_orders(symbol),
+                exchange.list_trades(symbol),
+                exchange.get_market_trades(symbol, limit=self._trades_limit),
+            )
+
+        return QrlSummary(
+            price=_snapshot_from_ticker(ticker),
+            klines=_serialize_qrl_klines(klines),
+            depth=_serialize_depth(book),
+            balance=_balance_view(account, _mid_from_ticker(ticker)),
+            orders=[_serialize_order(order) for order in orders],
+            trades=[_serialize_trade(trade) for trade in trades],
+            market_trades=market_trades[: self._trades_limit],
+        )
@@ -0,0 +1,50 @@
+"""
+Market use case: price-impact curve for QRL/USDT market orders.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from src.app.application.ports.exchange_service import ExchangeServiceFactory
+from src.app.domain.value_objects.order_book import FillEstimate
+from src.app.domain.value_objects.side import Side
+from src.app.domain.value_objects.symbol import Symbol
+
+
+@dataclass
+class GetMarketImpactInput:
+    side: str = "BUY"
+    sizes: list[Decimal] = field(default_factory=lambda: [Decimal("100"), Decimal("1000"), Decimal("10000")])
+    limit: int = 1000
+
+
+class GetMarketImpactUseCase:
+    """Estimate fill, VWAP and slippage for several order sizes from one depth snapshot."""
+
+    def __init__(self, exchange_factory: ExchangeServiceFactory):
+        self._exchange_factory = exchange_factory
+
+    async def execute(self, data: GetMarketImpactInput | None = None) -> dict:
+        payload = data or GetMarketImpactInput()
+        side = Side(payload.side.upper())
+        async with self._exchange_factory() as exchange:
+            book = await exchange.get_depth(Symbol("QRLUSDT"), limit=payload.limit)
+        depth = book.side_for(side.value).cumulative()
+        return {
+            "side": side.value,
+            "available_quantity": str(depth.total_quantity),
+            "available_notional": str(depth.total_notional),
+            "points": [_serialize_estimate(estimate) for estimate in depth.fills(payload.sizes)],
+        }
+
+
+def _serialize_estimate(estimate: FillEstimate) -> dict:
+    return {
+        "size": str(estimate.target),
+        "filled": str(estimate.filled),
+        "complete": estimate.complete,
+        "vwap": str(estimate.vwap),
+        "worst_price": str(estimate.worst_price),
+        "slippage_pct": str(estimate.slippage_pct),
+        "levels": estimate.levels,
+    }
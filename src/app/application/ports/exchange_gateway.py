@@ -1,25 +1,52 @@
 from typing import AsyncIterator, Protocol
 
-from app.domain.events.market_depth_event import MarketDepthEvent
-from app.domain.events.trade_event import TradeEvent
-from app.domain.events.order_event import OrderEvent
-from app.domain.events.balance_event import BalanceEvent
-from app.domain.value_objects.symbol import Symbol
+from src.app.domain.events.market_depth_event import MarketDepthEvent
+from src.app.domain.events.mini_ticker_event import MiniTickerEvent
+from src.app.domain.events.trade_event import TradeEvent
+from src.app.domain.events.order_event import OrderEvent
+from src.app.domain.events.balance_event import BalanceEvent
+from src.app.domain.events.book_ticker_event import BookTickerEvent
+from src.app.domain.events.fill_event import FillEvent
+from src.app.domain.value_objects.symbol import Symbol
 
 
 class ExchangeGateway(Protocol):
     """Application port for streaming market/account data."""
 
     async def subscribe_market_depth(
-        self, symbol: Symbol
+        self, symbol: Symbol, interval: str = "100ms"
     ) -> AsyncIterator[MarketDepthEvent]:
+        """``interval`` trades freshness for load: ``raw``, ``10ms`` or ``100ms``."""
+        ...
+
+    async def subscribe_trades(
+        self, symbol: Symbol, interval: str = "100ms"
+    ) -> AsyncIterator[TradeEvent]:
+        ...
+
+    async def subscribe_book_ticker(
+        self, symbol: Symbol, interval: str = "100ms"
+    ) -> AsyncIterator[BookTickerEvent]:
+        ...
+
+    async def subscribe_depth_batches(self, symbol: Symbol) -> AsyncIterator[MarketDepthEvent]:
+        ...
+
+    async def subscribe_book_ticker_batches(
+        self, symbol: Symbol
+    ) -> AsyncIterator[list[BookTickerEvent]]:
         ...
 
-    async def subscribe_trades(self, symbol: Symbol) -> AsyncIterator[TradeEvent]:
+    async def subscribe_mini_tickers(
+        self, timezone: str = "UTC+8"
+    ) -> AsyncIterator[list[MiniTickerEvent]]:
         ...
 
     async def subscribe_orders(self) -> AsyncIterator[OrderEvent]:
         ...
 
+    async def subscribe_fills(self) -> AsyncIterator[FillEvent]:
+        ...
+
     async def subscribe_balances(self) -> AsyncIterator[BalanceEvent]:
         ...
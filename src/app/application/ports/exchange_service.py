@@ -1,9 +1,10 @@
 from dataclasses import dataclass
-from typing import AsyncContextManager, Callable, Protocol
+from typing import AsyncContextManager, AsyncIterator, Callable, Protocol, TypeVar
 
 from src.app.domain.entities.account import Account
 from src.app.domain.entities.order import Order
 from src.app.domain.entities.trade import Trade
+from src.app.domain.value_objects.history_cursor import HistoryCursor
 from src.app.domain.value_objects.kline import KLine
 from src.app.domain.value_objects.order_book import OrderBook
 from src.app.domain.value_objects.order_type import OrderType
@@ -40,6 +41,17 @@ class GetOrderRequest:
     client_order_id: str | None = None
 
 
+T_co = TypeVar("T_co", covariant=True)
+
+
+class HistoryIterable(Protocol[T_co]):
+    """Lazily paged history; ``cursor`` points just after the last item yielded."""
+
+    cursor: HistoryCursor
+
+    def __aiter__(self) -> AsyncIterator[T_co]: ...
+
+
 class ExchangeService(Protocol, AsyncContextManager["ExchangeService"]):
     """Application port exposing required exchange operations."""
 
@@ -57,6 +69,23 @@ class ExchangeService(Protocol, AsyncContextManager["ExchangeService"]):
 
     async def list_trades(self, symbol: Symbol) -> list[Trade]: ...
 
+    def trade_history(
+        self, symbol: Symbol, start: int | HistoryCursor, end_time: int | None = None
+    ) -> HistoryIterable[Trade]:
+        """
+        Every fill from an epoch-millisecond time or a cursor on, oldest first, fetched lazily.
+
+        Raises:
+            ValueError: if the range reaches further back than the exchange serves.
+        """
+        ...
+
+    def order_history(
+        self, symbol: Symbol, start: int | HistoryCursor, end_time: int | None = None
+    ) -> HistoryIterable[Order]:
+        """Every order created from a time or a cursor on, oldest first; see ``trade_history``."""
+        ...
+
     async def get_price(self, symbol: Symbol) -> Price: ...
 
     async def get_kline(self, symbol: Symbol, interval: str, limit: int = 100) -> list[KLine]: ...
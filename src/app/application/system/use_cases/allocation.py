@@ -1,5 +1,6 @@
 """System use case to expose an allocation trigger for schedulers."""
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -75,23 +76,32 @@ class AllocationUseCase:
         self._limit_price = Decimal(limit_price)
 
     async def execute(self) -> AllocationResult:
-        """Compare balances, evaluate depth/slippage, and submit a balancing order."""
+        """
+        Compare balances, evaluate depth/slippage, and submit a balancing order.
+
+        Account and depth are fetched concurrently; the mid price comes from the
+        book and the ticker is only consulted when the book has no two-sided quote.
+        """
         request_id = str(uuid4())
         executed_at = datetime.now(timezone.utc)
         async with self._exchange_factory() as svc:
-            account = await svc.get_account()
-            try:
-                quote = await svc.get_price(AllocationConfig.SYMBOL)
-                mid_price = (quote.bid + quote.ask) / Decimal("2")
-            except Exception:
-                return _result_from_price_error(request_id, executed_at)
+            account, order_book = await asyncio.gather(
+                svc.get_account(),
+                svc.get_depth(AllocationConfig.SYMBOL, limit=self._depth_limit),
+            )
+            mid_price = order_book.mid_price
+            if mid_price is None:
+                try:
+                    quote = await svc.get_price(AllocationConfig.SYMBOL)
+                    mid_price = (quote.bid + quote.ask) / Decimal("2")
+                except Exception:
+                    return _result_from_price_error(request_id, executed_at)
 
             balances = _normalize_balances(account, mid_price, self._valuation_service)
             comparison = self._comparison_rule.evaluate(balances)
             if comparison.action == "skip" or comparison.preferred_side is None:
                 return _result_from_skip(request_id, executed_at, comparison)
 
-            order_book = await svc.get_depth(AllocationConfig.SYMBOL, limit=self._depth_limit)
             filled, weighted_price = self._depth_calculator.compute(
                 order_book, comparison.preferred_side, self._target_quantity
             )
@@ -172,20 +182,15 @@ def _build_order_command(*, side: Side, quantity: Quantity, limit_price: Decimal
 
 
 def _best_price(book: OrderBook, side: Side) -> Decimal:
-    prices = [level.price for level in (book.asks if side.value == "BUY" else book.bids)]
-    if not prices:
-        return Decimal("0")
-    return min(prices) if side.value == "BUY" else max(prices)
+    return book.side_for(side.value).best_price or Decimal("0")
 
 
 def _best_bid(book: OrderBook) -> Decimal:
-    bids = [level.price for level in book.bids]
-    return max(bids) if bids else Decimal("0")
+    return book.best_bid or Decimal("0")
 
 
 def _best_ask(book: OrderBook) -> Decimal:
-    asks = [level.price for level in book.asks]
-    return min(asks) if asks else Decimal("0")
+    return book.best_ask or Decimal("0")
 
 
 def _compute_limit_price(*, side: Side, best_bid: Decimal, best_ask: Decimal, buffer_pct: Decimal) -> Decimal | None:
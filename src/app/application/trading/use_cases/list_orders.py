@@ -1,7 +1,11 @@
 """Trading use case: list open/closed orders."""
 
+from typing import AsyncIterator
+
 from src.app.application.ports.exchange_service import ExchangeServiceFactory
+from src.app.application.trading.use_cases.list_trades import _with_cursor
 from src.app.application.trading.use_cases.place_order import _serialize_order
+from src.app.domain.value_objects.history_cursor import HistoryCursor
 from src.app.domain.value_objects.symbol import Symbol
 
 
@@ -13,3 +17,12 @@ class ListOrdersUseCase:
         async with self._exchange_factory() as exchange:
             orders = await exchange.list_open_orders(Symbol(symbol) if symbol else None)
         return [_serialize_order(order) for order in orders]
+
+    async def history(
+        self, symbol: str, start: int | HistoryCursor, end_time: int | None = None
+    ) -> AsyncIterator[dict]:
+        """Stream every order created in the range, oldest first, then a resume cursor."""
+        async with self._exchange_factory() as exchange:
+            orders = exchange.order_history(Symbol(symbol), start, end_time)
+            async for row in _with_cursor(orders, _serialize_order):
+                yield row
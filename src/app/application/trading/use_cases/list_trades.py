@@ -1,10 +1,18 @@
 """Trading use case: list trades for QRL/USDT."""
 
-from src.app.application.ports.exchange_service import ExchangeServiceFactory
+import logging
+from typing import AsyncIterator, Callable, TypeVar
+
+from src.app.application.ports.exchange_service import ExchangeServiceFactory, HistoryIterable
 from src.app.application.trading.dtos import TradeDTO
 from src.app.domain.entities.trade import Trade
+from src.app.domain.value_objects.history_cursor import HistoryCursor
 from src.app.domain.value_objects.symbol import Symbol
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
 
 def _serialize_trade(trade: Trade) -> dict:
     dto = TradeDTO(
@@ -21,6 +29,24 @@ def _serialize_trade(trade: Trade) -> dict:
     return dto.to_dict()
 
 
+async def _with_cursor(
+    history: HistoryIterable[T], serialize: Callable[[T], dict]
+) -> AsyncIterator[dict]:
+    """
+    Serialized history items followed by a ``{"cursor": ...}`` record to resume from.
+
+    A failure part-way ends the stream with the cursor and an ``error`` instead.
+    """
+    try:
+        async for item in history:
+            yield serialize(item)
+    except Exception as exc:
+        logger.warning("History stream failed; ending it with a resume cursor", exc_info=True)
+        yield {"cursor": history.cursor.token(), "error": str(exc)}
+        return
+    yield {"cursor": history.cursor.token()}
+
+
 class ListTradesUseCase:
     def __init__(self, exchange_factory: ExchangeServiceFactory):
         self._exchange_factory = exchange_factory
@@ -29,3 +55,12 @@ class ListTradesUseCase:
         async with self._exchange_factory() as exchange:
             trades = await exchange.list_trades(Symbol(symbol))
         return [_serialize_trade(trade) for trade in trades]
+
+    async def history(
+        self, symbol: str, start: int | HistoryCursor, end_time: int | None = None
+    ) -> AsyncIterator[dict]:
+        """Stream every trade in the range, one page of the exchange at a time."""
+        async with self._exchange_factory() as exchange:
+            trades = exchange.trade_history(Symbol(symbol), start, end_time)
+            async for row in _with_cursor(trades, _serialize_trade):
+                yield row
@@ -1,11 +1,15 @@
 from .balance_event import BalanceEvent
+from .book_ticker_event import BookTickerEvent
 from .market_depth_event import MarketDepthEvent
+from .mini_ticker_event import MiniTickerEvent
 from .order_event import OrderEvent
 from .trade_event import TradeEvent
 
 __all__ = [
     "BalanceEvent",
+    "BookTickerEvent",
     "MarketDepthEvent",
+    "MiniTickerEvent",
     "OrderEvent",
     "TradeEvent",
 ]
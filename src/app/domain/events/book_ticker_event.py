@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+from src.app.domain.value_objects.symbol import Symbol
+
+
+@dataclass(frozen=True)
+class BookTickerEvent:
+    """Best bid/ask of one symbol."""
+
+    symbol: Symbol
+    bid_price: Decimal
+    bid_quantity: Decimal
+    ask_price: Decimal
+    ask_quantity: Decimal
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+from src.app.domain.value_objects.order_id import OrderId
+from src.app.domain.value_objects.side import Side
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.domain.value_objects.trade_id import TradeId
+
+
+@dataclass(frozen=True)
+class FillEvent:
+    """Private execution (own trade) against one of the account's orders."""
+
+    trade_id: TradeId
+    order_id: OrderId
+    symbol: Symbol
+    side: Side
+    price: Decimal
+    quantity: Decimal
+    fee: Decimal | None
+    fee_asset: str | None
+    is_maker: bool
+    timestamp: int
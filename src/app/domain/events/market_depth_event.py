@@ -1,9 +1,8 @@
 from dataclasses import dataclass
+from decimal import Decimal
 from typing import List, Tuple
 
-from app.domain.value_objects.price import Price
-from app.domain.value_objects.quantity import Quantity
-from app.domain.value_objects.symbol import Symbol
+from src.app.domain.value_objects.symbol import Symbol
 
 
 @dataclass(frozen=True)
@@ -13,12 +12,13 @@ class MarketDepthEvent:
 
     Notes:
         - Bids/asks are sorted by price on the exchange side.
+        - Levels are (price, quantity); a zero quantity removes the price level.
         - Versions allow consumers to detect gaps and request replay.
     """
 
     symbol: Symbol
-    bids: List[Tuple[Price, Quantity]]
-    asks: List[Tuple[Price, Quantity]]
+    bids: List[Tuple[Decimal, Decimal]]
+    asks: List[Tuple[Decimal, Decimal]]
     event_type: str | None
     from_version: str | None
     to_version: str | None
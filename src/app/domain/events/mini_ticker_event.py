@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+
+@dataclass(frozen=True)
+class MiniTickerEvent:
+    """
+    Rolling 24h summary of one market.
+
+    Notes:
+        - Mini-ticker pushes cover every listed market, so the symbol is the
+          raw exchange string rather than the QRL/USDT-scoped ``Symbol``.
+        - ``rate`` is the price change ratio in the subscribed timezone.
+    """
+
+    symbol: str
+    price: Decimal
+    rate: Decimal
+    high: Decimal
+    low: Decimal
+    volume: Decimal
+    quantity: Decimal
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
+from decimal import Decimal
 
-from app.domain.value_objects.order_id import OrderId
-from app.domain.value_objects.order_status import OrderStatus
-from app.domain.value_objects.price import Price
-from app.domain.value_objects.quantity import Quantity
-from app.domain.value_objects.symbol import Symbol
+from src.app.domain.value_objects.order_id import OrderId
+from src.app.domain.value_objects.order_status import OrderStatus
+from src.app.domain.value_objects.price import Price
+from src.app.domain.value_objects.quantity import Quantity
+from src.app.domain.value_objects.symbol import Symbol
 
 
 @dataclass(frozen=True)
@@ -13,7 +14,9 @@ class OrderEvent:
 
     order_id: OrderId
     symbol: Symbol
-    price: Price
-    quantity: Quantity
+    price: Price | None
+    quantity: Quantity | None
     status: OrderStatus
     timestamp: int
+    executed_quantity: Decimal | None = None
+    cumulative_quote_quantity: Decimal | None = None
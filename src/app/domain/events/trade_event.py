@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 
-from app.domain.value_objects.price import Price
-from app.domain.value_objects.quantity import Quantity
-from app.domain.value_objects.symbol import Symbol
-from app.domain.value_objects.trade_id import TradeId
+from src.app.domain.value_objects.price import Price
+from src.app.domain.value_objects.quantity import Quantity
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.domain.value_objects.trade_id import TradeId
 
 
 @dataclass(frozen=True)
@@ -9,22 +9,5 @@ class DepthCalculator:
     """Compute executable depth and weighted price for a side and target quantity."""
 
     def compute(self, book: OrderBook, side: Side, target: Quantity) -> tuple[Decimal, Decimal]:
-        if side.value == "BUY":
-            sorted_levels = sorted(book.asks, key=lambda lvl: lvl.price)
-        else:
-            sorted_levels = sorted(book.bids, key=lambda lvl: lvl.price, reverse=True)
-
-        remaining = target.value
-        total = Decimal("0")
-        filled = Decimal("0")
-
-        for level in sorted_levels:
-            if remaining <= 0:
-                break
-            take = min(level.quantity, remaining)
-            total += take * level.price
-            filled += take
-            remaining -= take
-
-        weighted_price = total / filled if filled > 0 else Decimal("0")
-        return filled, weighted_price
+        estimate = book.side_for(side.value).cumulative().fill(target.value)
+        return estimate.filled, estimate.vwap
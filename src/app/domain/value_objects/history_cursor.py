@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class HistoryCursor:
+    """Position just after the last item read: its time and the ids read at that time."""
+
+    time: int
+    ids: frozenset[str] = frozenset()
+
+    def covers(self, time: int, item_id: str) -> bool:
+        return time < self.time or (time == self.time and item_id in self.ids)
+
+    def advance(self, time: int, item_id: str) -> "HistoryCursor":
+        if time == self.time:
+            return HistoryCursor(time, self.ids | {item_id})
+        return HistoryCursor(time, frozenset({item_id}))
+
+    def token(self) -> str:
+        """Opaque ``time:id,id`` form handed to API clients to resume from."""
+        return f"{self.time}:{','.join(sorted(self.ids))}"
+
+    @classmethod
+    def from_token(cls, token: str) -> "HistoryCursor":
+        time, separator, ids = token.partition(":")
+        try:
+            value = int(time)
+        except ValueError:
+            raise ValueError(f"Invalid history cursor: {token}") from None
+        if not separator or value < 0:
+            raise ValueError(f"Invalid history cursor: {token}")
+        return cls(value, frozenset(item for item in ids.split(",") if item))
@@ -20,3 +20,17 @@ class KlineInterval:
     def __post_init__(self):
         if self.value not in self._allowed:
             raise ValueError(f"KlineInterval must be one of {sorted(self._allowed)}")
+
+
+_UNIT_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000}
+
+
+def interval_ms(interval: str) -> int:
+    """Length of a ``3m``/``2h``/``1d``-style interval in milliseconds."""
+    try:
+        count, unit = int(interval[:-1]), _UNIT_MS[interval[-1]]
+    except (ValueError, KeyError, IndexError):
+        raise ValueError(f"Unsupported kline interval: {interval}") from None
+    if count <= 0:
+        raise ValueError(f"Unsupported kline interval: {interval}")
+    return count * unit
@@ -1,5 +1,8 @@
-from dataclasses import dataclass, field
+from bisect import bisect_left
+from dataclasses import dataclass
+from itertools import accumulate
 from decimal import Decimal
+from typing import Iterable, Iterator
 
 
 @dataclass(frozen=True)
@@ -26,8 +29,256 @@ class OrderBookSide:
 
 
 @dataclass(frozen=True)
+class FillEstimate:
+    """Expected result of sweeping one side of the book for ``target`` quantity."""
+
+    target: Decimal
+    filled: Decimal
+    notional: Decimal
+    vwap: Decimal
+    best_price: Decimal
+    worst_price: Decimal
+    levels: int
+
+    @property
+    def complete(self) -> bool:
+        return self.filled >= self.target
+
+    @property
+    def slippage_pct(self) -> Decimal:
+        """Absolute VWAP distance from the best price, in percent."""
+        if self.filled <= 0 or self.best_price <= 0:
+            return Decimal("0")
+        return abs(self.vwap - self.best_price) / self.best_price * Decimal("100")
+
+
+class CumulativeDepth:
+    """
+    Prefix sums of quantity and notional over one side, best level first.
+
+    ``fill`` answers any target size with one binary search instead of a walk
+    over the levels.
+    """
+
+    __slots__ = ("_prices", "_quantities", "_notionals")
+
+    def __init__(self, prices: list[Decimal], quantities: list[Decimal]):
+        self._prices = prices
+        self._quantities = list(accumulate(quantities))
+        self._notionals = list(accumulate(price * quantity for price, quantity in zip(prices, quantities)))
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    @property
+    def total_quantity(self) -> Decimal:
+        return self._quantities[-1] if self._quantities else Decimal("0")
+
+    @property
+    def total_notional(self) -> Decimal:
+        return self._notionals[-1] if self._notionals else Decimal("0")
+
+    def fill(self, target: Decimal) -> FillEstimate:
+        """Estimate a sweep of ``target``; nothing fills on an empty side or for ``target <= 0``."""
+        if target <= 0 or not self._prices:
+            zero = Decimal("0")
+            return FillEstimate(target, zero, zero, zero, zero, zero, 0)
+        index = bisect_left(self._quantities, target)
+        if index >= len(self._prices):
+            filled, notional, index = self.total_quantity, self.total_notional, len(self._prices) - 1
+        else:
+            before_qty = self._quantities[index - 1] if index else Decimal("0")
+            before_notional = self._notionals[index - 1] if index else Decimal("0")
+            filled = target
+            notional = before_notional + (target - before_qty) * self._prices[index]
+        return FillEstimate(
+            target=target,
+            filled=filled,
+            notional=notional,
+            vwap=notional / filled,
+            best_price=self._prices[0],
+            worst_price=self._prices[index],
+            levels=index + 1,
+        )
+
+    def fills(self, targets: Iterable[Decimal]) -> list[FillEstimate]:
+        return [self.fill(target) for target in targets]
+
+
+class BookSide:
+    """
+    One side of an order book as parallel sorted price/quantity arrays.
+
+    Levels are stored worst-to-best so the best price sits at the end of the
+    arrays: it is read in O(1), located by bisect in O(log n), and the frequent
+    updates near the top of the book move few elements.
+    """
+
+    __slots__ = ("_side", "_sign", "_keys", "_prices", "_quantities", "_cumulative")
+
+    def __init__(self, side: OrderBookSide, levels: Iterable[DepthLevel] = ()):
+        self._side = side
+        # Bids ascend by price; asks ascend by negated price (descending price).
+        self._sign = 1 if side.value == "BID" else -1
+        # A repeated price keeps the last quantity reported for it.
+        latest = {level.price: level.quantity for level in levels}
+        ordered = sorted(latest, key=lambda price: self._sign * price)
+        self._keys = [self._sign * price for price in ordered]
+        self._prices = ordered
+        self._quantities = [latest[price] for price in ordered]
+        self._cumulative: CumulativeDepth | None = None
+
+    @property
+    def side(self) -> OrderBookSide:
+        return self._side
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    def __iter__(self) -> Iterator[DepthLevel]:
+        return iter(self.levels())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BookSide):
+            return NotImplemented
+        return (
+            self._side == other._side
+            and self._prices == other._prices
+            and self._quantities == other._quantities
+        )
+
+    @property
+    def best_price(self) -> Decimal | None:
+        return self._prices[-1] if self._prices else None
+
+    @property
+    def best_quantity(self) -> Decimal | None:
+        return self._quantities[-1] if self._quantities else None
+
+    def quantity_at(self, price: Decimal) -> Decimal:
+        index = self._index(price)
+        return self._quantities[index] if index is not None else Decimal("0")
+
+    def update(self, price: Decimal, quantity: Decimal) -> None:
+        """Set the quantity at ``price``; a non-positive quantity removes the level."""
+        if price <= 0:
+            raise ValueError("Order book price must be positive")
+        key = self._sign * price
+        index = bisect_left(self._keys, key)
+        present = index < len(self._keys) and self._keys[index] == key
+        self._cumulative = None
+        if quantity <= 0:
+            if present:
+                del self._keys[index]
+                del self._prices[index]
+                del self._quantities[index]
+        elif present:
+            self._quantities[index] = quantity
+        else:
+            self._keys.insert(index, key)
+            self._prices.insert(index, price)
+            self._quantities.insert(index, quantity)
+
+    def prices(self, limit: int | None = None) -> list[Decimal]:
+        """Prices best-first."""
+        return self._prices[self._start(limit):][::-1]
+
+    def quantities(self, limit: int | None = None) -> list[Decimal]:
+        """Quantities best-first, aligned with :meth:`prices`."""
+        return self._quantities[self._start(limit):][::-1]
+
+    def levels(self, limit: int | None = None) -> list[DepthLevel]:
+        """DepthLevel views best-first."""
+        return [
+            DepthLevel(price=price, quantity=quantity)
+            for price, quantity in zip(self.prices(limit), self.quantities(limit))
+        ]
+
+    def cumulative(self) -> CumulativeDepth:
+        """Prefix-sum index over the current levels, rebuilt after updates."""
+        if self._cumulative is None:
+            self._cumulative = CumulativeDepth(self.prices(), self.quantities())
+        return self._cumulative
+
+    def top(self, limit: int | None = None) -> "BookSide":
+        """Copy of the best ``limit`` levels."""
+        start = self._start(limit)
+        copy = BookSide(self._side)
+        copy._keys = self._keys[start:]
+        copy._prices = self._prices[start:]
+        copy._quantities = self._quantities[start:]
+        return copy
+
+    def _index(self, price: Decimal) -> int | None:
+        key = self._sign * price
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return index
+        return None
+
+    def _start(self, limit: int | None) -> int:
+        return 0 if limit is None else max(len(self._keys) - limit, 0)
+
+
 class OrderBook:
-    """Aggregated order book snapshot with bids and asks."""
+    """
+    Aggregated order book snapshot with bids and asks.
+
+    Each side is a :class:`BookSide`, so best bid/ask are O(1) and level
+    updates are bisect-based. ``bids``/``asks`` return ``DepthLevel`` lists
+    ordered best-first for callers that walk the book.
+    """
+
+    __slots__ = ("bid_side", "ask_side")
+
+    def __init__(self, bids: Iterable[DepthLevel] = (), asks: Iterable[DepthLevel] = ()):
+        self.bid_side = BookSide(OrderBookSide("BID"), bids)
+        self.ask_side = BookSide(OrderBookSide("ASK"), asks)
+
+    def __repr__(self) -> str:
+        return f"OrderBook(bids={len(self.bid_side)} levels, asks={len(self.ask_side)} levels)"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OrderBook):
+            return NotImplemented
+        return self.bid_side == other.bid_side and self.ask_side == other.ask_side
+
+    @property
+    def bids(self) -> list[DepthLevel]:
+        return self.bid_side.levels()
+
+    @property
+    def asks(self) -> list[DepthLevel]:
+        return self.ask_side.levels()
+
+    @property
+    def best_bid(self) -> Decimal | None:
+        return self.bid_side.best_price
+
+    @property
+    def best_ask(self) -> Decimal | None:
+        return self.ask_side.best_price
+
+    @property
+    def mid_price(self) -> Decimal | None:
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return (self.best_bid + self.best_ask) / Decimal("2")
+
+    def side_for(self, taker_side: str) -> BookSide:
+        """Side a taker order consumes: asks for BUY, bids for SELL."""
+        return self.ask_side if taker_side == "BUY" else self.bid_side
+
+    def update(self, side: OrderBookSide, price: Decimal, quantity: Decimal) -> None:
+        target = self.bid_side if side.value == "BID" else self.ask_side
+        target.update(price, quantity)
 
-    bids: list[DepthLevel] = field(default_factory=list)
-    asks: list[DepthLevel] = field(default_factory=list)
+    def top(self, limit: int | None = None) -> "OrderBook":
+        """Independent copy holding the best ``limit`` levels per side."""
+        book = OrderBook()
+        book.bid_side = self.bid_side.top(limit)
+        book.ask_side = self.ask_side.top(limit)
+        return book
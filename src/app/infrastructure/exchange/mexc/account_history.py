@@ -0,0 +1,181 @@
+"""Complete trade and order history, paged lazily from ``myTrades``/``allOrders``."""
+
+import asyncio
+from collections import deque
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, TypeVar
+
+from src.app.domain.entities.order import Order
+from src.app.domain.entities.trade import Trade
+from src.app.domain.value_objects.history_cursor import HistoryCursor
+from src.app.infrastructure.exchange.mexc.mappers import order_from_api, trade_from_api
+from src.app.infrastructure.exchange.mexc.rest_client import MexcRestClient
+
+T = TypeVar("T")
+
+# (start_time, end_time, limit) -> one page of raw rows
+PageFetch = Callable[[int, int, int], Awaitable[list[dict[str, Any]]]]
+
+DAY_MS = 86_400_000
+# How far back MEXC serves myTrades (one month) and allOrders (seven days).
+TRADE_HISTORY_MAX_AGE_MS = 30 * DAY_MS
+ORDER_HISTORY_MAX_AGE_MS = 7 * DAY_MS
+
+
+class HistoryPageOverflow(Exception):
+    """Raised when a full page of history shares one millisecond, so time cannot page it."""
+
+
+class HistoryStream(Generic[T]):
+    """
+    Account history between two times, yielded oldest first as domain objects.
+
+    The range is read in ``window_ms`` time windows, up to ``concurrency`` at
+    once, and a window whose page comes back full is paged on from the time
+    of its last row. Only the windows in flight are held in memory. ``cursor``
+    always points after the last item yielded; pass it back as ``start`` to
+    resume without repeating or skipping items. A start older than
+    ``max_age_ms`` is rejected up front: the exchange holds nothing there,
+    and every window would still cost a signed call. More than a page of
+    rows in a single millisecond cannot be paged by time, and raises
+    :class:`HistoryPageOverflow` rather than silently dropping rows.
+    """
+
+    def __init__(
+        self,
+        fetch: PageFetch,
+        mapper: Callable[[dict[str, Any]], T],
+        *,
+        time_of: Callable[[dict[str, Any]], int],
+        id_of: Callable[[dict[str, Any]], str],
+        start: int | HistoryCursor,
+        end: int | None = None,
+        window_ms: int = DAY_MS,
+        page_size: int = 100,
+        concurrency: int = 4,
+        max_age_ms: int | None = None,
+    ):
+        if window_ms <= 0 or page_size <= 0 or concurrency <= 0:
+            raise ValueError("window_ms, page_size and concurrency must be positive")
+        start_time = start.time if isinstance(start, HistoryCursor) else start
+        if max_age_ms is not None and start_time < _now_ms() - max_age_ms:
+            raise ValueError(f"History older than {max_age_ms // DAY_MS} days is not available")
+        if end is not None and end < start_time:
+            raise ValueError("History end time is before its start")
+        self._fetch = fetch
+        self._mapper = mapper
+        self._time_of = time_of
+        self._id_of = id_of
+        self.cursor = start if isinstance(start, HistoryCursor) else HistoryCursor(start)
+        self._end = end
+        self._window_ms = window_ms
+        self._page_size = page_size
+        self._concurrency = concurrency
+        self.pages = 0
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[T]:
+        end = self._end if self._end is not None else _now_ms()
+        windows = iter(range(self.cursor.time, end + 1, self._window_ms))
+        pending: deque[asyncio.Task] = deque()
+
+        def schedule() -> None:
+            for start in islice(windows, self._concurrency - len(pending)):
+                stop = min(start + self._window_ms - 1, end)
+                pending.append(asyncio.ensure_future(self._read_window(start, stop)))
+
+        try:
+            schedule()
+            while pending:
+                rows = await pending.popleft()
+                schedule()
+                for row in rows:
+                    time, item_id = self._time_of(row), self._id_of(row)
+                    if self.cursor.covers(time, item_id):
+                        continue
+                    item = self._mapper(row)
+                    self.cursor = self.cursor.advance(time, item_id)
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _read_window(self, start: int, end: int) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        since = start
+        while True:
+            page = sorted(await self._fetch(since, end, self._page_size), key=self._time_of)
+            self.pages += 1
+            rows.extend(page)
+            if len(page) < self._page_size:
+                return sorted(rows, key=self._time_of)
+            last = self._time_of(page[-1])
+            if last <= since:
+                raise HistoryPageOverflow(
+                    f"More than {len(page)} history rows at {last}; use a larger page size"
+                )
+            since = last
+            if since > end:
+                return sorted(rows, key=self._time_of)
+
+
+def trade_history(
+    rest_client: MexcRestClient,
+    symbol: str,
+    start: int | HistoryCursor,
+    end: int | None = None,
+    **options: Any,
+) -> HistoryStream[Trade]:
+    """Every fill of ``symbol`` from ``/api/v3/myTrades`` (at most 100 rows per page)."""
+
+    async def fetch(start_time: int, end_time: int, limit: int) -> list[dict[str, Any]]:
+        return await rest_client.list_trades(
+            symbol=symbol, limit=limit, start_time=start_time, end_time=end_time
+        )
+
+    options.setdefault("page_size", 100)
+    options.setdefault("max_age_ms", TRADE_HISTORY_MAX_AGE_MS)
+    return HistoryStream(
+        fetch,
+        trade_from_api,
+        time_of=lambda row: int(row.get("time", 0)),
+        id_of=lambda row: str(row.get("id")),
+        start=start,
+        end=end,
+        **options,
+    )
+
+
+def order_history(
+    rest_client: MexcRestClient,
+    symbol: str,
+    start: int | HistoryCursor,
+    end: int | None = None,
+    **options: Any,
+) -> HistoryStream[Order]:
+    """Every order of ``symbol`` from ``/api/v3/allOrders`` (at most 1000 rows per page)."""
+
+    async def fetch(start_time: int, end_time: int, limit: int) -> list[dict[str, Any]]:
+        return await rest_client.all_orders(
+            symbol=symbol, limit=limit, start_time=start_time, end_time=end_time
+        )
+
+    options.setdefault("page_size", 1000)
+    options.setdefault("max_age_ms", ORDER_HISTORY_MAX_AGE_MS)
+    return HistoryStream(
+        fetch,
+        order_from_api,
+        time_of=lambda row: int(row.get("time", row.get("createTime", 0))),
+        id_of=lambda row: str(row.get("orderId")),
+        start=start,
+        end=end,
+        **options,
+    )
+
+
+def _now_ms() -> int:
+    return int(datetime.now(timezone.utc).timestamp() * 1000)
@@ -1,13 +1,30 @@
 from .balance_mapper import balance_proto_to_domain
-from .depth_mapper import depth_proto_to_domain
+from .book_ticker_mapper import (
+    book_ticker_batch_proto_to_domain,
+    book_ticker_fields_to_domain,
+    book_ticker_proto_to_domain,
+)
+from .depth_mapper import (
+    depth_batch_proto_to_domain,
+    depth_proto_to_domain,
+    increase_depth_proto_to_domain,
+)
 from .market_event_adapter import MexcExchangeGateway
+from .mini_ticker_mapper import mini_ticker_proto_to_domain, mini_tickers_proto_to_domain
 from .order_mapper import order_proto_to_domain
 from .trade_mapper import trade_proto_to_domain
 
 __all__ = [
     "MexcExchangeGateway",
     "balance_proto_to_domain",
+    "book_ticker_batch_proto_to_domain",
+    "book_ticker_fields_to_domain",
+    "book_ticker_proto_to_domain",
+    "depth_batch_proto_to_domain",
     "depth_proto_to_domain",
+    "increase_depth_proto_to_domain",
+    "mini_ticker_proto_to_domain",
+    "mini_tickers_proto_to_domain",
     "order_proto_to_domain",
     "trade_proto_to_domain",
 ]
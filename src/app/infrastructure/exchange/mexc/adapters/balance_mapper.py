@@ -1,15 +1,15 @@
 from decimal import Decimal
 
-from app.domain.events.balance_event import BalanceEvent
-from app.infrastructure.exchange.mexc.generated import PrivateAccountV3Api_pb2
+from src.app.domain.events.balance_event import BalanceEvent
+from src.app.infrastructure.exchange.mexc.generated import PrivateAccountV3Api_pb2
 
 
 def balance_proto_to_domain(
-    proto: PrivateAccountV3Api_pb2.PrivateAccountV3ApiBalance,
+    proto: PrivateAccountV3Api_pb2.PrivateAccountV3Api,
 ) -> BalanceEvent:
     return BalanceEvent(
-        asset=proto.asset,
-        free=Decimal(proto.free),
-        locked=Decimal(proto.locked),
-        timestamp=proto.timestamp,
+        asset=proto.vcoinName,
+        free=Decimal(proto.balanceAmount or "0"),
+        locked=Decimal(proto.frozenAmount or "0"),
+        timestamp=proto.time,
     )
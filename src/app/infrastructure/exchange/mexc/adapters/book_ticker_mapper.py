@@ -0,0 +1,40 @@
+from decimal import Decimal
+
+from src.app.domain.events.book_ticker_event import BookTickerEvent
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.generated import (
+    PublicAggreBookTickerV3Api_pb2,
+    PublicBookTickerBatchV3Api_pb2,
+    PublicBookTickerV3Api_pb2,
+)
+
+
+def book_ticker_proto_to_domain(
+    symbol: Symbol,
+    proto: PublicAggreBookTickerV3Api_pb2.PublicAggreBookTickerV3Api
+    | PublicBookTickerV3Api_pb2.PublicBookTickerV3Api,
+) -> BookTickerEvent:
+    return BookTickerEvent(
+        symbol=symbol,
+        bid_price=Decimal(proto.bidPrice or "0"),
+        bid_quantity=Decimal(proto.bidQuantity or "0"),
+        ask_price=Decimal(proto.askPrice or "0"),
+        ask_quantity=Decimal(proto.askQuantity or "0"),
+    )
+
+
+def book_ticker_fields_to_domain(symbol: Symbol, fields: dict[str, str]) -> BookTickerEvent:
+    """Map a ``bidPrice``/``bidQuantity``/``askPrice``/``askQuantity`` field selection."""
+    return BookTickerEvent(
+        symbol=symbol,
+        bid_price=Decimal(fields["bidPrice"] or "0"),
+        bid_quantity=Decimal(fields["bidQuantity"] or "0"),
+        ask_price=Decimal(fields["askPrice"] or "0"),
+        ask_quantity=Decimal(fields["askQuantity"] or "0"),
+    )
+
+
+def book_ticker_batch_proto_to_domain(
+    symbol: Symbol, proto: PublicBookTickerBatchV3Api_pb2.PublicBookTickerBatchV3Api
+) -> list[BookTickerEvent]:
+    return [book_ticker_proto_to_domain(symbol, item) for item in proto.items]
@@ -1,25 +1,64 @@
-from app.domain.events.market_depth_event import MarketDepthEvent
-from app.domain.value_objects.price import Price
-from app.domain.value_objects.quantity import Quantity
-from app.domain.value_objects.symbol import Symbol
-from app.infrastructure.exchange.mexc.generated import PublicAggreDepthsV3Api_pb2
+from decimal import Decimal
+
+from src.app.domain.events.market_depth_event import MarketDepthEvent
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.generated import (
+    PublicAggreDepthsV3Api_pb2,
+    PublicIncreaseDepthsBatchV3Api_pb2,
+    PublicIncreaseDepthsV3Api_pb2,
+)
 
 
 def depth_proto_to_domain(
     symbol: Symbol, proto: PublicAggreDepthsV3Api_pb2.PublicAggreDepthsV3Api
 ) -> MarketDepthEvent:
-    bids = [
-        (Price(float(item.price)), Quantity(float(item.quantity))) for item in proto.bids
-    ]
-    asks = [
-        (Price(float(item.price)), Quantity(float(item.quantity))) for item in proto.asks
-    ]
+    bids = [(Decimal(item.price), Decimal(item.quantity)) for item in proto.bids]
+    asks = [(Decimal(item.price), Decimal(item.quantity)) for item in proto.asks]
+
+    return MarketDepthEvent(
+        symbol=symbol,
+        bids=bids,
+        asks=asks,
+        event_type=proto.eventType or None,
+        from_version=proto.fromVersion or None,
+        to_version=proto.toVersion or None,
+    )
+
+
+def increase_depth_proto_to_domain(
+    symbol: Symbol, proto: PublicIncreaseDepthsV3Api_pb2.PublicIncreaseDepthsV3Api
+) -> MarketDepthEvent:
+    """Map one raw (unaggregated) depth update; it covers a single version."""
+    return MarketDepthEvent(
+        symbol=symbol,
+        bids=[(Decimal(item.price), Decimal(item.quantity)) for item in proto.bids],
+        asks=[(Decimal(item.price), Decimal(item.quantity)) for item in proto.asks],
+        event_type=proto.eventType or None,
+        from_version=proto.version or None,
+        to_version=proto.version or None,
+    )
+
+
+def depth_batch_proto_to_domain(
+    symbol: Symbol, proto: PublicIncreaseDepthsBatchV3Api_pb2.PublicIncreaseDepthsBatchV3Api
+) -> MarketDepthEvent | None:
+    """
+    Fold a batch of incremental depth pushes into one diff.
+
+    Items carry consecutive versions, so the levels are concatenated in order
+    (later updates of a price win when applied) and the diff spans from the
+    first item's version to the last one's.
+    """
+    if not proto.items:
+        return None
+    bids = [(Decimal(lv.price), Decimal(lv.quantity)) for item in proto.items for lv in item.bids]
+    asks = [(Decimal(lv.price), Decimal(lv.quantity)) for item in proto.items for lv in item.asks]
 
     return MarketDepthEvent(
         symbol=symbol,
         bids=bids,
         asks=asks,
-        event_type=proto.eventType if hasattr(proto, "eventType") else None,
-        from_version=proto.fromVersion if hasattr(proto, "fromVersion") else None,
-        to_version=proto.toVersion if hasattr(proto, "toVersion") else None,
+        event_type=proto.eventType or None,
+        from_version=proto.items[0].version or None,
+        to_version=proto.items[-1].version or None,
     )
@@ -0,0 +1,24 @@
+from decimal import Decimal
+
+from src.app.domain.events.fill_event import FillEvent
+from src.app.domain.value_objects.order_id import OrderId
+from src.app.domain.value_objects.side import Side
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.domain.value_objects.trade_id import TradeId
+from src.app.infrastructure.exchange.mexc.generated import PrivateDealsV3Api_pb2
+
+
+def fill_proto_to_domain(symbol: Symbol, proto: PrivateDealsV3Api_pb2.PrivateDealsV3Api) -> FillEvent:
+    # tradeType: 1 = buy, 2 = sell
+    return FillEvent(
+        trade_id=TradeId(proto.tradeId),
+        order_id=OrderId(proto.orderId),
+        symbol=symbol,
+        side=Side("BUY" if proto.tradeType == 1 else "SELL"),
+        price=Decimal(proto.price or "0"),
+        quantity=Decimal(proto.quantity or "0"),
+        fee=Decimal(proto.feeAmount) if proto.feeAmount else None,
+        fee_asset=proto.feeCurrency or None,
+        is_maker=proto.isMaker,
+        timestamp=proto.time,
+    )
@@ -1,49 +1,205 @@
+from functools import partial
 from typing import AsyncIterator
 
-from app.application.ports.exchange_gateway import ExchangeGateway
-from app.domain.events.balance_event import BalanceEvent
-from app.domain.events.market_depth_event import MarketDepthEvent
-from app.domain.events.order_event import OrderEvent
-from app.domain.events.trade_event import TradeEvent
-from app.domain.value_objects.symbol import Symbol
-from app.infrastructure.exchange.mexc.generated import (
+from src.app.application.ports.exchange_gateway import ExchangeGateway
+from src.app.domain.events.balance_event import BalanceEvent
+from src.app.domain.events.book_ticker_event import BookTickerEvent
+from src.app.domain.events.fill_event import FillEvent
+from src.app.domain.events.market_depth_event import MarketDepthEvent
+from src.app.domain.events.mini_ticker_event import MiniTickerEvent
+from src.app.domain.events.order_event import OrderEvent
+from src.app.domain.events.trade_event import TradeEvent
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.generated import (
     PrivateAccountV3Api_pb2,
+    PrivateDealsV3Api_pb2,
     PrivateOrdersV3Api_pb2,
+    PublicAggreDealsV3Api_pb2,
     PublicAggreDepthsV3Api_pb2,
+    PublicBookTickerBatchV3Api_pb2,
     PublicDealsV3Api_pb2,
+    PublicIncreaseDepthsBatchV3Api_pb2,
+    PublicIncreaseDepthsV3Api_pb2,
+    PublicMiniTickersV3Api_pb2,
 )
-from app.infrastructure.exchange.mexc.ws.mexc_ws_client import MexcWebSocketClient
+from src.app.infrastructure.exchange.mexc.ws.mexc_ws_client import (
+    DEFAULT_INTERVAL,
+    FrameMapper,
+    MexcWebSocketClient,
+)
+from src.app.infrastructure.exchange.mexc.ws.push_frame import PushFrame
 from .balance_mapper import balance_proto_to_domain
+from .book_ticker_mapper import book_ticker_batch_proto_to_domain, book_ticker_fields_to_domain
+from .fill_mapper import fill_proto_to_domain
 from .order_mapper import order_proto_to_domain
 from .trade_mapper import trade_proto_to_domain
-from .depth_mapper import depth_proto_to_domain
+from .depth_mapper import (
+    depth_batch_proto_to_domain,
+    depth_proto_to_domain,
+    increase_depth_proto_to_domain,
+)
+from .mini_ticker_mapper import mini_tickers_proto_to_domain
+
+_DEALS_TYPES = (PublicDealsV3Api_pb2.PublicDealsV3Api, PublicAggreDealsV3Api_pb2.PublicAggreDealsV3Api)
+_BOOK_TICKER_FIELDS = ("bidPrice", "bidQuantity", "askPrice", "askQuantity")
+# Account streams are legitimately quiet until something happens on the account.
+_PRIVATE_CHANNELS = frozenset({"orders", "private_deals", "balances"})
 
 
 class MexcExchangeGateway(ExchangeGateway):
-    """Infrastructure adapter that translates MEXC WS protobuf into domain events."""
+    """
+    Infrastructure adapter that translates MEXC WS protobuf into domain events.
+
+    Mapping runs inside the WebSocket client's dispatch (on its decode thread
+    when that is enabled); one mapper per stream is shared by all subscribers.
+    Market data streams silent for ``stale_after`` seconds are resubscribed.
+    """
 
-    def __init__(self, ws_client: MexcWebSocketClient):
+    def __init__(self, ws_client: MexcWebSocketClient, *, stale_after: float | None = None):
         self._ws = ws_client
+        self._stale_after = stale_after
+        self._mappers: dict[tuple, FrameMapper] = {}
 
     async def subscribe_market_depth(
-        self, symbol: Symbol
+        self, symbol: Symbol, interval: str = DEFAULT_INTERVAL
     ) -> AsyncIterator[MarketDepthEvent]:
-        async for proto in self._ws.subscribe("depth", symbol.value):
-            if isinstance(proto, PublicAggreDepthsV3Api_pb2.PublicAggreDepthsV3Api):
-                yield depth_proto_to_domain(symbol, proto)
+        async for event in self._subscribe("depth", symbol, _map_depth, interval=interval):
+            yield event
+
+    async def subscribe_trades(
+        self, symbol: Symbol, interval: str = DEFAULT_INTERVAL
+    ) -> AsyncIterator[TradeEvent]:
+        async for event in self._subscribe("deals", symbol, _map_trades, interval=interval):
+            yield event
+
+    async def subscribe_book_ticker(
+        self, symbol: Symbol, interval: str = DEFAULT_INTERVAL
+    ) -> AsyncIterator[BookTickerEvent]:
+        async for event in self._subscribe(
+            "book_ticker", symbol, _map_book_ticker, interval=interval, fields=_BOOK_TICKER_FIELDS
+        ):
+            yield event
+
+    async def subscribe_depth_batches(self, symbol: Symbol) -> AsyncIterator[MarketDepthEvent]:
+        """Yield one diff per ``increase.depth.batch`` frame, spanning all its versions."""
+        async for event in self._subscribe("depth_batch", symbol, _map_depth_batch):
+            yield event
 
-    async def subscribe_trades(self, symbol: Symbol) -> AsyncIterator[TradeEvent]:
-        async for proto in self._ws.subscribe("deals", symbol.value):
-            if isinstance(proto, PublicDealsV3Api_pb2.PublicDealsV3Api):
-                for item in proto.deals:
-                    yield trade_proto_to_domain(symbol, item)
+    async def subscribe_book_ticker_batches(
+        self, symbol: Symbol
+    ) -> AsyncIterator[list[BookTickerEvent]]:
+        async for events in self._subscribe("book_ticker_batch", symbol, _map_book_ticker_batch):
+            yield events
+
+    async def subscribe_mini_tickers(
+        self, timezone: str = "UTC+8"
+    ) -> AsyncIterator[list[MiniTickerEvent]]:
+        """Yield every market's rolling summary, one list per push."""
+        async for events in self._subscribe("mini_tickers", timezone, _map_mini_tickers):
+            yield events
 
     async def subscribe_orders(self) -> AsyncIterator[OrderEvent]:
-        async for proto in self._ws.subscribe("orders"):
-            if isinstance(proto, PrivateOrdersV3Api_pb2.PrivateOrdersV3Api):
-                yield order_proto_to_domain(proto)
+        async for event in self._subscribe("orders", None, _map_order, envelope=True):
+            yield event
+
+    async def subscribe_fills(self) -> AsyncIterator[FillEvent]:
+        async for event in self._subscribe("private_deals", None, _map_fill, envelope=True):
+            yield event
 
     async def subscribe_balances(self) -> AsyncIterator[BalanceEvent]:
-        async for proto in self._ws.subscribe("balances"):
-            if isinstance(proto, PrivateAccountV3Api_pb2.PrivateAccountV3Api):
-                yield balance_proto_to_domain(proto)
+        async for event in self._subscribe("balances", None, _map_balance):
+            yield event
+
+    def _subscribe(
+        self,
+        channel: str,
+        symbol: Symbol | str | None,
+        map_proto,
+        *,
+        interval: str = DEFAULT_INTERVAL,
+        fields: tuple[str, ...] | None = None,
+        envelope: bool = False,
+    ) -> AsyncIterator:
+        param = symbol.value if isinstance(symbol, Symbol) else symbol
+        key = (channel, param)
+        mapper = self._mappers.get(key)
+        if mapper is None:
+            mapper = self._mappers[key] = partial(map_proto, symbol)
+        return self._ws.subscribe(
+            channel,
+            param,
+            interval=interval,
+            stale_after=None if channel in _PRIVATE_CHANNELS else self._stale_after,
+            mapper=mapper,
+            fields=fields,
+            envelope=envelope,
+        )
+
+
+def _map_depth(symbol: Symbol, proto: object) -> list[MarketDepthEvent]:
+    if isinstance(proto, PublicAggreDepthsV3Api_pb2.PublicAggreDepthsV3Api):
+        return [depth_proto_to_domain(symbol, proto)]
+    if isinstance(proto, PublicIncreaseDepthsV3Api_pb2.PublicIncreaseDepthsV3Api):
+        return [increase_depth_proto_to_domain(symbol, proto)]
+    return []
+
+
+def _map_trades(symbol: Symbol, proto: object) -> list[TradeEvent]:
+    if isinstance(proto, _DEALS_TYPES):
+        return [trade_proto_to_domain(symbol, item) for item in proto.deals]
+    return []
+
+
+def _map_book_ticker(symbol: Symbol, fields: dict[str, str]) -> list[BookTickerEvent]:
+    if len(fields) < len(_BOOK_TICKER_FIELDS):
+        return []
+    return [book_ticker_fields_to_domain(symbol, fields)]
+
+
+def _map_depth_batch(symbol: Symbol, proto: object) -> list[MarketDepthEvent]:
+    if isinstance(proto, PublicIncreaseDepthsBatchV3Api_pb2.PublicIncreaseDepthsBatchV3Api):
+        event = depth_batch_proto_to_domain(symbol, proto)
+        return [event] if event is not None else []
+    return []
+
+
+def _map_book_ticker_batch(symbol: Symbol, proto: object) -> list[list[BookTickerEvent]]:
+    if isinstance(proto, PublicBookTickerBatchV3Api_pb2.PublicBookTickerBatchV3Api):
+        return [book_ticker_batch_proto_to_domain(symbol, proto)]
+    return []
+
+
+def _map_mini_tickers(_: str, proto: object) -> list[list[MiniTickerEvent]]:
+    if isinstance(proto, PublicMiniTickersV3Api_pb2.PublicMiniTickersV3Api):
+        return [mini_tickers_proto_to_domain(proto)]
+    return []
+
+
+def _push_symbol(frame: PushFrame) -> Symbol | None:
+    # Private streams cover the whole account; the pair is on the wrapper.
+    try:
+        return Symbol(frame.symbol or "")
+    except ValueError:
+        return None  # a pair outside this app's scope
+
+
+def _map_order(_: None, frame: PushFrame) -> list[OrderEvent]:
+    proto = frame.body()
+    if not isinstance(proto, PrivateOrdersV3Api_pb2.PrivateOrdersV3Api):
+        return []
+    symbol = _push_symbol(frame)
+    return [order_proto_to_domain(symbol, proto)] if symbol is not None else []
+
+
+def _map_fill(_: None, frame: PushFrame) -> list[FillEvent]:
+    proto = frame.body()
+    if not isinstance(proto, PrivateDealsV3Api_pb2.PrivateDealsV3Api):
+        return []
+    symbol = _push_symbol(frame)
+    return [fill_proto_to_domain(symbol, proto)] if symbol is not None else []
+
+
+def _map_balance(_: None, proto: object) -> list[BalanceEvent]:
+    if isinstance(proto, PrivateAccountV3Api_pb2.PrivateAccountV3Api):
+        return [balance_proto_to_domain(proto)]
+    return []
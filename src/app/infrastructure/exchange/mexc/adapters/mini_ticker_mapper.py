@@ -0,0 +1,27 @@
+from decimal import Decimal
+
+from src.app.domain.events.mini_ticker_event import MiniTickerEvent
+from src.app.infrastructure.exchange.mexc.generated import (
+    PublicMiniTickersV3Api_pb2,
+    PublicMiniTickerV3Api_pb2,
+)
+
+
+def mini_ticker_proto_to_domain(
+    proto: PublicMiniTickerV3Api_pb2.PublicMiniTickerV3Api,
+) -> MiniTickerEvent:
+    return MiniTickerEvent(
+        symbol=proto.symbol,
+        price=Decimal(proto.price or "0"),
+        rate=Decimal(proto.zonedRate or proto.rate or "0"),
+        high=Decimal(proto.high or "0"),
+        low=Decimal(proto.low or "0"),
+        volume=Decimal(proto.volume or "0"),
+        quantity=Decimal(proto.quantity or "0"),
+    )
+
+
+def mini_tickers_proto_to_domain(
+    proto: PublicMiniTickersV3Api_pb2.PublicMiniTickersV3Api,
+) -> list[MiniTickerEvent]:
+    return [mini_ticker_proto_to_domain(item) for item in proto.items]
@@ -1,30 +1,38 @@
-from app.domain.events.order_event import OrderEvent
-from app.domain.value_objects.order_id import OrderId
-from app.domain.value_objects.order_status import OrderStatus
-from app.domain.value_objects.price import Price
-from app.domain.value_objects.quantity import Quantity
-from app.domain.value_objects.symbol import Symbol
-from app.infrastructure.exchange.mexc.generated import PrivateOrdersV3Api_pb2
+from decimal import Decimal
 
+from src.app.domain.events.order_event import OrderEvent
+from src.app.domain.value_objects.order_id import OrderId
+from src.app.domain.value_objects.order_status import OrderStatus
+from src.app.domain.value_objects.price import Price
+from src.app.domain.value_objects.quantity import Quantity
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.generated import PrivateOrdersV3Api_pb2
 
-def order_proto_to_domain(proto: PrivateOrdersV3Api_pb2.PrivateOrdersV3Api) -> OrderEvent:
-    # MEXC push includes status as int; default to NEW when unmapped
-    status_value = "NEW"
-    try:
-        status_value = str(proto.status).upper()
-    except Exception:
-        status_value = "NEW"
+# MEXC push status codes; 5 (partially canceled) is terminal like CANCELED
+_STATUS_CODES = {
+    1: "NEW",
+    2: "FILLED",
+    3: "PARTIALLY_FILLED",
+    4: "CANCELED",
+    5: "CANCELED",
+}
 
-    try:
-        status = OrderStatus(status_value)
-    except ValueError:
-        status = OrderStatus("NEW")
+
+def order_proto_to_domain(
+    symbol: Symbol, proto: PrivateOrdersV3Api_pb2.PrivateOrdersV3Api
+) -> OrderEvent:
+    # default to NEW when the status code is unmapped
+    status = OrderStatus(_STATUS_CODES.get(proto.status, "NEW"))
+    price = Decimal(proto.price or "0")
+    quantity = Decimal(proto.quantity or "0")
 
     return OrderEvent(
         order_id=OrderId(proto.id),
-        symbol=Symbol("QRLUSDT"),
-        price=Price(float(proto.price)),
-        quantity=Quantity(float(proto.quantity)),
+        symbol=symbol,
+        price=Price.from_single(price) if price > 0 else None,
+        quantity=Quantity(quantity) if quantity > 0 else None,
         status=status,
         timestamp=proto.createTime,
+        executed_quantity=Decimal(proto.cumulativeQuantity) if proto.cumulativeQuantity else None,
+        cumulative_quote_quantity=Decimal(proto.cumulativeAmount) if proto.cumulativeAmount else None,
     )
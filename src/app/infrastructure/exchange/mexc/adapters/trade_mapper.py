@@ -1,21 +1,28 @@
-from app.domain.events.trade_event import TradeEvent
-from app.domain.value_objects.price import Price
-from app.domain.value_objects.quantity import Quantity
-from app.domain.value_objects.symbol import Symbol
-from app.domain.value_objects.trade_id import TradeId
-from app.infrastructure.exchange.mexc.generated import PublicDealsV3Api_pb2
+from decimal import Decimal
+
+from src.app.domain.events.trade_event import TradeEvent
+from src.app.domain.value_objects.price import Price
+from src.app.domain.value_objects.quantity import Quantity
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.domain.value_objects.trade_id import TradeId
+from src.app.infrastructure.exchange.mexc.generated import (
+    PublicAggreDealsV3Api_pb2,
+    PublicDealsV3Api_pb2,
+)
 
 
 def trade_proto_to_domain(
-    symbol: Symbol, proto: PublicDealsV3Api_pb2.PublicDealsV3ApiItem
+    symbol: Symbol,
+    proto: PublicDealsV3Api_pb2.PublicDealsV3ApiItem
+    | PublicAggreDealsV3Api_pb2.PublicAggreDealsV3ApiItem,
 ) -> TradeEvent:
     # tradeType: 1=buy, 2=sell in MEXC WS push; treat 2 as maker sell
     is_buyer_maker = proto.tradeType == 2
     return TradeEvent(
         trade_id=TradeId(str(proto.time)),
         symbol=symbol,
-        price=Price(float(proto.price)),
-        quantity=Quantity(float(proto.quantity)),
+        price=Price.from_single(Decimal(proto.price)),
+        quantity=Quantity(Decimal(proto.quantity)),
         is_buyer_maker=is_buyer_maker,
         timestamp=proto.time,
     )
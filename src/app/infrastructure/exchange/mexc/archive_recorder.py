@@ -0,0 +1,152 @@
+"""Feed the on-disk time-series archive from the live MEXC streams."""
+
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Callable
+
+from src.app.application.ports.exchange_gateway import ExchangeGateway
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.local_order_book import LocalOrderBook
+from src.app.infrastructure.exchange.mexc.mappers import klines_from_api
+from src.app.infrastructure.exchange.mexc.rest_client import MexcRestClient
+from src.app.infrastructure.storage.time_series_archive import (
+    TimeSeriesArchive,
+    depth_row,
+    kline_row,
+    trade_row,
+)
+
+logger = logging.getLogger(__name__)
+
+_MINUTE_MS = 60_000
+
+
+class ArchiveRecorder:
+    """
+    Record public trades, closed 1m candles and top-of-book snapshots of one symbol.
+
+    Trades come from the deals stream, candles from REST every
+    ``kline_poll_interval`` seconds starting after the newest archived one (so
+    a restart fills the gap, a page per poll), and depth snapshots from the
+    local order book every ``snapshot_interval`` seconds while it is synced.
+    Everything goes through the archive's write-behind buffer; each candle
+    poll flushes it, and the candle cursor only moves once that succeeded.
+    """
+
+    def __init__(
+        self,
+        symbol: Symbol,
+        archive: TimeSeriesArchive,
+        gateway: ExchangeGateway,
+        rest_client: MexcRestClient,
+        *,
+        book: LocalOrderBook | None = None,
+        depth_levels: int = 20,
+        snapshot_interval: float = 1.0,
+        kline_poll_interval: float = 30.0,
+        retry_delay: float = 1.0,
+        clock_ms: Callable[[], int] = lambda: int(time.time() * 1000),
+    ):
+        self._symbol = symbol
+        self._archive = archive
+        self._gateway = gateway
+        self._rest_client = rest_client
+        self._book = book
+        self._depth_levels = depth_levels
+        self._depth_series = f"depth_{depth_levels}"
+        self._snapshot_interval = snapshot_interval
+        self._kline_poll_interval = kline_poll_interval
+        self._retry_delay = retry_delay
+        self._clock_ms = clock_ms
+        self._last_kline: int | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def _key(self) -> str:
+        return self._symbol.value.replace("/", "").upper()
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._follow_trades()),
+                asyncio.create_task(self._poll_klines()),
+            ]
+            if self._book is not None:
+                self._tasks.append(asyncio.create_task(self._snapshot_depth()))
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def record_klines(self) -> int:
+        """Archive the 1m candles closed since the newest archived one; return how many."""
+        if self._last_kline is None:
+            self._last_kline = await asyncio.to_thread(
+                self._archive.last_time, "klines_1m", self._key
+            )
+        now = self._clock_ms()
+        start = self._last_kline + _MINUTE_MS if self._last_kline is not None else None
+        rows = await self._rest_client.klines(
+            symbol=self._key, interval="1m", limit=1000, start_time=start
+        )
+        last, recorded = self._last_kline, 0
+        for kline in klines_from_api(rows, "1m"):
+            row = kline_row(kline)
+            open_time = row[0]
+            if open_time + _MINUTE_MS > now:
+                break  # still open
+            if last is not None and open_time <= last:
+                continue
+            if not self._archive.append("klines_1m", self._key, row):
+                break  # buffer full; the next poll picks up from here
+            last = open_time
+            recorded += 1
+        if recorded:
+            try:
+                await self._archive.flush()
+            except BaseException:
+                # Some rows may have reached the disk; resume from what did.
+                self._last_kline = None
+                raise
+            self._last_kline = last
+        return recorded
+
+    def snapshot_depth(self) -> bool:
+        if self._book is None or not self._book.synced:
+            return False
+        book = self._book.order_book(self._depth_levels)
+        row = depth_row(self._clock_ms(), book, self._depth_levels)
+        return self._archive.append(self._depth_series, self._key, row)
+
+    async def _follow_trades(self) -> None:
+        while True:
+            try:
+                async for event in self._gateway.subscribe_trades(self._symbol):
+                    if event.symbol == self._symbol:
+                        self._archive.append("trades", self._key, trade_row(event))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Deals stream failed; archive retrying", exc_info=True)
+            await asyncio.sleep(self._retry_delay)
+
+    async def _poll_klines(self) -> None:
+        while True:
+            try:
+                await self.record_klines()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Archiving klines failed", exc_info=True)
+            await asyncio.sleep(self._kline_poll_interval)
+
+    async def _snapshot_depth(self) -> None:
+        while True:
+            self.snapshot_depth()
+            await asyncio.sleep(self._snapshot_interval)
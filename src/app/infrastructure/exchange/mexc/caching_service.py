@@ -0,0 +1,168 @@
+"""Read-through market-data cache layered over an ExchangeService adapter."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from src.app.application.ports.exchange_service import ExchangeService, ExchangeServiceFactory
+from src.app.domain.value_objects.order_book import OrderBook
+from src.app.domain.value_objects.price import Price
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.forwarding_service import ForwardingExchangeService
+from src.app.infrastructure.exchange.mexc.settings import MexcSettings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Freshness window and how long a stale value may be served while refreshing."""
+
+    ttl: float
+    stale_ttl: float = 0.0
+
+
+def cache_policies_from_settings(settings: MexcSettings) -> dict[str, CachePolicy]:
+    stale = settings.cache_stale_ttl
+    return {
+        "get_price": CachePolicy(settings.cache_price_ttl, stale),
+        "get_ticker_24h": CachePolicy(settings.cache_price_ttl, stale),
+        "get_depth": CachePolicy(settings.cache_depth_ttl, stale),
+        "get_kline": CachePolicy(settings.cache_kline_ttl, stale),
+        "get_market_trades": CachePolicy(settings.cache_trades_ttl, stale),
+    }
+
+
+class MarketDataCache:
+    """
+    Process-wide, size-bounded LRU store for market-data reads.
+
+    Fresh entries are served directly. Entries past their TTL but inside the
+    stale window are served immediately while one background refresh per key
+    revalidates them, so upstream traffic depends on TTLs, not on reader count.
+    """
+
+    def __init__(self, max_entries: int = 256, clock: Callable[[], float] = time.monotonic):
+        if max_entries <= 0:
+            raise ValueError("Cache size must be positive")
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._refreshing: dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        policy: CachePolicy,
+        load: Callable[[], Awaitable[T]],
+        refresh: Callable[[], Awaitable[T]] | None = None,
+    ) -> T:
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            age = self._clock() - stored_at
+            if age < policy.ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return value
+            if age < policy.ttl + policy.stale_ttl:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._revalidate(key, refresh or load)
+                return value
+
+        self.misses += 1
+        value = await load()
+        self._store(key, value)
+        return value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (self._clock(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _revalidate(self, key: Hashable, refresh: Callable[[], Awaitable[Any]]) -> None:
+        if key in self._refreshing:
+            return
+
+        async def run() -> None:
+            try:
+                self._store(key, await refresh())
+            except Exception:
+                logger.warning("Background refresh failed for %s; serving stale value", key)
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.ensure_future(run())
+
+    async def aclose(self) -> None:
+        """Cancel pending background refreshes."""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refreshing.clear()
+
+
+class CachingExchangeService(ForwardingExchangeService):
+    """
+    ExchangeService decorator answering market-data reads from a shared cache.
+
+    Private and trading calls pass straight through. Background refreshes run
+    on ``refresh_factory`` because they outlive the request that triggered them.
+    """
+
+    def __init__(
+        self,
+        inner: ExchangeService,
+        cache: MarketDataCache,
+        policies: dict[str, CachePolicy],
+        refresh_factory: ExchangeServiceFactory,
+    ):
+        super().__init__(inner)
+        self._cache = cache
+        self._policies = policies
+        self._refresh_factory = refresh_factory
+
+    async def _cached(self, name: str, *args: Any) -> Any:
+        policy = self._policies.get(name)
+        if policy is None or policy.ttl <= 0:
+            return await getattr(self._inner, name)(*args)
+        key = (name, *(arg.value if isinstance(arg, Symbol) else arg for arg in args))
+        return await self._cache.get_or_load(
+            key,
+            policy,
+            load=lambda: getattr(self._inner, name)(*args),
+            refresh=lambda: self._refresh(name, *args),
+        )
+
+    async def _refresh(self, name: str, *args: Any) -> Any:
+        async with self._refresh_factory() as exchange:
+            return await getattr(exchange, name)(*args)
+
+    async def get_price(self, symbol: Symbol) -> Price:
+        return await self._cached("get_price", symbol)
+
+    async def get_kline(self, symbol: Symbol, interval: str, limit: int = 100):
+        return await self._cached("get_kline", symbol, interval, limit)
+
+    async def get_depth(self, symbol: Symbol, limit: int = 50) -> OrderBook:
+        return await self._cached("get_depth", symbol, limit)
+
+    async def get_ticker_24h(self, symbol: Symbol) -> dict:
+        return await self._cached("get_ticker_24h", symbol)
+
+    async def get_market_trades(self, symbol: Symbol, limit: int = 50) -> list[dict]:
+        return await self._cached("get_market_trades", symbol, limit)
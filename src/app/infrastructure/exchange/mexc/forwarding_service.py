@@ -0,0 +1,76 @@
+"""Base class for ExchangeService decorators that override a few methods."""
+
+from src.app.application.ports.exchange_service import (
+    CancelOrderRequest,
+    ExchangeService,
+    GetOrderRequest,
+    PlaceOrderRequest,
+)
+from src.app.domain.value_objects.history_cursor import HistoryCursor
+from src.app.domain.value_objects.order_book import OrderBook
+from src.app.domain.value_objects.price import Price
+from src.app.domain.value_objects.symbol import Symbol
+
+
+class ForwardingExchangeService(ExchangeService):
+    """Delegate every ExchangeService call, and the session context, to ``inner``."""
+
+    def __init__(self, inner: ExchangeService):
+        self._inner = inner
+
+    async def __aenter__(self):
+        await self._inner.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._inner.__aexit__(exc_type, exc, tb)
+
+    @property
+    def settings(self):
+        return self._inner.settings
+
+    async def get_server_time(self):
+        return await self._inner.get_server_time()
+
+    async def get_account(self):
+        return await self._inner.get_account()
+
+    async def place_order(self, request: PlaceOrderRequest):
+        return await self._inner.place_order(request)
+
+    async def cancel_order(self, request: CancelOrderRequest):
+        return await self._inner.cancel_order(request)
+
+    async def get_order(self, request: GetOrderRequest):
+        return await self._inner.get_order(request)
+
+    async def list_open_orders(self, symbol: Symbol | None = None):
+        return await self._inner.list_open_orders(symbol)
+
+    async def list_trades(self, symbol: Symbol):
+        return await self._inner.list_trades(symbol)
+
+    def trade_history(
+        self, symbol: Symbol, start: int | HistoryCursor, end_time: int | None = None
+    ):
+        return self._inner.trade_history(symbol, start, end_time)
+
+    def order_history(
+        self, symbol: Symbol, start: int | HistoryCursor, end_time: int | None = None
+    ):
+        return self._inner.order_history(symbol, start, end_time)
+
+    async def get_price(self, symbol: Symbol) -> Price:
+        return await self._inner.get_price(symbol)
+
+    async def get_kline(self, symbol: Symbol, interval: str, limit: int = 100):
+        return await self._inner.get_kline(symbol, interval, limit)
+
+    async def get_depth(self, symbol: Symbol, limit: int = 50) -> OrderBook:
+        return await self._inner.get_depth(symbol, limit)
+
+    async def get_ticker_24h(self, symbol: Symbol) -> dict:
+        return await self._inner.get_ticker_24h(symbol)
+
+    async def get_market_trades(self, symbol: Symbol, limit: int = 50) -> list[dict]:
+        return await self._inner.get_market_trades(symbol, limit)
@@ -1 +1,10 @@
 """Generated protobuf modules for MEXC WebSocket V3 APIs."""
+
+import sys
+from pathlib import Path
+
+# protoc emits sibling imports (``import PublicDealsV3Api_pb2``) for the wrapper
+# message, so the generated directory itself must be importable.
+_GENERATED_DIR = str(Path(__file__).parent)
+if _GENERATED_DIR not in sys.path:
+    sys.path.append(_GENERATED_DIR)
@@ -0,0 +1,102 @@
+"""Historical klines over arbitrary time ranges, fetched as concurrent windows."""
+
+import asyncio
+from collections import deque
+from datetime import datetime, timezone
+from decimal import Decimal
+from itertools import islice
+from typing import AsyncIterator
+
+from src.app.domain.value_objects.kline import KLine
+from src.app.domain.value_objects.kline_interval import interval_ms
+from src.app.infrastructure.exchange.mexc.mappers import klines_from_api
+from src.app.infrastructure.exchange.mexc.rest_client import MexcRestClient
+
+# Largest page /api/v3/klines returns.
+MAX_PAGE_SIZE = 1000
+
+
+def _open_time(kline: KLine) -> int:
+    return int(kline.timestamp.value.timestamp() * 1000)
+
+
+def _flat(previous: KLine, open_time: int) -> KLine:
+    close = previous.close
+    return KLine.from_raw(close, close, close, close, Decimal("0"), previous.interval, open_time)
+
+
+async def backfill_klines(
+    rest_client: MexcRestClient,
+    symbol: str,
+    interval: str,
+    start_time: int | datetime,
+    end_time: int | datetime | None = None,
+    *,
+    page_size: int = MAX_PAGE_SIZE,
+    concurrency: int = 4,
+    fill_gaps: bool = True,
+) -> AsyncIterator[KLine]:
+    """
+    Yield every ``interval`` candle opening in ``[start_time, end_time]``, oldest first.
+
+    The range is split into ``page_size``-candle ``startTime``/``endTime``
+    windows of which up to ``concurrency`` are in flight at once; requests go
+    through the client's rate limiter like any other read. Windows are yielded
+    in order as they complete, so memory is bounded by the windows in flight
+    however long the range is. Candles repeated across windows are dropped and,
+    with ``fill_gaps``, missing candles between two known ones are yielded flat
+    at the previous close with zero volume.
+
+    Args:
+        start_time, end_time: Open-time bounds, in epoch milliseconds or as
+            aware datetimes; ``end_time`` defaults to now.
+    """
+    if not 0 < page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+    step = interval_ms(interval)
+    start = _to_ms(start_time)
+    end = _to_ms(end_time if end_time is not None else datetime.now(timezone.utc))
+    window = page_size * step
+    first = -(-start // step) * step  # first open time at or after start
+    windows = iter(range(first, end + 1, window))
+    pending: deque[asyncio.Task] = deque()
+
+    def schedule() -> None:
+        for window_start in islice(windows, concurrency - len(pending)):
+            fetch = rest_client.klines(
+                symbol=symbol,
+                interval=interval,
+                limit=page_size,
+                start_time=window_start,
+                end_time=min(window_start + window - 1, end),
+            )
+            pending.append(asyncio.ensure_future(fetch))
+
+    previous: KLine | None = None
+    last = first - step
+    try:
+        schedule()
+        while pending:
+            rows = await pending.popleft()
+            schedule()
+            for kline in klines_from_api(rows, interval):
+                open_time = _open_time(kline)
+                if open_time <= last or open_time > end:
+                    continue
+                if fill_gaps and previous is not None:
+                    for gap_time in range(last + step, open_time, step):
+                        yield _flat(previous, gap_time)
+                yield kline
+                previous, last = kline, open_time
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _to_ms(value: int | datetime) -> int:
+    if isinstance(value, datetime):
+        return int(value.timestamp() * 1000)
+    return int(value)
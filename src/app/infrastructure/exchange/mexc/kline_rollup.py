@@ -0,0 +1,319 @@
+"""Live candles for every interval, built from the public deals stream."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import suppress
+from decimal import Decimal
+from typing import Callable
+
+from src.app.application.ports.exchange_gateway import ExchangeGateway
+from src.app.application.ports.exchange_service import ExchangeService
+from src.app.domain.events.trade_event import TradeEvent
+from src.app.domain.value_objects.kline import KLine
+from src.app.domain.value_objects.kline_interval import interval_ms
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.forwarding_service import ForwardingExchangeService
+from src.app.infrastructure.exchange.mexc.mappers import klines_from_api
+from src.app.infrastructure.exchange.mexc.rest_client import MexcRestClient
+
+logger = logging.getLogger(__name__)
+
+# Intervals kept as their own series; anything else is resampled from them.
+NATIVE_INTERVALS = ("1m", "5m", "15m", "30m", "1h", "4h", "1d")
+
+
+class _Series:
+    """
+    Contiguous candles of one interval, oldest first, as mutable
+    ``[open_time, open, high, low, close, volume]`` rows.
+    """
+
+    __slots__ = ("interval", "ms", "rows")
+
+    def __init__(self, interval: str, capacity: int):
+        self.interval = interval
+        self.ms = interval_ms(interval)
+        self.rows: deque[list] = deque(maxlen=capacity)
+
+    def replace(self, klines: list[KLine]) -> None:
+        self.rows.clear()
+        for kline in klines:
+            self.rows.append(
+                [
+                    int(kline.timestamp.value.timestamp() * 1000),
+                    kline.open,
+                    kline.high,
+                    kline.low,
+                    kline.close,
+                    kline.volume,
+                ]
+            )
+
+    def add_trade(self, timestamp: int, price: Decimal, quantity: Decimal) -> None:
+        open_time = timestamp - timestamp % self.ms
+        rows = self.rows
+        if rows and open_time <= rows[-1][0]:
+            back = (rows[-1][0] - open_time) // self.ms
+            if back >= len(rows) or rows[-1 - back][0] != open_time:
+                return  # older than the history kept
+            row = rows[-1 - back]
+            row[2] = max(row[2], price)
+            row[3] = min(row[3], price)
+            if back == 0:
+                row[4] = price
+            row[5] += quantity
+            return
+        if rows:
+            # Quiet periods still get candles, flat at the previous close.
+            close = rows[-1][4]
+            for flat_time in range(rows[-1][0] + self.ms, open_time, self.ms):
+                rows.append([flat_time, close, close, close, close, Decimal("0")])
+        rows.append([open_time, price, price, price, price, quantity])
+
+    def settle(self, kline: KLine) -> bool:
+        """Overwrite a kept candle with its final REST values; False if it is not kept."""
+        open_time = int(kline.timestamp.value.timestamp() * 1000)
+        rows = self.rows
+        if not rows or open_time > rows[-1][0]:
+            return False
+        back = (rows[-1][0] - open_time) // self.ms
+        if back >= len(rows) or rows[-1 - back][0] != open_time:
+            return False
+        rows[-1 - back][1:] = [kline.open, kline.high, kline.low, kline.close, kline.volume]
+        return True
+
+    def tail(self, limit: int) -> list[list]:
+        start = max(len(self.rows) - limit, 0)
+        return [self.rows[i] for i in range(start, len(self.rows))]
+
+
+def _kline(row: list, interval: str) -> KLine:
+    return KLine.from_raw(row[1], row[2], row[3], row[4], row[5], interval, row[0])
+
+
+def _resample(rows: list[list], ms: int) -> list[list]:
+    """Fold contiguous candles into ``ms`` buckets, dropping a partial first bucket."""
+    buckets: list[list] = []
+    for open_time, open_, high, low, close, volume in rows:
+        bucket = open_time - open_time % ms
+        if buckets and buckets[-1][0] == bucket:
+            last = buckets[-1]
+            last[2], last[3] = max(last[2], high), min(last[3], low)
+            last[4], last[5] = close, last[5] + volume
+        elif buckets or open_time == bucket:
+            buckets.append([bucket, open_, high, low, close, volume])
+    return buckets
+
+
+class KlineRollup:
+    """
+    Candles for every interval kept current from public trade ticks.
+
+    Each native interval is seeded from REST klines and then advanced by every
+    trade, so all of them update in real time from one deals subscription.
+    Other intervals (``3m``, ``2h``, ``12h``...) are resampled from the largest
+    native interval that divides them. The REST seed is repeated after the
+    stream reconnects; trades seen while it is in flight are replayed only
+    into candles newer than the ones REST returned. REST may not have counted
+    such a trade in the candle that was still open, so that candle is fetched
+    again once it closes (``settle_delay`` seconds later) and replaced.
+    """
+
+    def __init__(
+        self,
+        symbol: Symbol,
+        gateway: ExchangeGateway,
+        rest_client: MexcRestClient,
+        *,
+        capacity: int = 500,
+        retry_delay: float = 1.0,
+        settle_delay: float = 2.0,
+        clock_ms: Callable[[], int] = lambda: int(time.time() * 1000),
+    ):
+        self._symbol = symbol
+        self._gateway = gateway
+        self._rest_client = rest_client
+        self._capacity = capacity
+        self._retry_delay = retry_delay
+        self._settle_delay_ms = int(settle_delay * 1000)
+        self._clock_ms = clock_ms
+        self._series = {name: _Series(name, capacity) for name in NATIVE_INTERVALS}
+        self._ready = False
+        self._replay: list[TradeEvent] | None = None
+        # Open time of the candle per interval that may be missing replayed trades.
+        self._unsettled: dict[str, int] = {}
+        self._reconcile_requested = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self.trades = 0
+        self.reconciliations = 0
+
+    @property
+    def symbol(self) -> Symbol:
+        return self._symbol
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def request_reconcile(self) -> None:
+        self._reconcile_requested.set()
+
+    def klines(self, interval: str, limit: int) -> list[KLine] | None:
+        """Newest ``limit`` candles of ``interval``, or None if they cannot be served."""
+        if not self._ready or limit <= 0:
+            return None
+        series = self._series.get(interval)
+        if series is not None:
+            if limit > len(series.rows):
+                return None
+            return [_kline(row, interval) for row in series.tail(limit)]
+        try:
+            target = interval_ms(interval)
+        except ValueError:
+            return None
+        sources = [s for s in self._series.values() if target % s.ms == 0]
+        if not sources:
+            return None
+        source = max(sources, key=lambda s: s.ms)
+        factor = target // source.ms
+        buckets = _resample(source.tail((limit + 1) * factor), target)
+        if len(buckets) < limit:
+            return None
+        return [_kline(row, interval) for row in buckets[-limit:]]
+
+    async def refresh(self) -> None:
+        """Re-seed every native interval from REST, then replay trades seen meanwhile."""
+        self._replay = []
+        try:
+            pages = await asyncio.gather(
+                *(
+                    self._rest_client.klines(
+                        symbol=self._symbol.value, interval=name, limit=self._capacity
+                    )
+                    for name in self._series
+                )
+            )
+        except BaseException:
+            self._replay = None
+            raise
+        replay, self._replay = self._replay, None
+        for series, rows in zip(self._series.values(), pages):
+            series.replace(klines_from_api(rows, series.interval))
+        # REST may or may not have counted a buffered trade in the candles it
+        # returned, the still-open one included, so those are left as served
+        # rather than risk counting a trade twice; see settle().
+        self._unsettled = {}
+        covered = {
+            series.interval: series.rows[-1][0] if series.rows else None
+            for series in self._series.values()
+        }
+        for event in replay:
+            self._apply(event, covered)
+        self._ready = True
+        self.reconciliations += 1
+
+    def apply(self, event: TradeEvent) -> None:
+        if self._replay is not None:
+            self._replay.append(event)
+        elif self._ready:
+            self._apply(event)
+
+    def _apply(self, event: TradeEvent, covered: dict[str, int | None] | None = None) -> None:
+        if event.symbol != self._symbol:
+            return
+        self.trades += 1
+        timestamp, price, quantity = event.timestamp, event.price.last, event.quantity.value
+        for series in self._series.values():
+            last = covered.get(series.interval) if covered else None
+            open_time = timestamp - timestamp % series.ms
+            if last is None or open_time > last:
+                series.add_trade(timestamp, price, quantity)
+            elif open_time == last:
+                self._unsettled[series.interval] = last
+
+    async def settle(self) -> None:
+        """Replace candles that may have missed replayed trades, once REST has closed them."""
+        now = self._clock_ms()
+        for interval, open_time in list(self._unsettled.items()):
+            series = self._series[interval]
+            if open_time + series.ms + self._settle_delay_ms > now:
+                continue
+            rows = await self._rest_client.klines(
+                symbol=self._symbol.value, interval=interval, limit=1, start_time=open_time
+            )
+            if self._unsettled.get(interval) != open_time:
+                continue  # re-seeded meanwhile
+            for kline in klines_from_api(rows, interval):
+                series.settle(kline)
+            del self._unsettled[interval]
+
+    def _settle_timeout(self) -> float | None:
+        """Seconds until the next unsettled candle can be fetched, if there is one."""
+        due = [
+            open_time + self._series[interval].ms + self._settle_delay_ms
+            for interval, open_time in self._unsettled.items()
+        ]
+        return max(min(due) - self._clock_ms(), 0) / 1000 if due else None
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._follow()),
+                asyncio.create_task(self._reconcile_loop()),
+            ]
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._ready = False
+
+    async def _follow(self) -> None:
+        while True:
+            try:
+                async for event in self._gateway.subscribe_trades(self._symbol):
+                    self.apply(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Deals stream failed; reseeding klines and retrying", exc_info=True)
+            # Trades may have been missed while disconnected.
+            self.request_reconcile()
+            await asyncio.sleep(self._retry_delay)
+
+    async def _reconcile_loop(self) -> None:
+        self.request_reconcile()
+        while True:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._reconcile_requested.wait(), self._settle_timeout())
+            reseed = self._reconcile_requested.is_set()
+            self._reconcile_requested.clear()
+            try:
+                await (self.refresh() if reseed else self.settle())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Kline reconciliation failed", exc_info=True)
+                await asyncio.sleep(self._retry_delay)
+                if reseed:
+                    self.request_reconcile()
+
+
+class LiveKlineExchangeService(ForwardingExchangeService):
+    """ExchangeService decorator answering ``get_kline`` from a ready :class:`KlineRollup`."""
+
+    def __init__(self, inner: ExchangeService, rollup: KlineRollup):
+        super().__init__(inner)
+        self._rollup = rollup
+
+    async def get_kline(self, symbol: Symbol, interval: str, limit: int = 100) -> list[KLine]:
+        if symbol == self._rollup.symbol:
+            klines = self._rollup.klines(interval, limit)
+            if klines is not None:
+                return klines
+        return await self._inner.get_kline(symbol, interval, limit)
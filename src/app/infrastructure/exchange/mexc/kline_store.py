@@ -0,0 +1,144 @@
+"""In-memory kline history per interval, kept current with small delta fetches."""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable
+
+from src.app.application.ports.exchange_service import ExchangeService
+from src.app.domain.value_objects.kline import KLine
+from src.app.domain.value_objects.kline_interval import KlineInterval
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.forwarding_service import ForwardingExchangeService
+from src.app.infrastructure.exchange.mexc.mappers import klines_from_api
+from src.app.infrastructure.exchange.mexc.rest_client import MexcRestClient
+from src.app.infrastructure.exchange.mexc.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+def _open_time(kline: KLine) -> int:
+    return int(kline.timestamp.value.timestamp() * 1000)
+
+
+@dataclass
+class _Series:
+    """Ring buffer of the newest candles of one symbol/interval, oldest first."""
+
+    capacity: int
+    candles: deque[KLine] = field(init=False)
+    refreshed_at: float | None = None
+
+    def __post_init__(self) -> None:
+        self.candles = deque(maxlen=self.capacity)
+
+    @property
+    def last_open_time(self) -> int | None:
+        return _open_time(self.candles[-1]) if self.candles else None
+
+    def merge(self, klines: list[KLine]) -> None:
+        """Patch the open candle in place and append newer ones; older rows are ignored."""
+        last = self.last_open_time
+        for kline in klines:
+            open_time = _open_time(kline)
+            if last is None or open_time > last:
+                self.candles.append(kline)
+                last = open_time
+            elif open_time == last:
+                self.candles[-1] = kline
+
+    def tail(self, limit: int) -> list[KLine]:
+        return list(islice(self.candles, max(len(self.candles) - limit, 0), None))
+
+
+class KlineStore:
+    """
+    Newest ``capacity`` candles per symbol and interval, served from memory.
+
+    The first read of a series loads it in full; after that, reads older than
+    ``refresh_interval`` fetch only from the last stored (still open) candle
+    onwards via ``startTime``, which rewrites that candle and appends any that
+    opened since. Concurrent refreshes of a series share one request.
+    """
+
+    def __init__(
+        self,
+        rest_client: MexcRestClient,
+        *,
+        capacity: int = 500,
+        refresh_interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if capacity <= 0:
+            raise ValueError("Kline store capacity must be positive")
+        self._rest_client = rest_client
+        self._capacity = capacity
+        self._refresh_interval = refresh_interval
+        self._clock = clock
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._refreshes = SingleFlight()
+        self.full_loads = 0
+        self.delta_fetches = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def supports(self, interval: str, limit: int) -> bool:
+        try:
+            KlineInterval(interval)
+        except ValueError:
+            return False
+        return 0 < limit <= self._capacity
+
+    async def get(self, symbol: str, interval: str, limit: int) -> list[KLine]:
+        """Return the newest ``limit`` candles, refreshing the series first when due."""
+        key = (symbol, interval)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(self._capacity)
+        refreshed_at = series.refreshed_at
+        if refreshed_at is None or self._clock() - refreshed_at >= self._refresh_interval:
+            await self._refreshes.do(key, lambda: self._refresh(symbol, interval, series))
+        return series.tail(limit)
+
+    async def _refresh(self, symbol: str, interval: str, series: _Series) -> None:
+        start = series.last_open_time
+        if start is not None:
+            self.delta_fetches += 1
+            rows = await self._rest_client.klines(
+                symbol=symbol, interval=interval, limit=self._capacity, start_time=start
+            )
+            # A full page means more candles opened than one delta covers.
+            if len(rows) < self._capacity:
+                series.merge(klines_from_api(rows, interval))
+                series.refreshed_at = self._clock()
+                return
+            logger.info("Kline store %s %s fell behind; reloading", symbol, interval)
+        self.full_loads += 1
+        rows = await self._rest_client.klines(
+            symbol=symbol, interval=interval, limit=self._capacity
+        )
+        series.candles.clear()
+        series.merge(klines_from_api(rows, interval))
+        series.refreshed_at = self._clock()
+
+
+class KlineStoreExchangeService(ForwardingExchangeService):
+    """
+    ExchangeService decorator answering ``get_kline`` from a :class:`KlineStore`.
+
+    Intervals the store does not keep, or a ``limit`` beyond its capacity,
+    go to the wrapped service.
+    """
+
+    def __init__(self, inner: ExchangeService, store: KlineStore):
+        super().__init__(inner)
+        self._store = store
+
+    async def get_kline(self, symbol: Symbol, interval: str, limit: int = 100) -> list[KLine]:
+        if self._store.supports(interval, limit):
+            return await self._store.get(symbol.value.replace("/", "").upper(), interval, limit)
+        return await self._inner.get_kline(symbol, interval, limit)
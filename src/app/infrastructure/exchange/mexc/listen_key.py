@@ -0,0 +1,121 @@
+"""User-data-stream listen key lifecycle: create, keep alive, rotate, close."""
+
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Awaitable, Callable
+
+from src.app.infrastructure.exchange.mexc.rest_client import MexcRestClient
+
+logger = logging.getLogger(__name__)
+
+RotationHandler = Callable[[str], Awaitable[None]]
+
+
+class ListenKeyManager:
+    """
+    Own the listen key that private MEXC WebSocket streams connect with.
+
+    A key expires 60 minutes after its last keepalive, so it is extended every
+    ``keepalive_interval`` seconds. A failed keepalive (usually an expired key)
+    and any key older than ``rotate_after`` are replaced by a fresh key. The
+    new key is handed to ``on_rotate`` before the old one is closed, which lets
+    the transport connect with it first and switch over without a gap.
+    """
+
+    def __init__(
+        self,
+        rest_client: MexcRestClient,
+        *,
+        keepalive_interval: float = 1800.0,
+        rotate_after: float = 23 * 3600.0,
+        retry_delay: float = 5.0,
+        on_rotate: RotationHandler | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if keepalive_interval <= 0 or rotate_after <= 0:
+            raise ValueError("Listen key intervals must be positive")
+        self._rest_client = rest_client
+        self._keepalive_interval = keepalive_interval
+        self._rotate_after = rotate_after
+        self._retry_delay = retry_delay
+        self._on_rotate = on_rotate
+        self._clock = clock
+        self._listen_key: str | None = None
+        self._created_at = 0.0
+        self._task: asyncio.Task | None = None
+        self.keepalives = 0
+        self.rotations = 0
+
+    @property
+    def listen_key(self) -> str | None:
+        return self._listen_key
+
+    @property
+    def age(self) -> float:
+        return self._clock() - self._created_at
+
+    def on_rotate(self, handler: RotationHandler) -> None:
+        self._on_rotate = handler
+
+    async def open(self) -> str:
+        """Create the first key and start the keepalive loop."""
+        if self._listen_key is None:
+            self._listen_key = await self._rest_client.create_listen_key()
+            self._created_at = self._clock()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._listen_key
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        key, self._listen_key = self._listen_key, None
+        if key is not None:
+            await self._close_key(key)
+
+    async def run(self) -> None:
+        while True:
+            until_rotation = self._rotate_after - self.age
+            await asyncio.sleep(max(0.0, min(self._keepalive_interval, until_rotation)))
+            try:
+                if self.age >= self._rotate_after:
+                    await self.rotate()
+                else:
+                    await self._keepalive()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Listen key maintenance failed; retrying", exc_info=True)
+                await asyncio.sleep(self._retry_delay)
+
+    async def rotate(self) -> str:
+        """Create a new key, hand it over, then close the old one."""
+        new_key = await self._rest_client.create_listen_key()
+        old_key, self._listen_key = self._listen_key, new_key
+        self._created_at = self._clock()
+        self.rotations += 1
+        if self._on_rotate is not None:
+            await self._on_rotate(new_key)
+        if old_key is not None and old_key != new_key:
+            await self._close_key(old_key)
+        return new_key
+
+    async def _keepalive(self) -> None:
+        try:
+            await self._rest_client.keepalive_listen_key(self._listen_key)
+        except Exception:
+            logger.info("Listen key keepalive rejected; rotating to a new key")
+            await self.rotate()
+            return
+        self.keepalives += 1
+
+    async def _close_key(self, key: str) -> None:
+        try:
+            await self._rest_client.close_listen_key(key)
+        except Exception:
+            logger.debug("Closing listen key failed; it will expire on its own", exc_info=True)
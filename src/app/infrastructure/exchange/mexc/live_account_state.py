@@ -0,0 +1,240 @@
+"""Account balances and open orders kept in memory from MEXC private pushes."""
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import suppress
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import AsyncIterator, Callable
+
+from src.app.application.ports.exchange_gateway import ExchangeGateway
+from src.app.application.ports.exchange_service import ExchangeService, ExchangeServiceFactory
+from src.app.domain.aggregates.account_state import AccountState
+from src.app.domain.entities.account import Account
+from src.app.domain.entities.order import Order
+from src.app.domain.events.balance_event import BalanceEvent
+from src.app.domain.events.fill_event import FillEvent
+from src.app.domain.events.order_event import OrderEvent
+from src.app.domain.value_objects.balance import Balance
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.domain.value_objects.timestamp import Timestamp
+from src.app.infrastructure.exchange.mexc.forwarding_service import ForwardingExchangeService
+
+logger = logging.getLogger(__name__)
+
+_OPEN_STATUSES = {"NEW", "PARTIALLY_FILLED"}
+
+AccountEvent = BalanceEvent | OrderEvent | FillEvent
+
+
+class LiveAccountState:
+    """
+    Long-lived AccountState seeded once from REST and advanced by private pushes.
+
+    Balance pushes replace the asset's free/locked amounts, order pushes update
+    or drop open orders, and fills are kept in a short history. Pushes seen
+    while a REST reconciliation is in flight are replayed on top of it, and an
+    order the book does not know about triggers an early reconciliation.
+    """
+
+    def __init__(
+        self,
+        symbol: Symbol,
+        gateway: ExchangeGateway,
+        exchange_factory: ExchangeServiceFactory,
+        *,
+        reconcile_interval: float = 60.0,
+        retry_delay: float = 1.0,
+        max_fills: int = 200,
+    ):
+        self._symbol = symbol
+        self._gateway = gateway
+        self._exchange_factory = exchange_factory
+        self._reconcile_interval = reconcile_interval
+        self._retry_delay = retry_delay
+        self._state: AccountState | None = None
+        self._replay: list[AccountEvent] | None = None
+        self._reconcile_requested = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self.recent_fills: deque[FillEvent] = deque(maxlen=max_fills)
+        self.reconciliations = 0
+        self.drift_corrections = 0
+
+    @property
+    def symbol(self) -> Symbol:
+        return self._symbol
+
+    @property
+    def ready(self) -> bool:
+        return self._state is not None
+
+    @property
+    def state(self) -> AccountState | None:
+        return self._state
+
+    def account(self) -> Account | None:
+        return self._state.account if self._state is not None else None
+
+    def open_orders(self) -> list[Order]:
+        return list(self._state.open_orders) if self._state is not None else []
+
+    def request_reconcile(self) -> None:
+        self._reconcile_requested.set()
+
+    async def refresh(self) -> None:
+        """Replace the state with REST account and open orders, then replay pushes."""
+        self._replay = []
+        try:
+            async with self._exchange_factory() as exchange:
+                account, orders = await asyncio.gather(
+                    exchange.get_account(), exchange.list_open_orders(self._symbol)
+                )
+        except BaseException:
+            self._replay = None
+            raise
+        replay, self._replay = self._replay, None
+
+        previous, self._state = self._state, AccountState(
+            symbol=self._symbol,
+            account=account,
+            open_orders=[order for order in orders if order.symbol == self._symbol],
+            updated_at=_now(),
+        )
+        for event in replay:
+            self._apply(event)
+        if previous is not None and _balances(previous.account) != _balances(self._state.account):
+            self.drift_corrections += 1
+            logger.info("Account state for %s drifted from REST; corrected", self._symbol.value)
+        self.reconciliations += 1
+
+    def apply(self, event: AccountEvent) -> None:
+        if self._replay is not None:
+            self._replay.append(event)
+        self._apply(event)
+
+    def _apply(self, event: AccountEvent) -> None:
+        if isinstance(event, FillEvent):
+            self.recent_fills.append(event)
+        if self._state is None:
+            return
+        if isinstance(event, BalanceEvent):
+            self._apply_balance(event)
+        elif isinstance(event, OrderEvent):
+            self._apply_order(event)
+        self._state.updated_at = _now()
+
+    def _apply_balance(self, event: BalanceEvent) -> None:
+        account = self._state.account
+        updated = Balance(asset=event.asset, free=event.free, locked=event.locked)
+        others = [balance for balance in account.balances if balance.asset != event.asset]
+        update_time = account.update_time
+        if event.timestamp:
+            update_time = Timestamp(
+                datetime.fromtimestamp(event.timestamp / 1000, tz=timezone.utc)
+            )
+        # Swap in a new Account so readers holding the previous one never see it change.
+        self._state.account = replace(
+            account, balances=others + [updated], update_time=update_time
+        )
+
+    def _apply_order(self, event: OrderEvent) -> None:
+        if event.symbol != self._symbol:
+            return
+        orders = self._state.open_orders
+        index = next(
+            (i for i, order in enumerate(orders) if order.order_id == event.order_id), None
+        )
+        if event.status.value not in _OPEN_STATUSES:
+            if index is not None:
+                self._state.open_orders = orders[:index] + orders[index + 1 :]
+            return
+        if index is None:
+            # The push lacks side/type, so fetch the new order through REST.
+            self.request_reconcile()
+            return
+        order = replace(
+            orders[index],
+            status=event.status,
+            executed_quantity=event.executed_quantity or orders[index].executed_quantity,
+            cumulative_quote_quantity=(
+                event.cumulative_quote_quantity or orders[index].cumulative_quote_quantity
+            ),
+            updated_at=_now(),
+        )
+        self._state.open_orders = orders[:index] + [order] + orders[index + 1 :]
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._follow(self._gateway.subscribe_balances)),
+                asyncio.create_task(self._follow(self._gateway.subscribe_orders)),
+                asyncio.create_task(self._follow(self._gateway.subscribe_fills)),
+                asyncio.create_task(self._reconcile_loop()),
+            ]
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._state = None
+
+    async def _follow(self, subscribe: Callable[[], AsyncIterator[AccountEvent]]) -> None:
+        while True:
+            try:
+                async for event in subscribe():
+                    self.apply(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Private stream failed; reconciling and retrying", exc_info=True)
+            # Pushes may have been missed while disconnected.
+            self.request_reconcile()
+            await asyncio.sleep(self._retry_delay)
+
+    async def _reconcile_loop(self) -> None:
+        self.request_reconcile()
+        while True:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self._reconcile_requested.wait(), timeout=self._reconcile_interval
+                )
+            self._reconcile_requested.clear()
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Account reconciliation failed", exc_info=True)
+                await asyncio.sleep(self._retry_delay)
+                self.request_reconcile()
+
+
+class LiveAccountExchangeService(ForwardingExchangeService):
+    """ExchangeService decorator answering account and open-order reads from memory."""
+
+    def __init__(self, inner: ExchangeService, live_account: LiveAccountState):
+        super().__init__(inner)
+        self._live = live_account
+
+    async def get_account(self):
+        account = self._live.account()
+        if account is None:
+            return await self._inner.get_account()
+        return account
+
+    async def list_open_orders(self, symbol: Symbol | None = None):
+        if self._live.ready and symbol is not None and symbol == self._live.symbol:
+            return self._live.open_orders()
+        return await self._inner.list_open_orders(symbol)
+
+
+def _balances(account: Account) -> dict[str, tuple]:
+    return {balance.asset: (balance.free, balance.locked) for balance in account.balances}
+
+
+def _now() -> Timestamp:
+    return Timestamp(datetime.now(timezone.utc))
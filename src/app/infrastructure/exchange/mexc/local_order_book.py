@@ -0,0 +1,342 @@
+"""Locally maintained order book kept in sync from MEXC incremental depth pushes."""
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import suppress
+from decimal import Decimal
+from typing import Any, AsyncIterator, Iterable
+
+from src.app.application.ports.exchange_gateway import ExchangeGateway
+from src.app.application.ports.exchange_service import ExchangeService
+from src.app.domain.events.market_depth_event import MarketDepthEvent
+from src.app.domain.value_objects.order_book import BookSide, OrderBook
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.forwarding_service import ForwardingExchangeService
+from src.app.infrastructure.exchange.mexc.mappers import order_book_from_api
+from src.app.infrastructure.exchange.mexc.rest_client import MexcRestClient
+from src.app.infrastructure.exchange.mexc.ws.mexc_ws_client import (
+    DEFAULT_INTERVAL,
+    STREAM_INTERVALS,
+)
+from src.app.infrastructure.streaming.conflation import LatestValueMailbox
+
+logger = logging.getLogger(__name__)
+
+# Candidate-stream diffs held while the old stream catches up during a switch.
+_MAX_HELD_DIFFS = 1000
+
+
+class DepthVersionGap(Exception):
+    """Raised when a depth diff does not continue the locally applied version."""
+
+
+class LocalOrderBook:
+    """
+    Order book for one symbol, seeded from ``/api/v3/depth`` and advanced by diffs.
+
+    Diffs are applied strictly in version order: pushes that end at or before
+    the local version are ignored, the next push must cover ``version + 1``.
+    Anything else is a gap, after which :meth:`run` re-seeds from REST while the
+    stream keeps buffering, so readers only ever see a consistent book.
+    The aggregation ``interval`` of the stream can be changed while running.
+    """
+
+    def __init__(
+        self,
+        symbol: Symbol,
+        gateway: ExchangeGateway,
+        rest_client: MexcRestClient,
+        *,
+        snapshot_limit: int = 1000,
+        retry_delay: float = 1.0,
+        interval: str = DEFAULT_INTERVAL,
+    ):
+        self._symbol = symbol
+        self._gateway = gateway
+        self._rest_client = rest_client
+        self._snapshot_limit = snapshot_limit
+        self._retry_delay = retry_delay
+        self._book = OrderBook()
+        self._version: int | None = None
+        self._task: asyncio.Task | None = None
+        self._resync_requested = False
+        self._watchers: set[LatestValueMailbox] = set()
+        self._interval = interval
+        self._queue: asyncio.Queue | None = None
+        self._pumps: dict[int, tuple[str, asyncio.Task]] = {}
+        self._pump_count = 0
+        self._generation = 0
+        self._candidate: int | None = None
+        self._held: deque[MarketDepthEvent] = deque()
+        self.resyncs = 0
+        self.interval_switches = 0
+
+    @property
+    def symbol(self) -> Symbol:
+        return self._symbol
+
+    @property
+    def depth(self) -> int:
+        """Number of levels per side the book is seeded with."""
+        return self._snapshot_limit
+
+    @property
+    def interval(self) -> str:
+        return self._interval
+
+    @property
+    def version(self) -> int | None:
+        return self._version
+
+    @property
+    def synced(self) -> bool:
+        return self._version is not None
+
+    def order_book(self, limit: int | None = None) -> OrderBook:
+        """Return a copy of the best ``limit`` levels per side."""
+        return self._book.top(limit)
+
+    def reset(self, snapshot: dict[str, Any]) -> None:
+        """Replace the book with a REST depth payload carrying ``lastUpdateId``."""
+        self._book = order_book_from_api(snapshot)
+        self._version = int(snapshot["lastUpdateId"])
+        self._resync_requested = False
+        self._notify()
+
+    def invalidate(self) -> None:
+        """Mark the book as out of sync until the next snapshot."""
+        self._version = None
+
+    def request_resync(self) -> None:
+        """Re-seed from REST before the next diff, e.g. after the stream reconnected."""
+        self._resync_requested = True
+
+    def apply(self, event: MarketDepthEvent) -> bool:
+        """
+        Apply one diff; return False when it is already covered by the book.
+
+        Raises:
+            DepthVersionGap: if the book is not synced or the diff skips versions.
+        """
+        if self._version is None:
+            raise DepthVersionGap("Order book is not seeded")
+        if self._resync_requested:
+            self._resync_requested = False
+            raise DepthVersionGap(f"{self._symbol.value} depth stream reconnected")
+        from_version, to_version = _versions(event)
+        if to_version <= self._version:
+            return False
+        if from_version > self._version + 1:
+            raise DepthVersionGap(
+                f"{self._symbol.value} depth jumped from {self._version} to {from_version}"
+            )
+        _merge(self._book.bid_side, event.bids)
+        _merge(self._book.ask_side, event.asks)
+        self._version = to_version
+        self._notify()
+        return True
+
+    async def watch(self, limit: int = 20) -> AsyncIterator[OrderBook]:
+        """
+        Yield the top ``limit`` levels whenever the synced book changed.
+
+        Changes are conflated: a consumer that falls behind is woken once and
+        gets the current book, which is only copied when it is ready for it.
+        """
+        mailbox: LatestValueMailbox = LatestValueMailbox()
+        self._watchers.add(mailbox)
+        try:
+            if self.synced:
+                mailbox.put(self._symbol.value, self._version)
+            while True:
+                await mailbox.get()
+                if self.synced:
+                    yield self._book.top(limit)
+        finally:
+            self._watchers.discard(mailbox)
+
+    def _notify(self) -> None:
+        for mailbox in self._watchers:
+            mailbox.put(self._symbol.value, self._version)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        self.invalidate()
+
+    async def run(self) -> None:
+        """Keep the book in sync until cancelled, reconnecting after stream errors."""
+        while True:
+            try:
+                await self._follow_stream()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "Depth stream for %s failed; retrying", self._symbol.value, exc_info=True
+                )
+            self.invalidate()
+            await asyncio.sleep(self._retry_delay)
+
+    async def set_interval(self, interval: str) -> None:
+        """
+        Follow the depth stream at another aggregation interval (raw, 10ms, 100ms).
+
+        The new subscription runs next to the current one and its diffs are
+        held back until they continue the local version; it then replaces the
+        old stream, so the book stays synced through the switch.
+        """
+        if interval not in STREAM_INTERVALS:
+            raise ValueError(f"Unknown depth interval: {interval}")
+        if self._candidate is not None:
+            await self._retire(self._candidate)
+            self._candidate = None
+            self._held.clear()
+        self._interval = interval
+        current = self._pumps.get(self._generation)
+        if self._queue is None or current is None or current[0] == interval:
+            return
+        self._candidate = self._start_pump(interval)
+        logger.info("Switching %s depth stream to %s", self._symbol.value, interval)
+
+    async def _follow_stream(self) -> None:
+        self._queue = asyncio.Queue()
+        self._generation = self._start_pump(self._interval)
+        try:
+            while True:
+                await self._seed()
+                try:
+                    while True:
+                        self.apply(await self._take())
+                except DepthVersionGap as exc:
+                    self.resyncs += 1
+                    self.invalidate()
+                    logger.info("Resyncing %s order book: %s", self._symbol.value, exc)
+        finally:
+            for generation in list(self._pumps):
+                await self._retire(generation)
+            self._queue, self._candidate = None, None
+            self._held.clear()
+
+    def _start_pump(self, interval: str) -> int:
+        self._pump_count += 1
+        generation = self._pump_count
+        task = asyncio.create_task(self._pump(self._queue, generation, interval))
+        self._pumps[generation] = (interval, task)
+        return generation
+
+    async def _retire(self, generation: int) -> None:
+        _, task = self._pumps.pop(generation, (None, None))
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def _pump(self, queue: asyncio.Queue, generation: int, interval: str) -> None:
+        try:
+            async for event in self._gateway.subscribe_market_depth(self._symbol, interval):
+                queue.put_nowait((generation, event))
+            queue.put_nowait((generation, ConnectionError("Depth stream ended")))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            queue.put_nowait((generation, exc))
+
+    async def _take(self) -> MarketDepthEvent:
+        """Return the next diff to apply, moving to a candidate stream once it is ready."""
+        while True:
+            if self._held and (self._candidate is None or self._candidate_ready()):
+                return self._held.popleft()
+            generation, item = await self._queue.get()
+            if generation == self._generation:
+                if isinstance(item, Exception):
+                    raise item
+                return item
+            if generation != self._candidate:
+                continue
+            if isinstance(item, Exception):
+                logger.warning("Could not switch %s depth stream: %s", self._symbol.value, item)
+                await self._retire(generation)
+                self._candidate = None
+                self._held.clear()
+                self._interval = self._pumps[self._generation][0]
+                continue
+            self._held.append(item)
+
+    def _candidate_ready(self) -> bool:
+        """Drop held diffs the book already covers; promote once the next one continues it."""
+        while self._held and self._version is not None:
+            from_version, to_version = _versions(self._held[0])
+            if to_version <= self._version:
+                self._held.popleft()
+                continue
+            if from_version > self._version + 1 and len(self._held) < _MAX_HELD_DIFFS:
+                return False
+            if from_version > self._version + 1:
+                # The old stream stopped short of the new one; re-seed on the new stream.
+                self.request_resync()
+            break
+        if not self._held:
+            return False
+        _, old_task = self._pumps.pop(self._generation)
+        old_task.cancel()
+        self._generation, self._candidate = self._candidate, None
+        self.interval_switches += 1
+        return True
+
+    async def _seed(self) -> None:
+        """Take a snapshot once the stream is live and replay buffered diffs onto it."""
+        while True:
+            first = await self._take()
+            snapshot = await self._rest_client.depth(
+                symbol=self._symbol.value, limit=self._snapshot_limit
+            )
+            self.reset(snapshot)
+            try:
+                self.apply(first)
+                while self._held or not self._queue.empty():
+                    self.apply(await self._take())
+                return
+            except DepthVersionGap as exc:
+                self.resyncs += 1
+                self.invalidate()
+                logger.info("Snapshot for %s is behind the stream: %s", self._symbol.value, exc)
+                await asyncio.sleep(self._retry_delay)
+
+
+class LiveDepthExchangeService(ForwardingExchangeService):
+    """
+    ExchangeService decorator serving ``get_depth`` from synced local books.
+
+    Falls back to the wrapped service when the book is out of sync or the
+    caller asks for more levels than the book was seeded with.
+    """
+
+    def __init__(self, inner: ExchangeService, books: Iterable[LocalOrderBook]):
+        super().__init__(inner)
+        self._books = {book.symbol.value: book for book in books}
+
+    async def get_depth(self, symbol: Symbol, limit: int = 50) -> OrderBook:
+        book = self._books.get(symbol.value.replace("/", "").upper())
+        if book is not None and book.synced and limit <= book.depth:
+            return book.order_book(limit)
+        return await self._inner.get_depth(symbol, limit)
+
+
+def _versions(event: MarketDepthEvent) -> tuple[int, int]:
+    if event.from_version is None or event.to_version is None:
+        raise DepthVersionGap("Depth diff carries no version range")
+    return int(event.from_version), int(event.to_version)
+
+
+def _merge(side: BookSide, levels: list[tuple[Decimal, Decimal]]) -> None:
+    for price, quantity in levels:
+        side.update(price, quantity)
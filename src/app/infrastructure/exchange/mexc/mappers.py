@@ -8,6 +8,7 @@ from src.app.domain.entities.account import Account
 from src.app.domain.entities.order import Order
 from src.app.domain.entities.trade import Trade
 from src.app.domain.value_objects.balance import Balance
+from src.app.domain.value_objects.kline import KLine
 from src.app.domain.value_objects.order_book import DepthLevel, OrderBook
 from src.app.domain.value_objects.order_id import OrderId
 from src.app.domain.value_objects.order_status import OrderStatus
@@ -99,6 +100,26 @@ def trade_from_api(payload: dict[str, Any]) -> Trade:
     )
 
 
+def klines_from_api(payload: Any, interval: str) -> list[KLine]:
+    """Map ``/api/v3/klines`` rows ``[openTime, open, high, low, close, volume, ...]``."""
+
+    if not isinstance(payload, list):
+        return []
+    return [
+        KLine.from_raw(
+            Decimal(row[1]),
+            Decimal(row[2]),
+            Decimal(row[3]),
+            Decimal(row[4]),
+            Decimal(row[5]),
+            interval,
+            int(row[0]),
+        )
+        for row in payload
+        if isinstance(row, (list, tuple)) and len(row) >= 6
+    ]
+
+
 def _parse_levels(raw: Any) -> list[DepthLevel]:
     levels: list[DepthLevel] = []
     if not isinstance(raw, list):
@@ -0,0 +1,180 @@
+"""Client-side request-weight limiter for the MEXC REST API."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import Any, Mapping
+
+
+class RequestPriority(IntEnum):
+    """Dispatch lanes; lower values are served first."""
+
+    TRADING = 0
+    ACCOUNT = 1
+    MARKET_DATA = 2
+
+
+# Weights published in the MEXC spot v3 docs; unlisted endpoints count as 1.
+_ENDPOINT_WEIGHTS: dict[tuple[str, str], int] = {
+    ("GET", "/api/v3/ticker/24hr"): 1,
+    ("GET", "/api/v3/klines"): 1,
+    ("GET", "/api/v3/trades"): 5,
+    ("GET", "/api/v3/account"): 10,
+    ("GET", "/api/v3/myTrades"): 10,
+    ("GET", "/api/v3/openOrders"): 3,
+    ("GET", "/api/v3/allOrders"): 10,
+    ("GET", "/api/v3/order"): 2,
+    ("POST", "/api/v3/order"): 1,
+    ("DELETE", "/api/v3/order"): 1,
+}
+
+_DEPTH_WEIGHTS: tuple[tuple[int, int], ...] = ((100, 1), (500, 5), (1000, 10))
+
+_TRADING_ENDPOINTS = {("POST", "/api/v3/order"), ("DELETE", "/api/v3/order")}
+
+# Used-weight headers and the window (seconds) each one counts. MEXC does not
+# document the window of the unsuffixed headers; None means it is assumed to be
+# the limiter's own interval (MEXC_RATE_LIMIT_INTERVAL, 10s like MEXC's IP limit).
+USED_WEIGHT_HEADERS: tuple[tuple[str, float | None], ...] = (
+    ("x-mexc-used-weight", None),
+    ("x-mbx-used-weight-1m", 60.0),
+    ("x-mbx-used-weight", None),
+)
+
+
+def request_weight(method: str, path: str, params: Mapping[str, Any] | None = None) -> int:
+    """Return the request weight MEXC charges for an endpoint call."""
+    if path == "/api/v3/depth":
+        limit = int((params or {}).get("limit") or 100)
+        for max_limit, weight in _DEPTH_WEIGHTS:
+            if limit <= max_limit:
+                return weight
+        return 50
+    if path == "/api/v3/ticker/24hr" and not (params or {}).get("symbol"):
+        return 40
+    return _ENDPOINT_WEIGHTS.get((method.upper(), path), 1)
+
+
+def request_priority(method: str, path: str, signed: bool) -> RequestPriority:
+    """Order entry/cancel outranks private reads, which outrank public market data."""
+    if (method.upper(), path) in _TRADING_ENDPOINTS:
+        return RequestPriority.TRADING
+    return RequestPriority.ACCOUNT if signed else RequestPriority.MARKET_DATA
+
+
+def used_weight_from_headers(headers: Mapping[str, str]) -> tuple[int, float | None] | None:
+    """Return the reported used weight and the window it covers, if a header is present."""
+    for name, window in USED_WEIGHT_HEADERS:
+        raw = headers.get(name)
+        if raw is None:
+            continue
+        try:
+            return int(raw), window
+        except ValueError:
+            return None
+    return None
+
+
+class WeightedRateLimiter:
+    """
+    Token bucket of request weight with strict priority lanes.
+
+    The bucket refills continuously at ``capacity / interval`` per second.
+    Waiters are served in (priority, arrival) order, and only the trading lane
+    may spend the last ``reserved`` tokens so order entry never queues behind
+    dashboard reads.
+    """
+
+    def __init__(self, capacity: int, interval: float, reserved: int = 0):
+        if capacity <= 0 or interval <= 0:
+            raise ValueError("Rate limit capacity and interval must be positive")
+        self._capacity = float(capacity)
+        self._rate = capacity / interval
+        self._interval = float(interval)
+        self._reserved = float(min(max(reserved, 0), capacity - 1))
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int, float, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for *_, waiter in self._waiters if not waiter.done())
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _floor(self, priority: int) -> float:
+        return 0.0 if priority <= RequestPriority.TRADING else self._reserved
+
+    def _try_take(self, priority: int, weight: float) -> bool:
+        if self._tokens - weight < self._floor(priority):
+            return False
+        self._tokens -= weight
+        return True
+
+    async def acquire(
+        self, weight: int = 1, priority: RequestPriority = RequestPriority.MARKET_DATA
+    ) -> None:
+        """Wait until ``weight`` tokens can be spent in the given lane."""
+        cost = float(min(max(weight, 1), self._capacity - self._floor(priority)))
+        self._refill()
+        self._discard_cancelled()
+        ahead = self._waiters and self._waiters[0][0] <= priority
+        if not ahead and self._try_take(priority, cost):
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), cost, waiter))
+        self._dispatch()
+        await waiter
+
+    def observe_used_weight(self, used: int, window: float | None = None) -> None:
+        """
+        Align the bucket with the weight the server reports as already spent.
+
+        ``used`` counts the server's ``window`` (defaulting to this limiter's
+        interval). The server allows ``capacity`` per interval, so its budget
+        for that window is scaled by ``window / interval``, and the bucket is
+        capped at what is left of it.
+        """
+        self._refill()
+        budget = self._rate * (window if window is not None else self._interval)
+        self._tokens = min(self._tokens, budget - used)
+
+    def penalize(self, retry_after: float) -> None:
+        """Stop dispatching for ``retry_after`` seconds after a 429/418 response."""
+        self._refill()
+        self._tokens = min(self._tokens, -retry_after * self._rate)
+        self._dispatch()
+
+    def _discard_cancelled(self) -> None:
+        while self._waiters and self._waiters[0][3].done():
+            heapq.heappop(self._waiters)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._refill()
+        self._discard_cancelled()
+        while self._waiters:
+            priority, _, cost, waiter = self._waiters[0]
+            if not self._try_take(priority, cost):
+                deficit = self._floor(priority) + cost - self._tokens
+                loop = asyncio.get_running_loop()
+                self._timer = loop.call_later(deficit / self._rate, self._dispatch)
+                return
+            heapq.heappop(self._waiters)
+            waiter.set_result(None)
+            self._discard_cancelled()
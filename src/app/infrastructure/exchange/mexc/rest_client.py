@@ -6,33 +6,97 @@ from urllib.parse import urlencode
 
 import httpx
 
+from src.app.infrastructure.exchange.mexc.rate_limiter import (
+    WeightedRateLimiter,
+    request_priority,
+    request_weight,
+    used_weight_from_headers,
+)
 from src.app.infrastructure.exchange.mexc.settings import MexcSettings
+from src.app.infrastructure.exchange.mexc.single_flight import SingleFlight
 
 
 class MexcRestClient:
-    """Async REST client for MEXC spot API v3."""
+    """
+    Async REST client for MEXC spot API v3.
 
-    def __init__(self, settings: MexcSettings):
+    The connection pool is shared by every ``async with`` block entered on the
+    same instance: each entry takes a lease and the pool is closed when the last
+    lease is released, unless it was pinned for the application lifetime via
+    :meth:`open`.
+    """
+
+    def __init__(
+        self, settings: MexcSettings, transport: httpx.AsyncBaseTransport | None = None
+    ):
         self._settings = settings
+        self._transport = transport
         self._client: httpx.AsyncClient | None = None
+        self._leases = 0
+        self._pinned = False
+        self._limiter = WeightedRateLimiter(
+            capacity=settings.rate_limit_weight,
+            interval=settings.rate_limit_interval,
+            reserved=settings.rate_limit_reserved_weight,
+        )
+        self._single_flight = SingleFlight()
+
+    @property
+    def settings(self) -> MexcSettings:
+        return self._settings
+
+    @property
+    def rate_limiter(self) -> WeightedRateLimiter:
+        return self._limiter
+
+    @property
+    def single_flight(self) -> SingleFlight:
+        return self._single_flight
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self._settings.max_connections,
+                max_keepalive_connections=self._settings.max_keepalive_connections,
+                keepalive_expiry=self._settings.keepalive_expiry,
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self._settings.base_url,
+                timeout=httpx.Timeout(self._settings.timeout),
+                limits=limits,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def _close_client(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def open(self) -> "MexcRestClient":
+        """Open the connection pool and keep it alive until :meth:`aclose`."""
+        self._ensure_client()
+        self._pinned = True
+        return self
+
+    async def aclose(self) -> None:
+        """Close the connection pool regardless of outstanding leases."""
+        self._pinned = False
+        await self._close_client()
 
     async def __aenter__(self) -> "MexcRestClient":
-        limits = httpx.Limits(
-            max_connections=self._settings.max_connections,
-            max_keepalive_connections=self._settings.max_keepalive_connections,
-            keepalive_expiry=self._settings.keepalive_expiry,
-        )
-        self._client = httpx.AsyncClient(
-            base_url=self._settings.base_url,
-            timeout=httpx.Timeout(self._settings.timeout),
-            limits=limits,
-        )
+        self._ensure_client()
+        self._leases += 1
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        self._leases = max(0, self._leases - 1)
+        if self._leases == 0 and not self._pinned:
+            await self._close_client()
 
     def _assert_client(self) -> httpx.AsyncClient:
         if self._client is None:
@@ -59,14 +123,38 @@ class MexcRestClient:
 
     async def _request(
         self, method: str, path: str, params: dict[str, Any] | None = None, signed: bool = False
+    ) -> dict[str, Any]:
+        if method == "GET" and not signed:
+            # Identical public reads share one upstream call; signed calls never coalesce.
+            key = (method, path, tuple(sorted((params or {}).items())))
+            return await self._single_flight.do(key, lambda: self._send(method, path, params))
+        return await self._send(method, path, params, signed)
+
+    async def _send(
+        self, method: str, path: str, params: dict[str, Any] | None = None, signed: bool = False
     ) -> dict[str, Any]:
         client = self._assert_client()
+        await self._limiter.acquire(
+            request_weight(method, path, params), request_priority(method, path, signed)
+        )
         request_params = self._signed_params(params or {}) if signed else params or {}
         headers = {"X-MEXC-APIKEY": self._settings.api_key} if signed else None
         response = await client.request(method, path, params=request_params, headers=headers)
+        self._observe_rate_limit(response)
         response.raise_for_status()
         return response.json()
 
+    def _observe_rate_limit(self, response: httpx.Response) -> None:
+        observed = used_weight_from_headers(response.headers)
+        if observed is not None:
+            self._limiter.observe_used_weight(*observed)
+        if response.status_code in (418, 429):
+            try:
+                retry_after = float(response.headers.get("Retry-After", "1"))
+            except ValueError:
+                retry_after = 1.0
+            self._limiter.penalize(retry_after)
+
     async def ping(self) -> dict[str, Any]:
         return await self._request("GET", "/api/v3/ping")
 
@@ -76,6 +164,20 @@ class MexcRestClient:
     async def get_account(self) -> dict[str, Any]:
         return await self._request("GET", "/api/v3/account", signed=True)
 
+    async def create_listen_key(self) -> str:
+        """Open a user data stream and return its listen key."""
+        result = await self._request("POST", "/api/v3/userDataStream", signed=True)
+        return result["listenKey"]
+
+    async def keepalive_listen_key(self, listen_key: str) -> dict[str, Any]:
+        """Extend a listen key's validity by another 60 minutes."""
+        params = {"listenKey": listen_key}
+        return await self._request("PUT", "/api/v3/userDataStream", params=params, signed=True)
+
+    async def close_listen_key(self, listen_key: str) -> dict[str, Any]:
+        params = {"listenKey": listen_key}
+        return await self._request("DELETE", "/api/v3/userDataStream", params=params, signed=True)
+
     async def create_order(
         self,
         *,
@@ -125,19 +227,62 @@ class MexcRestClient:
             return result
         return []
 
-    async def list_trades(self, *, symbol: str, limit: int = 50) -> list[dict[str, Any]]:
+    async def list_trades(
+        self,
+        *,
+        symbol: str,
+        limit: int = 50,
+        start_time: int | None = None,
+        end_time: int | None = None,
+    ) -> list[dict[str, Any]]:
         params: dict[str, Any] = {"symbol": symbol, "limit": limit}
+        if start_time is not None:
+            params["startTime"] = start_time
+        if end_time is not None:
+            params["endTime"] = end_time
         result = await self._request("GET", "/api/v3/myTrades", params=params, signed=True)
         if isinstance(result, list):
             return result
         return []
 
+    async def all_orders(
+        self,
+        *,
+        symbol: str,
+        limit: int = 500,
+        start_time: int | None = None,
+        end_time: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Orders of any status created in ``[start_time, end_time]``."""
+        params: dict[str, Any] = {"symbol": symbol, "limit": limit}
+        if start_time is not None:
+            params["startTime"] = start_time
+        if end_time is not None:
+            params["endTime"] = end_time
+        result = await self._request("GET", "/api/v3/allOrders", params=params, signed=True)
+        if isinstance(result, list):
+            return result
+        return []
+
     async def ticker_24h(self, *, symbol: str) -> dict[str, Any]:
         params = {"symbol": symbol}
         return await self._request("GET", "/api/v3/ticker/24hr", params=params)
 
-    async def klines(self, *, symbol: str, interval: str, limit: int = 100) -> list[list[Any]]:
-        params = {"symbol": symbol, "interval": interval, "limit": limit}
+    async def klines(
+        self,
+        *,
+        symbol: str,
+        interval: str,
+        limit: int = 100,
+        start_time: int | None = None,
+        end_time: int | None = None,
+    ) -> list[list[Any]]:
+        """Candles oldest first; ``start_time``/``end_time`` bound open times in ms."""
+        params: dict[str, Any] = {"symbol": symbol, "interval": interval, "limit": limit}
+        if start_time is not None:
+            params["startTime"] = start_time
+        if end_time is not None:
+            params["endTime"] = end_time
         result = await self._request("GET", "/api/v3/klines", params=params)
         if isinstance(result, list):
             return result
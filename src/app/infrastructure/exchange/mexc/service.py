@@ -7,9 +7,11 @@ from src.app.application.ports.exchange_service import (
     PlaceOrderRequest,
 )
 from src.app.domain.entities.trading_pair import TradingPair
+from src.app.domain.value_objects.history_cursor import HistoryCursor
 from src.app.domain.value_objects.order_book import OrderBook
 from src.app.domain.value_objects.price import Price
 from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc import account_history
 from src.app.infrastructure.exchange.mexc.mappers import (
     account_from_api,
     order_book_from_api,
@@ -33,10 +35,16 @@ def _symbol_value(symbol: Symbol) -> str:
 class MexcExchangeService(ExchangeService):
     """Infrastructure adapter implementing the exchange port."""
 
-    def __init__(self, settings: MexcSettings):
-        self._rest_client = MexcRestClient(settings)
+    def __init__(self, settings: MexcSettings, rest_client: MexcRestClient | None = None):
+        # A shared rest client is only leased for the duration of the context.
+        self._settings = settings
+        self._rest_client = rest_client or MexcRestClient(settings)
         self._api_client = MexcApiClient(self._rest_client)
 
+    @property
+    def settings(self) -> MexcSettings:
+        return self._settings
+
     async def __aenter__(self) -> "MexcExchangeService":
         await self._api_client.__aenter__()
         return self
@@ -93,6 +101,20 @@ class MexcExchangeService(ExchangeService):
         response = await self._rest_client.list_trades(symbol=_symbol_value(symbol))
         return [trade_from_api(item) for item in response]
 
+    def trade_history(
+        self, symbol: Symbol, start: int | HistoryCursor, end_time: int | None = None
+    ):
+        return account_history.trade_history(
+            self._rest_client, _symbol_value(symbol), start, end_time
+        )
+
+    def order_history(
+        self, symbol: Symbol, start: int | HistoryCursor, end_time: int | None = None
+    ):
+        return account_history.order_history(
+            self._rest_client, _symbol_value(symbol), start, end_time
+        )
+
     async def get_price(self, symbol: Symbol) -> Price:
         base = symbol.value.replace("/", "").upper().removesuffix("USDT")
         pair = TradingPair(base_currency=base, quote_currency="USDT")
@@ -114,5 +136,7 @@ class MexcExchangeService(ExchangeService):
         return await self._rest_client.trades(symbol=_symbol_value(symbol), limit=limit)
 
 
-def build_mexc_exchange_service(settings: MexcSettings) -> MexcExchangeService:
-    return MexcExchangeService(settings)
+def build_mexc_exchange_service(
+    settings: MexcSettings, rest_client: MexcRestClient | None = None
+) -> MexcExchangeService:
+    return MexcExchangeService(settings, rest_client=rest_client)
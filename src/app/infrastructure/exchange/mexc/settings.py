@@ -15,6 +15,46 @@ class MexcSettings(BaseSettings):
     max_connections: int = Field(default=20, alias="MEXC_MAX_CONNECTIONS", gt=0)
     max_keepalive_connections: int = Field(default=10, alias="MEXC_MAX_KEEPALIVE", gt=0)
     keepalive_expiry: float = Field(default=15.0, alias="MEXC_KEEPALIVE_EXPIRY", gt=0)
+    rate_limit_weight: int = Field(default=500, alias="MEXC_RATE_LIMIT_WEIGHT", gt=1)
+    rate_limit_interval: float = Field(default=10.0, alias="MEXC_RATE_LIMIT_INTERVAL", gt=0)
+    rate_limit_reserved_weight: int = Field(default=50, alias="MEXC_RATE_LIMIT_RESERVED", ge=0)
+    cache_enabled: bool = Field(default=True, alias="MEXC_CACHE_ENABLED")
+    cache_max_entries: int = Field(default=256, alias="MEXC_CACHE_MAX_ENTRIES", gt=0)
+    cache_price_ttl: float = Field(default=1.0, alias="MEXC_CACHE_PRICE_TTL", ge=0)
+    cache_depth_ttl: float = Field(default=1.0, alias="MEXC_CACHE_DEPTH_TTL", ge=0)
+    cache_kline_ttl: float = Field(default=5.0, alias="MEXC_CACHE_KLINE_TTL", ge=0)
+    cache_trades_ttl: float = Field(default=2.0, alias="MEXC_CACHE_TRADES_TTL", ge=0)
+    cache_stale_ttl: float = Field(default=10.0, alias="MEXC_CACHE_STALE_TTL", ge=0)
+    kline_store_enabled: bool = Field(default=True, alias="MEXC_KLINE_STORE_ENABLED")
+    kline_store_size: int = Field(default=500, alias="MEXC_KLINE_STORE_SIZE", gt=0, le=1000)
+    kline_rollup_enabled: bool = Field(default=False, alias="MEXC_KLINE_ROLLUP_ENABLED")
+    ws_url: str = Field(default="wss://wbs-api.mexc.com/ws", alias="MEXC_WS_URL")
+    ws_decode_in_thread: bool = Field(default=False, alias="MEXC_WS_DECODE_IN_THREAD")
+    ws_stale_after: float = Field(default=60.0, alias="MEXC_WS_STALE_AFTER", ge=0)
+    local_book_enabled: bool = Field(default=False, alias="MEXC_LOCAL_BOOK_ENABLED")
+    local_book_depth: int = Field(default=1000, alias="MEXC_LOCAL_BOOK_DEPTH", gt=0, le=5000)
+    local_book_interval: Literal["raw", "10ms", "100ms"] = Field(
+        default="100ms", alias="MEXC_LOCAL_BOOK_INTERVAL"
+    )
+    archive_enabled: bool = Field(default=False, alias="MEXC_ARCHIVE_ENABLED")
+    archive_path: str = Field(default="/tmp/mexc-archive", alias="MEXC_ARCHIVE_PATH")
+    archive_depth_levels: int = Field(default=20, alias="MEXC_ARCHIVE_DEPTH_LEVELS", gt=0, le=100)
+    archive_snapshot_interval: float = Field(
+        default=1.0, alias="MEXC_ARCHIVE_SNAPSHOT_INTERVAL", gt=0
+    )
+    archive_flush_interval: float = Field(default=1.0, alias="MEXC_ARCHIVE_FLUSH_INTERVAL", gt=0)
+    account_stream_enabled: bool = Field(default=False, alias="MEXC_ACCOUNT_STREAM_ENABLED")
+    account_reconcile_interval: float = Field(
+        default=60.0, alias="MEXC_ACCOUNT_RECONCILE_INTERVAL", gt=0
+    )
+    listen_key_keepalive: float = Field(default=1800.0, alias="MEXC_LISTEN_KEY_KEEPALIVE", gt=0)
+    listen_key_rotate_after: float = Field(
+        default=82800.0, alias="MEXC_LISTEN_KEY_ROTATE_AFTER", gt=0
+    )
+    ws_fanout_queue_size: int = Field(default=256, alias="WS_FANOUT_QUEUE_SIZE", gt=0)
+    ws_fanout_policy: Literal["drop_oldest", "conflate", "disconnect"] = Field(
+        default="drop_oldest", alias="WS_FANOUT_POLICY"
+    )
     sub_account_mode: Literal["SPOT", "BROKER"] = Field(default="SPOT", alias="SUB_ACCOUNT_MODE")
     sub_account_id: int | str | None = Field(default=None, alias="SUB_ACCOUNT_ID")
     sub_account_name: str | None = Field(default=None, alias="SUB_ACCOUNT_NAME")
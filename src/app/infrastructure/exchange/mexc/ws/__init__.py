@@ -1,3 +1,4 @@
-from .mexc_ws_client import MexcWebSocketClient
+from .mexc_ws_client import MexcWebSocketClient, decode_push_frame, stream_name
+from .push_frame import PushFrame, peek_channel
 
-__all__ = ["MexcWebSocketClient"]
+__all__ = ["MexcWebSocketClient", "PushFrame", "decode_push_frame", "peek_channel", "stream_name"]
@@ -1,22 +1,582 @@
-from typing import AsyncIterator, Optional
+import asyncio
+import json
+import logging
+import random
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Container, Iterable, Optional
+
+import websockets
+
+from src.app.infrastructure.exchange.mexc.ws.push_frame import PushFrame, peek_channel
+
+logger = logging.getLogger(__name__)
+
+MEXC_WS_URL = "wss://wbs-api.mexc.com/ws"
+MAX_STREAMS_PER_CONNECTION = 30
+
+# Turns a decoded push body (or its selected fields) into the items a
+# subscriber receives, possibly none.
+FrameMapper = Callable[[object], Iterable[object]]
+
+# Aggregation intervals of the public market streams: "raw" pushes every
+# update, "10ms"/"100ms" subscribe to the aggregated variants.
+STREAM_INTERVALS = ("raw", "10ms", "100ms")
+DEFAULT_INTERVAL = "100ms"
+
+_CHANNEL_TEMPLATES = {
+    "depth": "spot@public.aggre.depth.v3.api.pb@{interval}@{symbol}",
+    "deals": "spot@public.aggre.deals.v3.api.pb@{interval}@{symbol}",
+    "book_ticker": "spot@public.aggre.bookTicker.v3.api.pb@{interval}@{symbol}",
+    "book_ticker_batch": "spot@public.bookTicker.batch.v3.api.pb@{symbol}",
+    "depth_batch": "spot@public.increase.depth.batch.v3.api.pb@{symbol}",
+    "mini_tickers": "spot@public.miniTickers.v3.api.pb@{symbol}",
+    "orders": "spot@private.orders.v3.api.pb",
+    "private_deals": "spot@private.deals.v3.api.pb",
+    "balances": "spot@private.account.v3.api.pb",
+}
+_RAW_TEMPLATES = {
+    "depth": "spot@public.increase.depth.v3.api.pb@{symbol}",
+    "deals": "spot@public.deals.v3.api.pb@{symbol}",
+    "book_ticker": "spot@public.bookTicker.v3.api.pb@{symbol}",
+}
+
+
+def stream_name(
+    channel: str, symbol: Optional[str] = None, interval: str = DEFAULT_INTERVAL
+) -> str:
+    """
+    Resolve a logical channel (or a full MEXC stream name) to the subscription param.
+
+    ``interval`` only applies to depth, deals and book_ticker; other channels
+    have a single variant.
+    """
+    if "@" in channel:
+        return channel
+    if interval not in STREAM_INTERVALS:
+        raise ValueError(f"Unknown MEXC stream interval: {interval}")
+    template = _RAW_TEMPLATES.get(channel) if interval == "raw" else None
+    template = template or _CHANNEL_TEMPLATES.get(channel)
+    if template is None:
+        raise ValueError(f"Unknown MEXC channel: {channel}")
+    if "{symbol}" not in template:
+        return template
+    if not symbol:
+        raise ValueError(f"MEXC channel {channel} requires a symbol")
+    return template.format(symbol=symbol.replace("/", "").upper(), interval=interval)
+
+
+def decode_push_frame(frame: bytes) -> tuple[str, object | None]:
+    """Decode a binary push frame into its channel and the populated ``oneof body``."""
+    push = PushFrame(frame)
+    return push.channel, push.body()
+
+
+def _request(method: str, stream: str) -> str:
+    return json.dumps({"method": method, "params": [stream]})
+
+
+_PING = json.dumps({"method": "PING"})
+
+
+@dataclass(frozen=True)
+class _Delivery:
+    """What one subscriber wants from a frame: the body, some fields or the frame, maybe mapped."""
+
+    mapper: FrameMapper | None = None
+    fields: tuple[str, ...] | None = None
+    envelope: bool = False
+
+    def produce(self, frame: PushFrame) -> list:
+        if self.envelope:
+            value = frame
+        else:
+            value = frame.select(self.fields) if self.fields else frame.body()
+        return list(self.mapper(value)) if self.mapper else [value]
+
+
+def _route(data: bytes, channels: Container[str]) -> PushFrame | None:
+    """Return the frame if it carries a body for a subscribed channel, else None."""
+    channel = peek_channel(data)
+    if channel is not None and channel not in channels:
+        return None
+    frame = PushFrame(data)
+    if frame.body_number is None or frame.channel not in channels:
+        return None
+    return frame
+
+
+def _produce(delivery: _Delivery, frame: PushFrame) -> list | Exception:
+    """Items for one delivery, or the error that mapping this frame raised."""
+    try:
+        return delivery.produce(frame)
+    except Exception as error:
+        return error
+
+
+def _decode_batch(
+    frames: list[bytes], plan: dict[str, tuple[_Delivery, ...]]
+) -> tuple[list[tuple[PushFrame, dict[_Delivery, list | Exception]]], int]:
+    """
+    Route, decode and map frames for the planned deliveries; runs off the event loop.
+
+    Failures are contained per frame and per delivery, so one bad frame never
+    costs the rest of its batch.
+    """
+    decoded = []
+    skipped = 0
+    for data in frames:
+        try:
+            frame = _route(data, plan)
+        except Exception:
+            logger.warning("Dropping undecodable MEXC push frame (%d bytes)", len(data))
+            continue
+        if frame is None:
+            skipped += 1
+            continue
+        produced = {delivery: _produce(delivery, frame) for delivery in plan[frame.channel]}
+        decoded.append((frame, produced))
+    return decoded, skipped
+
+
+@dataclass
+class DecodeStats:
+    """Counters of the off-loop decode stage."""
+
+    frames: int = 0
+    batches: int = 0
+    dropped: int = 0
+    max_batch: int = 0
+    last_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    last_decode_ms: float = 0.0
+    max_decode_ms: float = 0.0
+
+
+@dataclass
+class StreamStats:
+    """
+    Per-stream delivery counters; ``gaps`` counts reconnects and stalls, and
+    ``mapping_errors`` frames dropped for a subscriber because mapping failed.
+    """
+
+    messages: int = 0
+    gaps: int = 0
+    mapping_errors: int = 0
+    last_message_at: float | None = None
+
+
+@dataclass
+class _Stream:
+    queues: dict[asyncio.Queue, _Delivery]
+    subscribed_at: float
+    stale_after: float | None = None
+    stats: StreamStats = field(default_factory=StreamStats)
+
+    def idle_for(self, now: float) -> float:
+        return now - max(self.subscribed_at, self.stats.last_message_at or 0.0)
 
 
 class MexcWebSocketClient:
     """
     Thin wrapper over MEXC V3 WebSocket transport.
 
-    This class is intentionally minimal; transport details (auth, ping/pong,
-    reconnect) can be layered later without leaking into Domain/Application.
+    Every subscription is multiplexed over one connection: the first consumer
+    of a stream sends SUBSCRIPTION, the last one to leave sends UNSUBSCRIPTION,
+    and binary ``PushDataV3ApiWrapper`` frames are routed by channel. Consumers
+    that fall ``queue_size`` frames behind lose the oldest ones.
+
+    The connection heals itself: it is PINGed every ``ping_interval`` seconds
+    and dropped when nothing (not even PONG) arrives for ``pong_timeout`` more;
+    it is then re-established with jittered exponential backoff capped at
+    ``max_reconnect_delay`` and every active stream is resubscribed. Streams
+    that declare ``stale_after`` are resubscribed when they go quiet for that
+    long. Reconnect listeners let consumers such as local order books resync.
+
+    Frames are routed by a peek at their channel: frames for streams nobody
+    subscribes to are dropped without decoding their body. Subscribers may
+    pass a ``mapper`` that turns each body into domain items, and ``fields``
+    to receive only those body fields. With ``decode_in_thread`` set, frames
+    are buffered (at most ``decode_queue_size``), decoded and mapped in
+    batches on a worker thread, then delivered in arrival order.
     """
 
+    def __init__(
+        self,
+        url: str = MEXC_WS_URL,
+        *,
+        connect: Callable[[str], Awaitable[Any]] | None = None,
+        queue_size: int = 1024,
+        ping_interval: float = 20.0,
+        pong_timeout: float = 10.0,
+        watchdog_interval: float = 1.0,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        decode_in_thread: bool = False,
+        decode_executor: Executor | None = None,
+        decode_queue_size: int = 10_000,
+        decode_batch_size: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._url = url
+        self._connect = connect or websockets.connect
+        self._queue_size = queue_size
+        self._ping_interval = ping_interval
+        self._pong_timeout = pong_timeout
+        self._watchdog_interval = watchdog_interval
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._clock = clock
+        self._streams: dict[str, _Stream] = {}
+        self._connection: Any = None
+        self._handover: Any = None
+        self._supervisor: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+        self._last_received = 0.0
+        self._connected_before = False
+        self._reconnect_listeners: list[Callable[[], None]] = []
+        self.reconnects = 0
+        self.skipped_frames = 0
+        self._offload = decode_in_thread or decode_executor is not None
+        self._executor = decode_executor
+        self._owns_executor = decode_executor is None
+        self._raw_frames: asyncio.Queue = asyncio.Queue(maxsize=decode_queue_size)
+        self._decode_batch_size = decode_batch_size
+        self._decoder: asyncio.Task | None = None
+        self.decode_stats = DecodeStats()
+
+    @property
+    def streams(self) -> list[str]:
+        return list(self._streams)
+
+    @property
+    def connected(self) -> bool:
+        return self._connection is not None
+
+    def add_reconnect_listener(self, listener: Callable[[], None]) -> None:
+        """Call ``listener`` after every reconnect, once streams are resubscribed."""
+        self._reconnect_listeners.append(listener)
+
+    def stats(self) -> dict[str, Any]:
+        now = self._clock()
+        stats: dict[str, Any] = {
+            "connected": self.connected,
+            "reconnects": self.reconnects,
+            "skipped_frames": self.skipped_frames,
+            "streams": {
+                name: {
+                    "messages": stream.stats.messages,
+                    "gaps": stream.stats.gaps,
+                    "mapping_errors": stream.stats.mapping_errors,
+                    "idle_seconds": round(stream.idle_for(now), 3),
+                    "queued": sum(queue.qsize() for queue in stream.queues),
+                }
+                for name, stream in self._streams.items()
+            },
+        }
+        if self._offload:
+            stats["decode"] = {"queued": self._raw_frames.qsize(), **vars(self.decode_stats)}
+        return stats
+
     async def subscribe(
-        self, channel: str, symbol: Optional[str] = None
+        self,
+        channel: str,
+        symbol: Optional[str] = None,
+        *,
+        interval: str = DEFAULT_INTERVAL,
+        stale_after: float | None = None,
+        mapper: FrameMapper | None = None,
+        fields: tuple[str, ...] | None = None,
+        envelope: bool = False,
     ) -> AsyncIterator[object]:
         """
-        Yield raw protobuf messages for the given channel.
+        Yield decoded protobuf messages for the given channel.
 
         Args:
-            channel: MEXC stream channel (e.g., depth, deals, orders).
-            symbol: Optional trading pair symbol when required by the stream.
+            channel: Logical channel (depth, deals, book_ticker, orders,
+                private_deals, balances) or a full MEXC stream name.
+            symbol: Trading pair symbol when required by the stream.
+            interval: ``raw``, ``10ms`` or ``100ms`` for depth, deals and
+                book_ticker.
+            stale_after: Resubscribe when the stream is silent this long.
+            mapper: Yield ``mapper(body)`` items instead of protobuf bodies;
+                must be thread-safe when decoding runs in a worker thread.
+            fields: Body field names to pass on as a dict (to ``mapper`` if
+                given) instead of the whole message, e.g. bid/ask prices only.
+            envelope: Pass the whole :class:`PushFrame` instead, for mappers
+                that need wrapper fields such as the symbol.
+        """
+        stream = stream_name(channel, symbol, interval)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        await self._attach(stream, queue, stale_after, _Delivery(mapper, fields, envelope))
+        try:
+            while True:
+                item = await queue.get()
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            await self._detach(stream, queue)
+
+    async def switch_url(self, url: str) -> None:
         """
-        raise NotImplementedError("WebSocket transport not wired yet.")
+        Move every active stream to ``url`` (e.g. a rotated listen key).
+
+        The new connection is opened and subscribed before the old one is
+        closed, so consumers see no gap; frames received on both connections
+        during the overlap may be delivered twice.
+        """
+        async with self._lock:
+            self._url = url
+            old = self._connection
+            if old is None:
+                return
+            connection = await self._connect(url)
+            for name in self._streams:
+                await connection.send(_request("SUBSCRIPTION", name))
+            self._handover = connection
+        with suppress(websockets.ConnectionClosed):
+            await old.close()
+
+    async def close(self) -> None:
+        async with self._lock:
+            error = ConnectionError("MEXC WebSocket client closed")
+            for stream in self._streams.values():
+                for queue in stream.queues:
+                    _offer(queue, error)
+            self._streams.clear()
+            await self._stop()
+
+    async def _attach(
+        self,
+        name: str,
+        queue: asyncio.Queue,
+        stale_after: float | None,
+        delivery: _Delivery,
+    ) -> None:
+        async with self._lock:
+            stream = self._streams.get(name)
+            if stream is None:
+                if len(self._streams) >= MAX_STREAMS_PER_CONNECTION:
+                    raise RuntimeError("MEXC allows at most 30 streams per connection")
+                stream = self._streams[name] = _Stream({}, self._clock())
+                if self._connection is not None:
+                    # On failure the supervisor resubscribes after reconnecting.
+                    with suppress(websockets.ConnectionClosed):
+                        await self._connection.send(_request("SUBSCRIPTION", name))
+            if stale_after is not None:
+                stream.stale_after = min(stale_after, stream.stale_after or stale_after)
+            stream.queues[queue] = delivery
+            if self._supervisor is None or self._supervisor.done():
+                self._supervisor = asyncio.create_task(self._supervise())
+            if self._offload and (self._decoder is None or self._decoder.done()):
+                self._decoder = asyncio.create_task(self._decode_loop())
+
+    async def _detach(self, name: str, queue: asyncio.Queue) -> None:
+        async with self._lock:
+            stream = self._streams.get(name)
+            if stream is None or queue not in stream.queues:
+                return
+            stream.queues.pop(queue, None)
+            if stream.queues:
+                return
+            del self._streams[name]
+            if self._connection is not None:
+                with suppress(websockets.ConnectionClosed):
+                    await self._connection.send(_request("UNSUBSCRIPTION", name))
+            if not self._streams:
+                await self._stop()
+
+    async def _stop(self) -> None:
+        for task in (self._supervisor, self._decoder):
+            if task is not None:
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+        self._supervisor = self._decoder = None
+        while not self._raw_frames.empty():
+            self._raw_frames.get_nowait()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        for connection in (self._connection, self._handover):
+            if connection is not None:
+                with suppress(Exception):
+                    await connection.close()
+        self._connection = self._handover = None
+        self._connected_before = False
+
+    async def _supervise(self) -> None:
+        failures = 0
+        while True:
+            connection, self._handover = self._handover, None
+            handed_over = connection is not None
+            opened_at = self._clock()
+            try:
+                if connection is None:
+                    connection = await self._connect(self._url)
+                async with self._lock:
+                    if not handed_over:
+                        for name, stream in self._streams.items():
+                            await connection.send(_request("SUBSCRIPTION", name))
+                            stream.subscribed_at = self._clock()
+                    self._connection = connection
+                if self._connected_before and not handed_over:
+                    self._on_reconnected()
+                self._connected_before = True
+                await self._serve(connection)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("MEXC WebSocket connection failed", exc_info=True)
+            finally:
+                if self._connection is connection:
+                    self._connection = None
+                if connection is not None:
+                    with suppress(Exception):
+                        await connection.close()
+            if self._handover is not None:
+                continue
+            if self._clock() - opened_at >= self._max_reconnect_delay:
+                failures = 0
+            failures += 1
+            await asyncio.sleep(self._backoff(failures))
+
+    def _backoff(self, failures: int) -> float:
+        delay = min(self._max_reconnect_delay, self._reconnect_delay * 2 ** (failures - 1))
+        return delay * (0.5 + random.random() / 2)
+
+    def _on_reconnected(self) -> None:
+        self.reconnects += 1
+        for stream in self._streams.values():
+            stream.stats.gaps += 1
+        logger.info("MEXC WebSocket reconnected; %d streams resubscribed", len(self._streams))
+        for listener in self._reconnect_listeners:
+            try:
+                listener()
+            except Exception:
+                logger.warning("Reconnect listener failed", exc_info=True)
+
+    async def _serve(self, connection: Any) -> None:
+        self._last_received = self._clock()
+        watchdog = asyncio.create_task(self._watchdog(connection))
+        try:
+            async for frame in connection:
+                self._last_received = self._clock()
+                if isinstance(frame, bytes) and self._offload:
+                    if self._raw_frames.full():
+                        self.decode_stats.dropped += 1
+                    _offer(self._raw_frames, (frame, self._last_received))
+                elif isinstance(frame, bytes):
+                    self._dispatch(frame)
+                else:
+                    self._handle_text(frame)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            watchdog.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await watchdog
+
+    async def _watchdog(self, connection: Any) -> None:
+        last_ping = self._clock()
+        while True:
+            await asyncio.sleep(self._watchdog_interval)
+            now = self._clock()
+            if now - self._last_received > self._ping_interval + self._pong_timeout:
+                logger.warning("MEXC WebSocket stalled; reconnecting")
+                await connection.close()
+                return
+            if now - last_ping >= self._ping_interval:
+                await connection.send(_PING)
+                last_ping = now
+            for name, stream in list(self._streams.items()):
+                if stream.stale_after is not None and stream.idle_for(now) > stream.stale_after:
+                    stream.stats.gaps += 1
+                    stream.subscribed_at = now
+                    logger.info("MEXC stream %s went quiet; resubscribing", name)
+                    await connection.send(_request("UNSUBSCRIPTION", name))
+                    await connection.send(_request("SUBSCRIPTION", name))
+
+    async def _decode_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mexc-decode")
+        stats = self.decode_stats
+        while True:
+            batch = [await self._raw_frames.get()]
+            while len(batch) < self._decode_batch_size and not self._raw_frames.empty():
+                batch.append(self._raw_frames.get_nowait())
+            started = self._clock()
+            plan = {
+                name: tuple(set(stream.queues.values())) for name, stream in self._streams.items()
+            }
+            try:
+                decoded, skipped = await loop.run_in_executor(
+                    self._executor, _decode_batch, [frame for frame, _ in batch], plan
+                )
+            except Exception:
+                logger.warning("Decoding %d MEXC frames failed", len(batch), exc_info=True)
+                continue
+            finished = self._clock()
+            self.skipped_frames += skipped
+            stats.frames += len(batch)
+            stats.batches += 1
+            stats.max_batch = max(stats.max_batch, len(batch))
+            stats.last_wait_ms = (started - batch[0][1]) * 1000
+            stats.max_wait_ms = max(stats.max_wait_ms, stats.last_wait_ms)
+            stats.last_decode_ms = (finished - started) * 1000
+            stats.max_decode_ms = max(stats.max_decode_ms, stats.last_decode_ms)
+            for frame, produced in decoded:
+                self._deliver(frame, produced)
+
+    def _dispatch(self, data: bytes) -> None:
+        try:
+            frame = _route(data, self._streams)
+        except Exception:
+            logger.warning("Dropping undecodable MEXC push frame (%d bytes)", len(data))
+            return
+        if frame is None:
+            self.skipped_frames += 1
+            return
+        self._deliver(frame, {})
+
+    def _deliver(self, frame: PushFrame, produced: dict[_Delivery, list | Exception]) -> None:
+        stream = self._streams.get(frame.channel)
+        if stream is None:
+            return
+        stream.stats.messages += 1
+        stream.stats.last_message_at = self._clock()
+        for queue, delivery in stream.queues.items():
+            items = produced.get(delivery)
+            if items is None:
+                items = produced[delivery] = _produce(delivery, frame)
+            if isinstance(items, Exception):
+                # Only this frame is lost, and only for the subscribers of this mapping.
+                stream.stats.mapping_errors += 1
+                logger.warning(
+                    "Dropping MEXC %s frame that failed to map",
+                    frame.channel,
+                    exc_info=(type(items), items, items.__traceback__),
+                )
+                produced[delivery] = []
+                continue
+            for item in items:
+                _offer(queue, item)
+
+    def _handle_text(self, frame: str) -> None:
+        try:
+            payload = json.loads(frame)
+        except ValueError:
+            logger.warning("Unexpected MEXC WebSocket text frame: %s", frame)
+            return
+        if payload.get("code", 0) != 0:
+            logger.warning("MEXC WebSocket error response: %s", payload)
+
+
+def _offer(queue: asyncio.Queue, item: object) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
@@ -0,0 +1,120 @@
+"""Lazy view of ``PushDataV3ApiWrapper`` frames: route by channel, decode on demand."""
+
+from typing import Any
+
+from google.protobuf import message_factory
+from google.protobuf.message import DecodeError, Message
+
+from src.app.infrastructure.exchange.mexc.generated import PushDataV3ApiWrapper_pb2
+
+_WRAPPER = PushDataV3ApiWrapper_pb2.PushDataV3ApiWrapper.DESCRIPTOR
+_BODY_FIELDS = {field.number: field for field in _WRAPPER.oneofs_by_name["body"].fields}
+_BODY_CLASSES = {
+    number: message_factory.GetMessageClass(field.message_type)
+    for number, field in _BODY_FIELDS.items()
+}
+_CHANNEL, _SYMBOL, _SEND_TIME = 1, 3, 6
+_VARINT, _FIXED64, _LENGTH, _FIXED32 = 0, 1, 2, 5
+
+
+def _varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        if pos >= len(data) or shift > 63:
+            raise DecodeError("Truncated varint in MEXC push frame")
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _skip(data: bytes, pos: int, wire_type: int) -> tuple[int, int]:
+    """Return the (start, end) span of the value at ``pos`` and the next position."""
+    if wire_type == _VARINT:
+        _, end = _varint(data, pos)
+    elif wire_type == _LENGTH:
+        length, pos = _varint(data, pos)
+        end = pos + length
+    elif wire_type == _FIXED64:
+        end = pos + 8
+    elif wire_type == _FIXED32:
+        end = pos + 4
+    else:
+        raise DecodeError(f"Unsupported wire type {wire_type} in MEXC push frame")
+    if end > len(data):
+        raise DecodeError("Truncated field in MEXC push frame")
+    return (pos, end), end
+
+
+def peek_channel(data: bytes) -> str | None:
+    """
+    Read the channel without parsing the rest of the frame.
+
+    Encoders write fields in number order, so ``channel`` (field 1) comes first;
+    None means the frame does not start with it and needs a full :class:`PushFrame`.
+    """
+    try:
+        key, pos = _varint(data, 0)
+        if key != (_CHANNEL << 3 | _LENGTH):
+            return None
+        (start, end), _ = _skip(data, pos, _LENGTH)
+        return data[start:end].decode()
+    except (DecodeError, UnicodeDecodeError):
+        return None
+
+
+class PushFrame:
+    """
+    Push frame whose envelope is scanned and whose body is decoded lazily.
+
+    Only the wrapper's top-level fields are walked; the ``oneof body`` bytes
+    are sliced out and parsed on first access, so frames that are routed
+    nowhere cost a short scan instead of a full protobuf decode.
+    """
+
+    __slots__ = ("channel", "symbol", "send_time", "body_number", "_data", "_span", "_body")
+
+    def __init__(self, data: bytes):
+        self._data = data
+        self.channel = ""
+        self.symbol: str | None = None
+        self.send_time: int | None = None
+        self.body_number: int | None = None
+        self._span: tuple[int, int] | None = None
+        self._body: Message | None = None
+        pos = 0
+        while pos < len(data):
+            key, pos = _varint(data, pos)
+            number, wire_type = key >> 3, key & 0x07
+            if number == 0:
+                raise DecodeError("Invalid field number in MEXC push frame")
+            span, pos = _skip(data, pos, wire_type)
+            if number in _BODY_FIELDS and wire_type == _LENGTH:
+                self.body_number, self._span = number, span
+            elif number == _CHANNEL and wire_type == _LENGTH:
+                self.channel = data[span[0] : span[1]].decode()
+            elif number == _SYMBOL and wire_type == _LENGTH:
+                self.symbol = data[span[0] : span[1]].decode()
+            elif number == _SEND_TIME and wire_type == _VARINT:
+                self.send_time = _varint(data, span[0])[0]
+
+    @property
+    def body_name(self) -> str | None:
+        """Name of the populated ``oneof body`` field, like ``WhichOneof("body")``."""
+        return _BODY_FIELDS[self.body_number].name if self.body_number else None
+
+    def body(self) -> Message | None:
+        if self._body is None and self._span is not None:
+            start, end = self._span
+            self._body = _BODY_CLASSES[self.body_number].FromString(self._data[start:end])
+        return self._body
+
+    def select(self, fields: tuple[str, ...]) -> dict[str, Any]:
+        """Return the requested body fields the body type actually has."""
+        body = self.body()
+        if body is None:
+            return {}
+        known = body.DESCRIPTOR.fields_by_name
+        return {name: getattr(body, name) for name in fields if name in known}
@@ -1,11 +0,0 @@
-"""
-MEXC WebSocket client placeholder.
-"""
-
-
-class MexcWebSocketClient:
-    def __init__(self):
-        # TODO: inject ws transport and serializer
-        pass
-
-    # TODO: methods to subscribe to ticker, depth, trades channels
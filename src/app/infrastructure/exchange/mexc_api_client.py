@@ -1,11 +1,11 @@
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Iterable
 
 from src.app.domain.entities.trading_pair import TradingPair
 from src.app.domain.value_objects.kline import KLine
 from src.app.domain.value_objects.price import Price
 from src.app.domain.value_objects.timestamp import Timestamp
+from src.app.infrastructure.exchange.mexc.mappers import klines_from_api
 from src.app.infrastructure.exchange.mexc.rest_client import MexcRestClient
 
 
@@ -33,15 +33,4 @@ class MexcApiClient:
 
     async def get_klines(self, pair: TradingPair, interval: str, limit: int = 100) -> list[KLine]:
         raw_list = await self._rest_client.klines(symbol=pair.symbol, interval=interval, limit=limit)
-        klines: list[KLine] = []
-        for item in raw_list:
-            if not isinstance(item, Iterable):
-                continue
-            open_time = int(item[0])
-            open_price = Decimal(item[1])
-            high = Decimal(item[2])
-            low = Decimal(item[3])
-            close = Decimal(item[4])
-            volume = Decimal(item[5])
-            klines.append(KLine.from_raw(open_price, high, low, close, volume, interval, open_time))
-        return klines
+        return klines_from_api(raw_list, interval)
@@ -0,0 +1,27 @@
+from .time_series_archive import (
+    KLINE_LAYOUT,
+    TRADE_LAYOUT,
+    Column,
+    Segment,
+    SeriesLayout,
+    TimeSeriesArchive,
+    default_layouts,
+    depth_layout,
+    depth_row,
+    kline_row,
+    trade_row,
+)
+
+__all__ = [
+    "Column",
+    "KLINE_LAYOUT",
+    "Segment",
+    "SeriesLayout",
+    "TRADE_LAYOUT",
+    "TimeSeriesArchive",
+    "default_layouts",
+    "depth_layout",
+    "depth_row",
+    "kline_row",
+    "trade_row",
+]
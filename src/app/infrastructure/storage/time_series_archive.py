@@ -0,0 +1,485 @@
+"""Append-only columnar archive of market data, read back through mmap."""
+
+import asyncio
+import logging
+import mmap
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+from src.app.domain.events.trade_event import TradeEvent
+from src.app.domain.value_objects.kline import KLine
+from src.app.domain.value_objects.kline_interval import interval_ms
+from src.app.domain.value_objects.order_book import OrderBook
+
+logger = logging.getLogger(__name__)
+
+DAY_MS = 86_400_000
+
+# Prices, quantities and volumes are all kept to 8 decimal places.
+PLACES = 8
+
+_ITEM_SIZE = array("q").itemsize
+
+
+@dataclass(frozen=True)
+class Column:
+    """An int64 column of ``width`` values per row, holding decimals scaled by ``10**places``."""
+
+    name: str
+    places: int = 0
+    width: int = 1
+
+    def encode(self, value: Decimal | int) -> int:
+        if not self.places:
+            return int(value)
+        return int(Decimal(value).scaleb(self.places).to_integral_value())
+
+    def decode(self, units: int) -> Decimal:
+        return Decimal(units).scaleb(-self.places)
+
+
+@dataclass(frozen=True)
+class SeriesLayout:
+    """Fixed-width record layout of one series; the first column is the epoch-ms ``time``."""
+
+    columns: tuple[Column, ...]
+
+    def __post_init__(self) -> None:
+        if not self.columns or self.columns[0].name != "time" or self.columns[0].width != 1:
+            raise ValueError("A series layout starts with a single-width 'time' column")
+
+    @property
+    def row_width(self) -> int:
+        return sum(column.width for column in self.columns)
+
+
+KLINE_LAYOUT = SeriesLayout(
+    (
+        Column("time"),
+        Column("open", PLACES),
+        Column("high", PLACES),
+        Column("low", PLACES),
+        Column("close", PLACES),
+        Column("volume", PLACES),
+    )
+)
+TRADE_LAYOUT = SeriesLayout(
+    (
+        Column("time"),
+        Column("price", PLACES),
+        Column("quantity", PLACES),
+        Column("buyer_maker"),
+    )
+)
+
+
+def depth_layout(levels: int) -> SeriesLayout:
+    """Top-``levels`` book snapshots, best level first, zero-padded when a side is shorter."""
+    return SeriesLayout(
+        (
+            Column("time"),
+            Column("bid_price", PLACES, levels),
+            Column("bid_quantity", PLACES, levels),
+            Column("ask_price", PLACES, levels),
+            Column("ask_quantity", PLACES, levels),
+        )
+    )
+
+
+_SCALED = Column("scaled", PLACES)
+
+
+def kline_row(kline: KLine) -> list[int]:
+    encode = _SCALED.encode
+    return [
+        int(kline.timestamp.value.timestamp() * 1000),
+        encode(kline.open),
+        encode(kline.high),
+        encode(kline.low),
+        encode(kline.close),
+        encode(kline.volume),
+    ]
+
+
+def trade_row(event: TradeEvent) -> list[int]:
+    return [
+        event.timestamp,
+        _SCALED.encode(event.price.last),
+        _SCALED.encode(event.quantity.value),
+        int(event.is_buyer_maker),
+    ]
+
+
+def depth_row(time_ms: int, book: OrderBook, levels: int) -> list[int]:
+    row = [time_ms]
+    for side in (book.bid_side, book.ask_side):
+        prices = [_SCALED.encode(price) for price in side.prices(levels)]
+        quantities = [_SCALED.encode(quantity) for quantity in side.quantities(levels)]
+        padding = [0] * (levels - len(prices))
+        row += prices + padding
+        row += quantities + padding
+    return row
+
+
+class Segment:
+    """
+    Rows of one day partition, as zero-copy int64 views of the mapped column files.
+
+    ``columns[name]`` holds ``width`` consecutive values per row. Every mapped
+    column keeps a file descriptor open until :meth:`close` (or the end of a
+    ``with`` block); after that the views must not be used.
+    """
+
+    __slots__ = ("layout", "columns", "rows", "_buffers")
+
+    def __init__(
+        self,
+        layout: SeriesLayout,
+        columns: dict[str, memoryview],
+        rows: int,
+        buffers: Sequence[mmap.mmap | memoryview] = (),
+    ):
+        self.layout = layout
+        self.columns = columns
+        self.rows = rows
+        # Mappings and the views over them, in the order they were created.
+        self._buffers = list(buffers)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __enter__(self) -> "Segment":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def slice(self, lo: int, hi: int) -> "Segment":
+        """Rows ``lo:hi`` as a segment that takes over this one's mappings."""
+        columns = {
+            c.name: self.columns[c.name][lo * c.width:hi * c.width] for c in self.layout.columns
+        }
+        buffers, self._buffers = self._buffers + list(self.columns.values()), []
+        return Segment(self.layout, columns, hi - lo, buffers)
+
+    def close(self) -> None:
+        """Release the views and unmap the column files."""
+        buffers, self._buffers = [*self._buffers, *self.columns.values()], []
+        for buffer in reversed(buffers):
+            # Views handed out to callers keep their mapping alive until collected.
+            with suppress(BufferError):
+                buffer.release() if isinstance(buffer, memoryview) else buffer.close()
+
+    @property
+    def times(self) -> memoryview:
+        return self.columns["time"]
+
+    def value(self, name: str, row: int) -> Decimal | list[Decimal]:
+        column = next(c for c in self.layout.columns if c.name == name)
+        view = self.columns[name]
+        if column.width == 1:
+            return column.decode(view[row])
+        start = row * column.width
+        return [column.decode(units) for units in view[start:start + column.width]]
+
+
+def _resample(segments: Iterable[Segment], ms: int) -> list[list[int]]:
+    """
+    OHLCV buckets of ``ms``, folded from contiguous slices of the column views.
+
+    Each segment is closed once folded, so only one partition is mapped at a time.
+    """
+    buckets: list[list[int]] = []
+    for segment in segments:
+        with segment:
+            _fold(segment, ms, buckets)
+    return buckets
+
+
+def _fold(segment: Segment, ms: int, buckets: list[list[int]]) -> None:
+    times, opens, highs, lows, closes, volumes = (
+        segment.columns[name] for name in ("time", "open", "high", "low", "close", "volume")
+    )
+    start = 0
+    while start < segment.rows:
+        bucket = times[start] - times[start] % ms
+        stop = bisect_left(times, bucket + ms, start, segment.rows)
+        high, low = max(highs[start:stop]), min(lows[start:stop])
+        volume = sum(volumes[start:stop])
+        if buckets and buckets[-1][0] == bucket:  # spans two day partitions
+            last = buckets[-1]
+            last[2], last[3] = max(last[2], high), min(last[3], low)
+            last[4], last[5] = closes[stop - 1], last[5] + volume
+        else:
+            buckets.append([bucket, opens[start], high, low, closes[stop - 1], volume])
+        start = stop
+
+
+class TimeSeriesArchive:
+    """
+    Market data kept on disk as one int64 file per column per series, symbol and UTC day.
+
+    ``append`` only buffers the row in memory, so it is safe to call from the
+    event loop; a background task writes the buffer out with ``to_thread``
+    every ``flush_interval`` seconds, or sooner once ``flush_rows`` rows are
+    pending. When the disk cannot keep up, rows beyond ``max_pending_rows``
+    are dropped and counted rather than growing the buffer without bound.
+
+    Reads map the column files and return :class:`Segment` views, so range
+    queries bisect the time column and resampling folds slices of the views
+    without decoding records one by one. Reads touch the disk; call them from
+    a worker thread on a busy event loop. Rows still buffered are not visible
+    until flushed.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        layouts: dict[str, SeriesLayout],
+        *,
+        flush_interval: float = 1.0,
+        flush_rows: int = 10_000,
+        max_pending_rows: int = 100_000,
+    ):
+        self._root = Path(root)
+        self._layouts = dict(layouts)
+        self._flush_interval = flush_interval
+        self._flush_rows = flush_rows
+        self._max_pending_rows = max_pending_rows
+        self._pending: dict[tuple[str, str, int], list[array]] = {}
+        self._pending_rows = 0
+        # Rows every column of a partition holds, as of the last complete write.
+        self._rows: dict[Path, int] = {}
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self.appended = 0
+        self.written = 0
+        self.dropped = 0
+        self.write_errors = 0
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def pending_rows(self) -> int:
+        return self._pending_rows
+
+    def layout(self, series: str) -> SeriesLayout:
+        try:
+            return self._layouts[series]
+        except KeyError:
+            raise ValueError(f"Unknown archive series: {series}") from None
+
+    def append(self, series: str, symbol: str, row: Sequence[int]) -> bool:
+        """
+        Buffer one encoded row; return False if it was dropped because the buffer is full.
+
+        Rows of a series are expected in time order, which range reads rely on.
+        """
+        layout = self.layout(series)
+        if len(row) != layout.row_width:
+            raise ValueError(f"{series} rows have {layout.row_width} values, got {len(row)}")
+        if self._pending_rows >= self._max_pending_rows:
+            self.dropped += 1
+            return False
+        key = (series, symbol, row[0] // DAY_MS)
+        buffers = self._pending.get(key)
+        if buffers is None:
+            buffers = self._pending[key] = [array("q") for _ in layout.columns]
+        offset = 0
+        for buffer, column in zip(buffers, layout.columns):
+            if column.width == 1:
+                buffer.append(row[offset])
+            else:
+                buffer.extend(row[offset:offset + column.width])
+            offset += column.width
+        self._pending_rows += 1
+        self.appended += 1
+        if self._pending_rows >= self._flush_rows:
+            self._wake.set()
+        return True
+
+    async def flush(self) -> None:
+        """Write every buffered row to disk on a worker thread."""
+        async with self._flush_lock:
+            batch, self._pending = self._pending, {}
+            rows, self._pending_rows = self._pending_rows, 0
+            if not batch:
+                return
+            try:
+                await asyncio.to_thread(self._write, batch)
+            except Exception:
+                self.write_errors += 1
+                raise
+            self.written += rows
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the background writer and flush what is still buffered."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        try:
+            await self.flush()
+        except Exception:
+            logger.warning("Final archive flush failed", exc_info=True)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self._flush_interval)
+            self._wake.clear()
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Archive flush failed; buffered rows were lost", exc_info=True)
+
+    def _partition(self, series: str, symbol: str, day: int) -> Path:
+        date = datetime.fromtimestamp(day * DAY_MS / 1000, tz=timezone.utc)
+        return self._root / series / symbol / date.strftime("%Y-%m-%d")
+
+    def _write(self, batch: dict[tuple[str, str, int], list[array]]) -> None:
+        for (series, symbol, day), buffers in batch.items():
+            layout = self._layouts[series]
+            path = self._partition(series, symbol, day)
+            rows = self._rows.get(path)
+            if rows is None:
+                path.mkdir(parents=True, exist_ok=True)
+                rows = self._align(path, layout)
+            # Writing at the committed row count drops whatever a failed write left behind.
+            for column, buffer in zip(layout.columns, buffers):
+                with open(path / f"{column.name}.i64", "ab") as file:
+                    file.truncate(rows * column.width * _ITEM_SIZE)
+                    buffer.tofile(file)
+            self._rows[path] = rows + len(buffers[0])
+
+    @staticmethod
+    def _align(path: Path, layout: SeriesLayout) -> int:
+        """Cut columns back to the rows every column has, after an interrupted write."""
+        files = [(path / f"{c.name}.i64", c.width * _ITEM_SIZE) for c in layout.columns]
+        sizes = [(f.stat().st_size if f.exists() else 0, size) for f, size in files]
+        rows = min(length // size for length, size in sizes)
+        for (file, size), (length, _) in zip(files, sizes):
+            if length != rows * size:
+                logger.warning("Truncating torn archive column %s to %d rows", file, rows)
+                with open(file, "ab") as handle:
+                    handle.truncate(rows * size)
+        return rows
+
+    def read(self, series: str, symbol: str, start: int, end: int) -> Iterator[Segment]:
+        """
+        Flushed rows with ``start <= time <= end``, one :class:`Segment` per day.
+
+        Partitions are mapped one at a time as the iterator advances; close
+        each segment once done with it so long ranges do not hold a file
+        descriptor per column per day.
+        """
+        layout = self.layout(series)
+        for day in range(start // DAY_MS, end // DAY_MS + 1):
+            segment = self._map(layout, self._partition(series, symbol, day))
+            if segment is None:
+                continue
+            times = segment.times
+            lo = bisect_left(times, start, 0, segment.rows)
+            hi = bisect_right(times, end, lo, segment.rows)
+            if lo < hi:
+                yield segment.slice(lo, hi)
+            else:
+                segment.close()
+
+    def last_time(self, series: str, symbol: str) -> int | None:
+        """Time of the newest flushed row of a series, if any."""
+        layout = self.layout(series)
+        directory = self._root / series / symbol
+        if not directory.is_dir():
+            return None
+        for name in sorted(os.listdir(directory), reverse=True):
+            segment = self._map(layout, directory / name)
+            if segment is None:
+                continue
+            with segment:
+                if segment.rows:
+                    return segment.times[segment.rows - 1]
+        return None
+
+    @staticmethod
+    def _map(layout: SeriesLayout, path: Path) -> Segment | None:
+        views: dict[str, memoryview] = {}
+        buffers: list[mmap.mmap | memoryview] = []
+        rows = None
+        for column in layout.columns:
+            try:
+                with open(path / f"{column.name}.i64", "rb") as file:
+                    if os.fstat(file.fileno()).st_size < _ITEM_SIZE:
+                        mapped = None
+                    else:
+                        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except FileNotFoundError:
+                mapped = None
+            if mapped is None:
+                Segment(layout, views, 0, buffers).close()
+                return None
+            raw = memoryview(mapped)
+            trimmed = raw[: len(raw) - len(raw) % _ITEM_SIZE]
+            buffers += [mapped, raw, trimmed]
+            view = views[column.name] = trimmed.cast("q")
+            count = len(view) // column.width
+            rows = count if rows is None else min(rows, count)
+        return Segment(layout, views, rows or 0, buffers)
+
+    def klines(
+        self,
+        symbol: str,
+        start: int,
+        end: int,
+        interval: str = "1m",
+        *,
+        source: str = "1m",
+    ) -> list[KLine]:
+        """
+        Archived ``source`` candles opening in ``[start, end]``, resampled to ``interval``.
+
+        A bucket is only as complete as the candles archived for it.
+        """
+        target = interval_ms(interval)
+        if target % interval_ms(source):
+            raise ValueError(f"{interval} is not a multiple of {source}")
+        segments = self.read(f"klines_{source}", symbol, start - start % target, end)
+        decode = _SCALED.decode
+        return [
+            KLine.from_raw(
+                decode(open_),
+                decode(high),
+                decode(low),
+                decode(close),
+                decode(volume),
+                interval,
+                bucket,
+            )
+            for bucket, open_, high, low, close, volume in _resample(segments, target)
+            if bucket >= start
+        ]
+
+
+def default_layouts(depth_levels: int = 20) -> dict[str, SeriesLayout]:
+    return {
+        "klines_1m": KLINE_LAYOUT,
+        "trades": TRADE_LAYOUT,
+        f"depth_{depth_levels}": depth_layout(depth_levels),
+    }
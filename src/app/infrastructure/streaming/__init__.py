@@ -0,0 +1,17 @@
+from .broadcast_hub import (
+    BroadcastHub,
+    ConflatingSubscriber,
+    OverflowPolicy,
+    SlowConsumerError,
+    Subscriber,
+)
+from .conflation import LatestValueMailbox
+
+__all__ = [
+    "BroadcastHub",
+    "ConflatingSubscriber",
+    "LatestValueMailbox",
+    "OverflowPolicy",
+    "SlowConsumerError",
+    "Subscriber",
+]
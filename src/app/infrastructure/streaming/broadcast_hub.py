@@ -0,0 +1,241 @@
+"""Fan one upstream stream per key out to many bounded downstream subscribers."""
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Hashable
+
+from src.app.infrastructure.streaming.conflation import LatestValueMailbox
+
+logger = logging.getLogger(__name__)
+
+StreamSource = Callable[[], AsyncIterator[Any]]
+
+
+class OverflowPolicy(str, Enum):
+    """What a full subscriber queue does with the next item."""
+
+    DROP_OLDEST = "drop_oldest"
+    CONFLATE = "conflate"
+    DISCONNECT = "disconnect"
+
+
+class SlowConsumerError(Exception):
+    """Raised to a subscriber removed by the ``DISCONNECT`` overflow policy."""
+
+
+class Subscriber:
+    """
+    Bounded mailbox of one downstream consumer.
+
+    ``offer`` never blocks: on overflow the oldest item is dropped, every
+    pending item is replaced by the newest one (conflate), or the subscriber
+    is failed with :class:`SlowConsumerError`.
+    """
+
+    def __init__(self, maxsize: int, policy: OverflowPolicy):
+        if maxsize <= 0:
+            raise ValueError("Subscriber queue size must be positive")
+        self._items: deque = deque()
+        self._maxsize = maxsize
+        self._policy = policy
+        self._ready = asyncio.Event()
+        self._error: BaseException | None = None
+        self.delivered = 0
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._items)
+
+    def offer(self, item: Any) -> None:
+        if self._error is not None:
+            return
+        if len(self._items) >= self._maxsize:
+            if self._policy is OverflowPolicy.DISCONNECT:
+                self.fail(SlowConsumerError(f"Subscriber fell {self._maxsize} items behind"))
+                return
+            if self._policy is OverflowPolicy.CONFLATE:
+                self.dropped += len(self._items)
+                self._items.clear()
+            else:
+                self._items.popleft()
+                self.dropped += 1
+        self._items.append(item)
+        self._ready.set()
+
+    def fail(self, error: BaseException) -> None:
+        """Discard pending items and raise ``error`` from the next :meth:`get`."""
+        self._error = error
+        self._items.clear()
+        self._ready.set()
+
+    async def get(self) -> Any:
+        while not self._items:
+            if self._error is not None:
+                raise self._error
+            self._ready.clear()
+            await self._ready.wait()
+        self.delivered += 1
+        return self._items.popleft()
+
+
+class ConflatingSubscriber:
+    """Subscriber that only keeps the newest pending item per ``key(item)``."""
+
+    def __init__(self, key: Callable[[Any], Hashable]):
+        self._key = key
+        self._mailbox: LatestValueMailbox = LatestValueMailbox()
+
+    @property
+    def pending(self) -> int:
+        return self._mailbox.pending
+
+    @property
+    def delivered(self) -> int:
+        return self._mailbox.delivered
+
+    @property
+    def dropped(self) -> int:
+        return self._mailbox.conflated
+
+    def offer(self, item: Any) -> None:
+        self._mailbox.put(self._key(item), item)
+
+    def fail(self, error: BaseException) -> None:
+        self._mailbox.fail(error)
+
+    async def get(self) -> Any:
+        _, item = await self._mailbox.get()
+        return item
+
+
+@dataclass
+class _Channel:
+    source: StreamSource
+    subscribers: set[Subscriber | ConflatingSubscriber] = field(default_factory=set)
+    task: asyncio.Task | None = None
+    published: int = 0
+
+
+class BroadcastHub:
+    """
+    Share one upstream subscription per key among any number of consumers.
+
+    The first subscriber of a key starts ``source()``; every item it yields is
+    offered to all subscribers of that key, each with its own bounded queue,
+    so a slow consumer only ever loses its own items. The upstream is closed
+    when the last subscriber leaves, and an upstream failure is raised to all
+    of its subscribers.
+    """
+
+    def __init__(
+        self, *, queue_size: int = 256, policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    ):
+        self._queue_size = queue_size
+        self._policy = OverflowPolicy(policy)
+        self._channels: dict[Hashable, _Channel] = {}
+
+    @property
+    def keys(self) -> list[Hashable]:
+        return list(self._channels)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            str(key): {
+                "subscribers": len(channel.subscribers),
+                "published": channel.published,
+                "pending": sum(s.pending for s in channel.subscribers),
+                "dropped": sum(s.dropped for s in channel.subscribers),
+            }
+            for key, channel in self._channels.items()
+        }
+
+    async def subscribe(
+        self,
+        key: Hashable,
+        source: StreamSource,
+        *,
+        policy: OverflowPolicy | None = None,
+        queue_size: int | None = None,
+        conflate: Callable[[Any], Hashable] | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Yield the items of the shared ``key`` stream.
+
+        Args:
+            key: Identity of the upstream, e.g. ``("book_ticker", "QRLUSDT")``.
+            source: Opens the upstream; only called by the first subscriber.
+            policy: Overflow policy for this subscriber (hub default if None).
+            queue_size: Queue bound for this subscriber (hub default if None).
+            conflate: For latest-wins data, keep only the newest pending item
+                per ``conflate(item)`` instead of queueing; overrides ``policy``.
+
+        Raises:
+            SlowConsumerError: if the ``DISCONNECT`` policy dropped the subscriber.
+        """
+        subscriber: Subscriber | ConflatingSubscriber
+        if conflate is not None:
+            subscriber = ConflatingSubscriber(conflate)
+        else:
+            subscriber = Subscriber(queue_size or self._queue_size, policy or self._policy)
+        self._attach(key, source, subscriber)
+        try:
+            while True:
+                yield await subscriber.get()
+        finally:
+            await self._detach(key, subscriber)
+
+    async def close(self) -> None:
+        channels, self._channels = self._channels, {}
+        for channel in channels.values():
+            for subscriber in channel.subscribers:
+                subscriber.fail(ConnectionError("Broadcast hub closed"))
+            await _cancel(channel.task)
+
+    def _attach(
+        self, key: Hashable, source: StreamSource, subscriber: Subscriber | ConflatingSubscriber
+    ) -> None:
+        channel = self._channels.get(key)
+        if channel is None:
+            channel = self._channels[key] = _Channel(source)
+            channel.task = asyncio.create_task(self._pump(key, channel))
+        channel.subscribers.add(subscriber)
+
+    async def _detach(
+        self, key: Hashable, subscriber: Subscriber | ConflatingSubscriber
+    ) -> None:
+        channel = self._channels.get(key)
+        if channel is None or subscriber not in channel.subscribers:
+            return
+        channel.subscribers.discard(subscriber)
+        if not channel.subscribers:
+            del self._channels[key]
+            await _cancel(channel.task)
+
+    async def _pump(self, key: Hashable, channel: _Channel) -> None:
+        try:
+            async for item in channel.source():
+                channel.published += 1
+                for subscriber in tuple(channel.subscribers):
+                    subscriber.offer(item)
+            error: Exception = ConnectionError(f"Upstream {key} ended")
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Upstream %s failed", key, exc_info=True)
+            error = exc
+        if self._channels.get(key) is channel:
+            del self._channels[key]
+        for subscriber in channel.subscribers:
+            subscriber.fail(error)
+
+
+async def _cancel(task: asyncio.Task | None) -> None:
+    if task is not None and not task.done():
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
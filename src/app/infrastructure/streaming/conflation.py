@@ -0,0 +1,63 @@
+"""Latest-value-wins delivery for ticker, book-ticker and order-book snapshots."""
+
+import asyncio
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LatestValueMailbox(Generic[K, V]):
+    """
+    Per-consumer mailbox that keeps only the newest pending value per key.
+
+    A burst of ``put`` calls for one key costs one slot and wakes the consumer
+    once, so memory stays flat however far the consumer falls behind. Keys are
+    delivered in the order they first became pending.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[K, V] = {}
+        self._ready = asyncio.Event()
+        self._error: BaseException | None = None
+        self.delivered = 0
+        self.conflated = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def put(self, key: K, value: V) -> None:
+        if self._error is not None:
+            return
+        if key in self._pending:
+            self.conflated += 1
+        self._pending[key] = value
+        self._ready.set()
+
+    def fail(self, error: BaseException) -> None:
+        """Discard pending values and raise ``error`` from the next read."""
+        self._error = error
+        self._pending.clear()
+        self._ready.set()
+
+    async def get(self) -> tuple[K, V]:
+        """Return the oldest pending key with its newest value."""
+        await self._wait()
+        key = next(iter(self._pending))
+        self.delivered += 1
+        return key, self._pending.pop(key)
+
+    async def get_all(self) -> dict[K, V]:
+        """Return every pending key with its newest value."""
+        await self._wait()
+        batch, self._pending = self._pending, {}
+        self.delivered += len(batch)
+        return batch
+
+    async def _wait(self) -> None:
+        while not self._pending:
+            if self._error is not None:
+                raise self._error
+            self._ready.clear()
+            await self._ready.wait()
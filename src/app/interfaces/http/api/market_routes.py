@@ -1,15 +1,30 @@
-from fastapi import APIRouter, Depends, Query
+import asyncio
+from decimal import Decimal, InvalidOperation
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from src.app.application.market.use_cases.get_depth import GetDepthInput, GetDepthUseCase
-from src.app.application.market.use_cases.get_kline import GetKlineInput, GetKlineUseCase
+from src.app.application.market.use_cases.get_market_impact import (
+    GetMarketImpactInput,
+    GetMarketImpactUseCase,
+)
+from src.app.application.market.use_cases.get_kline import (
+    GetKlineInput,
+    GetKlineUseCase,
+    _serialize_kline,
+)
 from src.app.application.market.use_cases.get_market_trades import GetMarketTradesInput, GetMarketTradesUseCase
 from src.app.application.market.use_cases.get_stats24h import GetStats24hUseCase
 from src.app.application.market.use_cases.get_ticker import GetTickerUseCase
 from src.app.application.ports.exchange_service import ExchangeServiceFactory
-from src.app.interfaces.http.dependencies import get_exchange_factory
+from src.app.domain.value_objects.kline_interval import interval_ms
+from src.app.interfaces.http.dependencies import get_exchange_factory, get_time_series_archive
 
 router = APIRouter()
 
+# Same cap as a REST klines page.
+_MAX_ARCHIVED_KLINES = 1000
+
 
 @router.get("/depth")
 async def get_depth(
@@ -21,6 +36,24 @@ async def get_depth(
     return await usecase.execute(data=GetDepthInput(limit=limit))
 
 
+@router.get("/impact")
+async def get_market_impact(
+    side: str = Query(default="BUY", pattern="^(BUY|SELL|buy|sell)$"),
+    sizes: str = Query(default="100,1000,10000", description="Comma-separated QRL quantities"),
+    limit: int = Query(default=1000, ge=5, le=5000),
+    exchange_factory: ExchangeServiceFactory = Depends(get_exchange_factory),
+):
+    """Get fill/VWAP/slippage estimates for several QRL/USDT order sizes."""
+    try:
+        targets = [Decimal(item) for item in sizes.split(",") if item.strip()]
+    except InvalidOperation:
+        targets = []
+    if not 0 < len(targets) <= 50 or not all(t.is_finite() and t > 0 for t in targets):
+        raise HTTPException(status_code=422, detail="sizes must hold 1-50 positive numbers")
+    usecase = GetMarketImpactUseCase(exchange_factory)
+    return await usecase.execute(data=GetMarketImpactInput(side=side, sizes=targets, limit=limit))
+
+
 @router.get("/ticker")
 async def get_ticker(exchange_factory: ExchangeServiceFactory = Depends(get_exchange_factory)):
     """Get ticker for QRL/USDT."""
@@ -39,6 +72,31 @@ async def get_kline(
     return await usecase.execute(data=GetKlineInput(interval=interval, limit=limit))
 
 
+@router.get("/archive/klines")
+async def get_archived_klines(
+    start_time: int = Query(ge=0, description="Epoch milliseconds"),
+    end_time: int = Query(ge=0),
+    interval: str = Query(default="1m"),
+    archive=Depends(get_time_series_archive),
+):
+    """Archived QRL/USDT candles opening in the range, resampled from the 1m series."""
+    if archive is None:
+        raise HTTPException(status_code=404, detail="Time-series archive is not enabled")
+    try:
+        buckets = (end_time - start_time) // interval_ms(interval) + 1
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if not 0 < buckets <= _MAX_ARCHIVED_KLINES:
+        raise HTTPException(
+            status_code=422, detail=f"range must span 1-{_MAX_ARCHIVED_KLINES} candles"
+        )
+    try:
+        klines = await asyncio.to_thread(archive.klines, "QRLUSDT", start_time, end_time, interval)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return [_serialize_kline(kline) for kline in klines]
+
+
 @router.get("/stats24h")
 async def get_stats_24h(exchange_factory: ExchangeServiceFactory = Depends(get_exchange_factory)):
     """Get 24h statistics for QRL/USDT."""
@@ -1,18 +1,13 @@
-import asyncio
-
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from src.app.application.market.qrl.get_qrl_depth import GetQrlDepth
 from src.app.application.market.qrl.get_qrl_kline import GetQrlKline
 from src.app.application.market.qrl.get_qrl_price import GetQrlPrice
-from src.app.application.market.use_cases.get_market_trades import GetMarketTradesUseCase
+from src.app.application.market.qrl.get_qrl_summary import GetQrlSummary
 from src.app.application.ports.exchange_service import ExchangeServiceFactory
 from src.app.application.trading.qrl.cancel_qrl_order import CancelQrlOrder
 from src.app.application.trading.qrl.get_qrl_order import GetQrlOrder
 from src.app.application.trading.qrl.place_qrl_order import PlaceQrlOrder
-from src.app.application.account.use_cases.get_balance import GetBalanceUseCase
-from src.app.application.trading.use_cases.list_orders import ListOrdersUseCase
-from src.app.application.trading.use_cases.list_trades import ListTradesUseCase
 from src.app.interfaces.http.dependencies import get_exchange_factory
 from src.app.interfaces.http.schemas import PlaceOrderRequest
 
@@ -97,34 +92,25 @@ async def qrl_summary(
     exchange_factory: ExchangeServiceFactory = Depends(get_exchange_factory),
 ):
     """Aggregate price, kline, depth, and balance for dashboard consumption."""
-    price_uc = GetQrlPrice(exchange_factory)
-    kline_uc = GetQrlKline(exchange_factory, interval=interval, limit=kline_limit)
-    depth_uc = GetQrlDepth(exchange_factory, limit=depth_limit)
-    balance_uc = GetBalanceUseCase(exchange_factory)
-    orders_uc = ListOrdersUseCase(exchange_factory)
-    trades_uc = ListTradesUseCase(exchange_factory)
-    market_trades_uc = GetMarketTradesUseCase(exchange_factory)
-
-    price_result, kline_result, depth_result, balance_result, orders, trades, market_trades = await asyncio.gather(
-        price_uc.execute(),
-        kline_uc.execute(),
-        depth_uc.execute(),
-        balance_uc.execute(),
-        orders_uc.execute(symbol="QRLUSDT"),
-        trades_uc.execute("QRLUSDT"),
-        market_trades_uc.execute(),
+    usecase = GetQrlSummary(
+        exchange_factory,
+        interval=interval,
+        kline_limit=kline_limit,
+        depth_limit=depth_limit,
+        trades_limit=trades_limit,
     )
+    summary = await usecase.execute()
 
     normalized_klines = [
         {"timestamp": item[0], "open": item[1], "high": item[2], "low": item[3], "close": item[4], "volume": item[5]}
-        for item in kline_result
+        for item in summary.klines
     ]
     return {
-        "price": price_result.to_dict(),
+        "price": summary.price.to_dict(),
         "klines": normalized_klines,
-        "depth": depth_result,
-        "balance": balance_result,
-        "orders": orders,
-        "trades": trades,
-        "market_trades": market_trades[:trades_limit],
+        "depth": summary.depth,
+        "balance": summary.balance,
+        "orders": summary.orders,
+        "trades": summary.trades,
+        "market_trades": summary.market_trades,
     }
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from src.app.application.ports.exchange_service import ExchangeServiceFactory
 from src.app.application.system.use_cases.get_server_time import GetServerTimeUseCase
 from src.app.application.system.use_cases.ping import PingUseCase
-from src.app.interfaces.http.dependencies import get_exchange_factory
+from src.app.interfaces.http.dependencies import (
+    get_exchange_factory,
+    get_local_order_books,
+    get_ws_stream_stats,
+)
 
 router = APIRouter()
 
@@ -20,3 +26,20 @@ async def get_server_time(exchange_factory: ExchangeServiceFactory = Depends(get
     """Get server time."""
     usecase = GetServerTimeUseCase(exchange_factory)
     return await usecase.execute()
+
+
+@router.get("/streams")
+async def get_stream_stats():
+    """WebSocket reconnect counts and per-stream message/gap counters."""
+    return get_ws_stream_stats()
+
+
+@router.put("/streams/local-book")
+async def set_local_book_interval(interval: Literal["raw", "10ms", "100ms"] = Query(...)):
+    """Move the local order books to another depth aggregation interval."""
+    books = get_local_order_books()
+    if not books:
+        raise HTTPException(status_code=404, detail="Local order book is not enabled")
+    for book in books:
+        await book.set_interval(interval)
+    return {book.symbol.value: book.interval for book in books}
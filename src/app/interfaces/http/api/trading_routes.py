@@ -1,12 +1,16 @@
+import json
 from decimal import Decimal
+from typing import AsyncIterator
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from src.app.application.ports.exchange_service import ExchangeServiceFactory
 from src.app.application.trading.use_cases.cancel_order import CancelOrderInput, CancelOrderUseCase
 from src.app.application.trading.use_cases.get_order import GetOrderInput, GetOrderUseCase
 from src.app.application.trading.use_cases.list_orders import ListOrdersUseCase
 from src.app.application.trading.use_cases.list_trades import ListTradesUseCase
 from src.app.application.trading.use_cases.place_order import PlaceOrderInput, PlaceOrderUseCase
+from src.app.domain.value_objects.history_cursor import HistoryCursor
 from src.app.interfaces.http.dependencies import get_exchange_factory
 from src.app.interfaces.http.schemas import (
     PlaceOrderRequest,
@@ -16,6 +20,32 @@ from src.app.interfaces.http.schemas import (
 router = APIRouter()
 
 
+async def _ndjson(first: dict, rows: AsyncIterator[dict]) -> AsyncIterator[str]:
+    yield json.dumps(first) + "\n"
+    async for row in rows:
+        yield json.dumps(row) + "\n"
+
+
+def _history_start(start_time: int | None, cursor: str | None) -> int | HistoryCursor:
+    if cursor is not None:
+        try:
+            return HistoryCursor.from_token(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if start_time is None:
+        raise HTTPException(status_code=422, detail="start_time or cursor is required")
+    return start_time
+
+
+async def _history_response(rows: AsyncIterator[dict]) -> StreamingResponse:
+    # The first row is read up front so a rejected range is a 422, not a broken stream.
+    try:
+        first = await anext(rows)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return StreamingResponse(_ndjson(first, rows), media_type="application/x-ndjson")
+
+
 @router.post("/orders")
 async def place_order(
     request: PlaceOrderRequest, exchange_factory: ExchangeServiceFactory = Depends(get_exchange_factory)
@@ -46,6 +76,24 @@ async def cancel_order(
     return await usecase.execute(data)
 
 
+@router.get("/orders/history")
+async def order_history(
+    start_time: int | None = Query(default=None, ge=0, description="Epoch milliseconds"),
+    end_time: int | None = Query(default=None, ge=0),
+    cursor: str | None = Query(default=None, description="Resume after a previous response"),
+    symbol: str = Query(default="QRLUSDT"),
+    exchange_factory: ExchangeServiceFactory = Depends(get_exchange_factory),
+):
+    """
+    Stream every order created in the range as newline-delimited JSON, oldest first.
+
+    The last record is ``{"cursor": ...}``; pass it back as ``cursor`` to resume.
+    """
+    usecase = ListOrdersUseCase(exchange_factory)
+    rows = usecase.history(symbol, _history_start(start_time, cursor), end_time)
+    return await _history_response(rows)
+
+
 @router.get("/orders/{order_id}")
 async def get_order(
     order_id: str,
@@ -76,3 +124,21 @@ async def list_trades(
     """List recent trades."""
     usecase = ListTradesUseCase(exchange_factory)
     return await usecase.execute(symbol)
+
+
+@router.get("/trades/history")
+async def trade_history(
+    start_time: int | None = Query(default=None, ge=0, description="Epoch milliseconds"),
+    end_time: int | None = Query(default=None, ge=0),
+    cursor: str | None = Query(default=None, description="Resume after a previous response"),
+    symbol: str = Query(default="QRLUSDT"),
+    exchange_factory: ExchangeServiceFactory = Depends(get_exchange_factory),
+):
+    """
+    Stream every trade in the range as newline-delimited JSON, oldest first.
+
+    The last record is ``{"cursor": ...}``; pass it back as ``cursor`` to resume.
+    """
+    usecase = ListTradesUseCase(exchange_factory)
+    rows = usecase.history(symbol, _history_start(start_time, cursor), end_time)
+    return await _history_response(rows)
@@ -1,27 +1,149 @@
-from fastapi import APIRouter, WebSocket
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Any, AsyncIterator, Callable
+
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect, status
 
 from src.app.application.market.use_cases.get_ticker import GetTickerUseCase
 from src.app.application.trading.use_cases.list_orders import ListOrdersUseCase
-from src.app.interfaces.http.dependencies import build_exchange_factory
+from src.app.domain.events.book_ticker_event import BookTickerEvent
+from src.app.domain.events.order_event import OrderEvent
+from src.app.domain.value_objects.order_book import OrderBook
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.streaming.broadcast_hub import SlowConsumerError
+from src.app.interfaces.http.dependencies import (
+    build_exchange_factory,
+    get_stream_gateway,
+    get_stream_hub,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_SYMBOL = Symbol("QRLUSDT")
+
 
 @router.websocket("/market/ticker")
 async def ticker_stream(websocket: WebSocket):
-    """WebSocket ticker stream placeholder."""
+    """Send the 24h ticker, then stream QRL/USDT best bid/ask updates."""
     await websocket.accept()
     exchange_factory = build_exchange_factory()
     usecase = GetTickerUseCase(exchange_factory)
-    await usecase.execute()  # TODO: stream data
-    await websocket.close()
+    await websocket.send_json({"type": "ticker_24h", "data": await usecase.execute()})
+
+    hub, gateway = get_stream_hub(), get_stream_gateway("public")
+    if hub is None or gateway is None:
+        await websocket.close()
+        return
+    events = hub.subscribe(
+        ("book_ticker", _SYMBOL.value),
+        lambda: gateway.subscribe_book_ticker(_SYMBOL),
+        conflate=lambda event: event.symbol.value,
+    )
+    await _relay(websocket, events, _book_ticker_message)
+
+
+@router.websocket("/market/depth")
+async def depth_stream(websocket: WebSocket, limit: int = Query(20, ge=1, le=100)):
+    """Stream the top ``limit`` levels of the locally synced QRL/USDT book."""
+    await websocket.accept()
+    hub = get_stream_hub()
+    books = getattr(websocket.app.state, "local_order_books", [])
+    book = next((book for book in books if book.symbol == _SYMBOL), None)
+    if hub is None or book is None:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="No live order book")
+        return
+    events = hub.subscribe(
+        ("depth", _SYMBOL.value, limit),
+        lambda: book.watch(limit),
+        conflate=lambda _: _SYMBOL.value,
+    )
+    await _relay(websocket, events, _depth_message)
 
 
 @router.websocket("/trading/orders")
 async def order_stream(websocket: WebSocket):
-    """WebSocket order stream placeholder."""
+    """Send the open orders, then stream order updates from the private feed."""
     await websocket.accept()
     exchange_factory = build_exchange_factory()
     usecase = ListOrdersUseCase(exchange_factory)
-    await usecase.execute()  # TODO: stream data
-    await websocket.close()
+    await websocket.send_json({"type": "open_orders", "data": await usecase.execute()})
+
+    hub, gateway = get_stream_hub(), get_stream_gateway("private")
+    if hub is None or gateway is None:
+        await websocket.close()
+        return
+    events = hub.subscribe(("orders",), gateway.subscribe_orders)
+    await _relay(websocket, events, _order_message)
+
+
+async def _relay(
+    websocket: WebSocket,
+    events: AsyncIterator[Any],
+    serialize: Callable[[Any], dict],
+) -> None:
+    """Forward hub events to one client until either side goes away."""
+
+    async def forward() -> None:
+        async for event in events:
+            await websocket.send_json(serialize(event))
+
+    forwarder = asyncio.create_task(forward())
+    receiver = asyncio.create_task(_until_disconnect(websocket))
+    done, pending = await asyncio.wait({forwarder, receiver}, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await task
+    await events.aclose()
+    if forwarder not in done:
+        return
+    error = forwarder.exception()
+    if isinstance(error, SlowConsumerError):
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="Client too slow")
+    elif error is not None and not isinstance(error, WebSocketDisconnect):
+        logger.warning("WebSocket relay stopped: %s", error)
+        with suppress(Exception):
+            await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+
+
+async def _until_disconnect(websocket: WebSocket) -> None:
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
+def _book_ticker_message(event: BookTickerEvent) -> dict:
+    return {
+        "type": "book_ticker",
+        "symbol": event.symbol.value,
+        "bid_price": str(event.bid_price),
+        "bid_quantity": str(event.bid_quantity),
+        "ask_price": str(event.ask_price),
+        "ask_quantity": str(event.ask_quantity),
+    }
+
+
+def _depth_message(book: OrderBook) -> dict:
+    return {
+        "type": "depth",
+        "symbol": _SYMBOL.value,
+        "bids": [[str(level.price), str(level.quantity)] for level in book.bids],
+        "asks": [[str(level.price), str(level.quantity)] for level in book.asks],
+    }
+
+
+def _order_message(event: OrderEvent) -> dict:
+    return {
+        "type": "order",
+        "order_id": event.order_id.value,
+        "symbol": event.symbol.value,
+        "status": event.status.value,
+        "price": str(event.price.last) if event.price else None,
+        "quantity": str(event.quantity.value) if event.quantity else None,
+        "executed_quantity": str(event.executed_quantity)
+        if event.executed_quantity is not None
+        else None,
+        "timestamp": event.timestamp,
+    }
@@ -1,15 +1,294 @@
 """FastAPI dependency providers for interface layer."""
 
+import logging
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator
+
+from fastapi import FastAPI
+from pydantic import ValidationError
+
 from src.app.application.ports.exchange_service import ExchangeServiceFactory
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.adapters.market_event_adapter import MexcExchangeGateway
+from src.app.infrastructure.exchange.mexc.archive_recorder import ArchiveRecorder
+from src.app.infrastructure.exchange.mexc.caching_service import (
+    CachingExchangeService,
+    MarketDataCache,
+    cache_policies_from_settings,
+)
+from src.app.infrastructure.exchange.mexc.kline_rollup import (
+    KlineRollup,
+    LiveKlineExchangeService,
+)
+from src.app.infrastructure.exchange.mexc.kline_store import (
+    KlineStore,
+    KlineStoreExchangeService,
+)
+from src.app.infrastructure.exchange.mexc.listen_key import ListenKeyManager
+from src.app.infrastructure.exchange.mexc.live_account_state import (
+    LiveAccountExchangeService,
+    LiveAccountState,
+)
+from src.app.infrastructure.exchange.mexc.local_order_book import (
+    LiveDepthExchangeService,
+    LocalOrderBook,
+)
+from src.app.infrastructure.exchange.mexc.rest_client import MexcRestClient
 from src.app.infrastructure.exchange.mexc.service import build_mexc_exchange_service
 from src.app.infrastructure.exchange.mexc.settings import MexcSettings
+from src.app.infrastructure.exchange.mexc.ws.mexc_ws_client import MexcWebSocketClient
+from src.app.infrastructure.storage.time_series_archive import TimeSeriesArchive, default_layouts
+from src.app.infrastructure.streaming.broadcast_hub import BroadcastHub, OverflowPolicy
+
+logger = logging.getLogger(__name__)
+
+_shared_rest_client: MexcRestClient | None = None
+_market_data_cache: MarketDataCache | None = None
+_kline_store: KlineStore | None = None
+_kline_rollup: KlineRollup | None = None
+_local_books: list[LocalOrderBook] = []
+_live_account: LiveAccountState | None = None
+_ws_clients: dict[str, MexcWebSocketClient] = {}
+_gateways: dict[str, MexcExchangeGateway] = {}
+_stream_hub: BroadcastHub | None = None
+_archive: TimeSeriesArchive | None = None
+
+
+@lru_cache(maxsize=1)
+def get_mexc_settings() -> MexcSettings:
+    """Load MEXC settings from the environment once per process."""
+
+    return MexcSettings()
+
+
+def get_shared_rest_client() -> MexcRestClient | None:
+    """Return the application-wide REST client when the lifespan has opened one."""
+
+    return _shared_rest_client
+
+
+def get_ws_stream_stats() -> dict[str, dict]:
+    """Return connection and per-stream counters of the running WebSocket clients."""
+
+    stats = {name: ws_client.stats() for name, ws_client in _ws_clients.items()}
+    if _stream_hub is not None:
+        stats["fanout"] = _stream_hub.stats()
+    return stats
+
+
+def get_stream_hub() -> BroadcastHub | None:
+    """Return the hub sharing upstream subscriptions among /ws clients, if running."""
+
+    return _stream_hub
+
+
+def get_local_order_books() -> list[LocalOrderBook]:
+    """Return the WebSocket-synced order books started by the lifespan."""
+
+    return _local_books
+
+
+def get_time_series_archive() -> TimeSeriesArchive | None:
+    """Return the on-disk market data archive when it is enabled."""
+
+    return _archive
+
+
+def get_stream_gateway(name: str) -> MexcExchangeGateway | None:
+    """Return the ``public`` or ``private`` streaming gateway when it is available."""
+
+    return _gateways.get(name)
+
+
+@asynccontextmanager
+async def exchange_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Own the shared MEXC clients and background services for the application lifetime.
+
+    Every resource registers its teardown as soon as it is created, so a
+    failure part-way through startup still releases what was already opened.
+    """
+
+    try:
+        settings = get_mexc_settings()
+    except ValidationError:
+        logger.warning("MEXC settings unavailable; exchange clients will be created per request")
+        yield
+        return
+
+    async with AsyncExitStack() as stack:
+        stack.callback(_reset_globals)
+        await _start_exchange(app, settings, stack)
+        yield
+
+
+def _reset_globals() -> None:
+    global _shared_rest_client, _market_data_cache, _kline_store, _local_books, _live_account
+    global _ws_clients, _gateways, _stream_hub, _kline_rollup, _archive
+    _shared_rest_client = _market_data_cache = _kline_store = None
+    _kline_rollup = _live_account = _stream_hub = _archive = None
+    _local_books, _ws_clients, _gateways = [], {}, {}
+
+
+async def _start_exchange(app: FastAPI, settings: MexcSettings, stack: AsyncExitStack) -> None:
+    global _shared_rest_client, _market_data_cache, _kline_store, _local_books, _live_account
+    global _stream_hub, _kline_rollup, _archive
+
+    client = await MexcRestClient(settings).open()
+    stack.push_async_callback(client.aclose)
+    _shared_rest_client = client
+    app.state.mexc_rest_client = client
+    cache = MarketDataCache(settings.cache_max_entries) if settings.cache_enabled else None
+    if cache is not None:
+        stack.push_async_callback(cache.aclose)
+    _market_data_cache = cache
+    app.state.market_data_cache = cache
+    if settings.kline_store_enabled:
+        _kline_store = KlineStore(
+            client,
+            capacity=settings.kline_store_size,
+            refresh_interval=settings.cache_kline_ttl,
+        )
+    app.state.kline_store = _kline_store
+
+    # Connects lazily, on the first subscription.
+    ws_client = MexcWebSocketClient(settings.ws_url, decode_in_thread=settings.ws_decode_in_thread)
+    stack.push_async_callback(ws_client.close)
+    _ws_clients["public"] = ws_client
+    public = _gateways["public"] = MexcExchangeGateway(
+        ws_client, stale_after=settings.ws_stale_after or None
+    )
+    _stream_hub = BroadcastHub(
+        queue_size=settings.ws_fanout_queue_size,
+        policy=OverflowPolicy(settings.ws_fanout_policy),
+    )
+    stack.push_async_callback(_stream_hub.close)
+    app.state.stream_hub = _stream_hub
+    if settings.local_book_enabled:
+        book = LocalOrderBook(
+            Symbol("QRLUSDT"),
+            public,
+            client,
+            snapshot_limit=settings.local_book_depth,
+            interval=settings.local_book_interval,
+        )
+        ws_client.add_reconnect_listener(book.request_resync)
+        book.start()
+        stack.push_async_callback(book.stop)
+        _local_books = [book]
+    app.state.local_order_books = _local_books
+    if settings.kline_rollup_enabled:
+        _kline_rollup = KlineRollup(
+            Symbol("QRLUSDT"), public, client, capacity=settings.kline_store_size
+        )
+        ws_client.add_reconnect_listener(_kline_rollup.request_reconcile)
+        _kline_rollup.start()
+        stack.push_async_callback(_kline_rollup.stop)
+    app.state.kline_rollup = _kline_rollup
+    if settings.archive_enabled:
+        _archive = TimeSeriesArchive(
+            settings.archive_path,
+            default_layouts(settings.archive_depth_levels),
+            flush_interval=settings.archive_flush_interval,
+        )
+        _archive.start()
+        stack.push_async_callback(_archive.stop)
+        recorder = ArchiveRecorder(
+            Symbol("QRLUSDT"),
+            _archive,
+            public,
+            client,
+            book=_local_books[0] if _local_books else None,
+            depth_levels=settings.archive_depth_levels,
+            snapshot_interval=settings.archive_snapshot_interval,
+        )
+        recorder.start()
+        stack.push_async_callback(recorder.stop)
+    app.state.archive = _archive
+
+    if settings.account_stream_enabled:
+        await _start_account_stream(settings, client, stack)
+    app.state.live_account = _live_account
+
+
+async def _start_account_stream(
+    settings: MexcSettings, client: MexcRestClient, stack: AsyncExitStack
+) -> None:
+    global _live_account
+
+    listen_keys = ListenKeyManager(
+        client,
+        keepalive_interval=settings.listen_key_keepalive,
+        rotate_after=settings.listen_key_rotate_after,
+    )
+    stack.push_async_callback(listen_keys.close)
+    try:
+        listen_key = await listen_keys.open()
+    except Exception:
+        logger.warning("Could not open a MEXC user data stream; account reads stay on REST")
+        return
+    private_ws = MexcWebSocketClient(
+        _private_ws_url(settings, listen_key),
+        decode_in_thread=settings.ws_decode_in_thread,
+    )
+    stack.push_async_callback(private_ws.close)
+    listen_keys.on_rotate(lambda key: private_ws.switch_url(_private_ws_url(settings, key)))
+    _gateways["private"] = MexcExchangeGateway(private_ws)
+    _live_account = LiveAccountState(
+        Symbol("QRLUSDT"),
+        _gateways["private"],
+        lambda: build_mexc_exchange_service(settings, rest_client=client),
+        reconcile_interval=settings.account_reconcile_interval,
+    )
+    private_ws.add_reconnect_listener(_live_account.request_reconcile)
+    _live_account.start()
+    stack.push_async_callback(_live_account.stop)
+    _ws_clients["private"] = private_ws
+
+
+def _private_ws_url(settings: MexcSettings, listen_key: str) -> str:
+    return f"{settings.ws_url}?listenKey={listen_key}"
+
+
+def build_exchange_factory(
+    settings: MexcSettings | None = None,
+    rest_client: MexcRestClient | None = None,
+    *,
+    cached: bool = True,
+) -> ExchangeServiceFactory:
+    """
+    Return a factory whose adapters lease the shared connection pool when available.
 
+    With ``cached`` set, market-data reads go through the shared cache and
+    klines through the in-memory kline store (or the live roll-up when it is
+    ready); trading flows that must see the
+    live book pass ``cached=False``. Depth is answered from the WebSocket-synced
+    local book, and account/open-order reads from the live account state,
+    whenever those are running.
+    """
 
-def build_exchange_factory(settings: MexcSettings | None = None) -> ExchangeServiceFactory:
-    """Return a factory that builds a fresh exchange adapter per request."""
+    def direct_factory():
+        client = rest_client or (_shared_rest_client if settings is None else None)
+        if client is not None:
+            return build_mexc_exchange_service(client.settings, rest_client=client)
+        return build_mexc_exchange_service(settings or get_mexc_settings())
 
     def factory():
-        return build_mexc_exchange_service(settings or MexcSettings())
+        service = direct_factory()
+        cache = _market_data_cache if cached and settings is None else None
+        if cache is not None:
+            policies = cache_policies_from_settings(service.settings)
+            service = CachingExchangeService(service, cache, policies, refresh_factory=direct_factory)
+        if cached and settings is None and _kline_store is not None:
+            service = KlineStoreExchangeService(service, _kline_store)
+        if settings is None and _kline_rollup is not None:
+            service = LiveKlineExchangeService(service, _kline_rollup)
+        if settings is None and _local_books:
+            service = LiveDepthExchangeService(service, _local_books)
+        if settings is None and _live_account is not None:
+            service = LiveAccountExchangeService(service, _live_account)
+        return service
 
     return factory
 
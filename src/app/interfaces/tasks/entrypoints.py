@@ -18,7 +18,8 @@ def _allocation_timeout_seconds() -> float:
 
 async def run_allocation(timeout_seconds: float | None = None) -> AllocationResult:
     """Trigger the allocation use case for Cloud Scheduler with a bounded runtime."""
-    exchange_factory = build_exchange_factory()
+    # Allocation prices orders off the live book, never the market-data cache.
+    exchange_factory = build_exchange_factory(cached=False)
     usecase = AllocationUseCase(exchange_factory)
     timeout = timeout_seconds or _allocation_timeout_seconds()
     return await asyncio.wait_for(usecase.execute(), timeout=timeout)
@@ -0,0 +1,168 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.app.infrastructure.exchange.mexc.account_history import (
+    HistoryCursor,
+    ORDER_HISTORY_MAX_AGE_MS,
+    HistoryPageOverflow,
+    order_history,
+    trade_history,
+)
+from src.app.interfaces.http.api import trading_routes
+from src.app.interfaces.http.dependencies import get_exchange_factory
+
+
+def _row(trade_id: str, time: int) -> dict:
+    return {"id": trade_id, "orderId": "1", "price": "1", "qty": "1", "time": time}
+
+
+# Trades at t = 0, 10, 20, ... 990 ms, plus two more sharing t = 500.
+ROWS = [_row(str(t), t) for t in range(0, 1000, 10)] + [_row("500b", 500), _row("500c", 500)]
+
+
+class FakeRest:
+    """myTrades over ROWS, answering later windows first."""
+
+    def __init__(self):
+        self.calls: list[tuple[int, int]] = []
+
+    async def list_trades(self, *, symbol, limit=50, start_time=None, end_time=None):
+        self.calls.append((start_time, end_time))
+        await asyncio.sleep(0.001 * (1000 - start_time) / 100)
+        rows = [row for row in ROWS if start_time <= row["time"] <= end_time]
+        return sorted(rows, key=lambda row: row["time"])[:limit]
+
+
+def _ids(trades) -> list[str]:
+    return [trade.trade_id.value for trade in trades]
+
+
+@pytest.mark.asyncio
+async def test_trade_history_pages_full_windows_in_order_without_duplicates() -> None:
+    rest = FakeRest()
+    stream = trade_history(
+        rest, "QRLUSDT", 0, 999, window_ms=250, page_size=5, concurrency=3, max_age_ms=None
+    )
+    trades = [trade async for trade in stream]
+
+    expected = sorted(ROWS, key=lambda row: row["time"])
+    assert _ids(trades) == [row["id"] for row in expected]
+    # Every window needed several pages.
+    assert len(rest.calls) > 4
+    assert stream.cursor == HistoryCursor(990, frozenset({"990"}))
+
+
+@pytest.mark.asyncio
+async def test_trade_history_resumes_from_cursor() -> None:
+    rest = FakeRest()
+    stream = trade_history(rest, "QRLUSDT", 0, 999, window_ms=250, page_size=5, max_age_ms=None)
+    first = []
+    async for trade in stream:
+        first.append(trade)
+        if trade.trade_id.value == "500b":
+            break
+
+    resumed = trade_history(
+        rest, "QRLUSDT", stream.cursor, 999, window_ms=250, page_size=5, max_age_ms=None
+    )
+    rest_of = [trade async for trade in resumed]
+
+    assert _ids(first)[-2:] == ["500", "500b"]
+    assert _ids(rest_of)[:2] == ["500c", "510"]
+    assert len(first) + len(rest_of) == len(ROWS)
+
+
+@pytest.mark.asyncio
+async def test_full_page_within_one_millisecond_raises_instead_of_skipping() -> None:
+    stream = trade_history(FakeRest(), "QRLUSDT", 500, 500, page_size=2, max_age_ms=None)
+
+    with pytest.raises(HistoryPageOverflow):
+        [trade async for trade in stream]
+
+
+def _order(order_id: str, time: int) -> dict:
+    return {
+        "orderId": order_id,
+        "symbol": "QRLUSDT",
+        "side": "BUY",
+        "type": "LIMIT",
+        "status": "FILLED",
+        "price": "0.25",
+        "origQty": "10",
+        "time": time,
+    }
+
+
+class FakeOrderRest:
+    """allOrders over one order every 100 ms."""
+
+    def __init__(self):
+        self.limits: list[int] = []
+
+    async def all_orders(self, *, symbol, limit=500, start_time=None, end_time=None):
+        self.limits.append(limit)
+        rows = [_order(str(t), t) for t in range(0, 1000, 100)]
+        return [row for row in rows if start_time <= row["time"] <= end_time][:limit]
+
+
+class FakeExchange:
+    def __init__(self, rest: FakeOrderRest, max_age_ms: int | None = None):
+        self._rest = rest
+        self._max_age_ms = max_age_ms
+
+    async def __aenter__(self) -> "FakeExchange":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def order_history(self, symbol, start, end_time=None):
+        return order_history(
+            self._rest, symbol.value, start, end_time, page_size=3, max_age_ms=self._max_age_ms
+        )
+
+
+def _app(exchange: FakeExchange) -> httpx.AsyncClient:
+    app = FastAPI()
+    app.include_router(trading_routes.router, prefix="/api/trading")
+    app.dependency_overrides[get_exchange_factory] = lambda: lambda: exchange
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_order_history_route_streams_ndjson_and_resumes_from_its_cursor() -> None:
+    rest = FakeOrderRest()
+    async with _app(FakeExchange(rest)) as client:
+        response = await client.get(
+            "/api/trading/orders/history", params={"start_time": 150, "end_time": 750}
+        )
+        *orders, tail = [json.loads(line) for line in response.text.splitlines()]
+        resumed = await client.get(
+            "/api/trading/orders/history", params={"cursor": tail["cursor"], "end_time": 950}
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [order["order_id"] for order in orders] == ["200", "300", "400", "500", "600", "700"]
+    assert rest.limits == [3] * 5
+    assert tail == {"cursor": "700:700"}
+    *more, tail = [json.loads(line) for line in resumed.text.splitlines()]
+    assert [order["order_id"] for order in more] == ["800", "900"]
+    assert tail == {"cursor": "900:900"}
+
+
+@pytest.mark.asyncio
+async def test_order_history_route_rejects_ranges_the_exchange_does_not_serve() -> None:
+    exchange = FakeExchange(FakeOrderRest(), max_age_ms=ORDER_HISTORY_MAX_AGE_MS)
+    async with _app(exchange) as client:
+        too_old = await client.get("/api/trading/orders/history", params={"start_time": 0})
+        no_start = await client.get("/api/trading/orders/history")
+        bad_cursor = await client.get("/api/trading/orders/history", params={"cursor": "x"})
+
+    assert too_old.status_code == 422
+    assert "7 days" in too_old.json()["detail"]
+    assert no_start.status_code == bad_cursor.status_code == 422
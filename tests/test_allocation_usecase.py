@@ -0,0 +1,82 @@
+import asyncio
+from collections import Counter
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from src.app.application.system.use_cases.allocation import AllocationUseCase
+from src.app.domain.entities.account import Account
+from src.app.domain.value_objects.balance import Balance
+from src.app.domain.value_objects.order_book import DepthLevel, OrderBook
+from src.app.domain.value_objects.timestamp import Timestamp
+
+
+class FakeExchange:
+    def __init__(self, book: OrderBook):
+        self.book = book
+        self.calls: Counter[str] = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.placed = []
+
+    async def __aenter__(self) -> "FakeExchange":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    async def _track(self, name: str) -> None:
+        self.calls[name] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+
+    async def get_account(self):
+        await self._track("account")
+        return Account(
+            can_trade=True,
+            update_time=Timestamp(datetime.now(timezone.utc)),
+            balances=[Balance("QRL", Decimal("100"), Decimal("0"))],
+        )
+
+    async def get_depth(self, symbol, limit=50):
+        await self._track("depth")
+        return self.book
+
+    async def get_price(self, symbol):
+        await self._track("price")
+        raise RuntimeError("ticker unavailable")
+
+    async def place_order(self, request):
+        self.placed.append(request)
+        return SimpleNamespace(order_id=SimpleNamespace(value="42"))
+
+
+@pytest.mark.asyncio
+async def test_allocation_fetches_concurrently_and_prices_from_the_book() -> None:
+    exchange = FakeExchange(
+        OrderBook(
+            bids=[DepthLevel(Decimal("1.0"), Decimal("50"))],
+            asks=[DepthLevel(Decimal("1.2"), Decimal("50"))],
+        )
+    )
+
+    result = await AllocationUseCase(lambda: exchange).execute()
+
+    assert result.status == "ok" and result.action == "SELL"
+    assert exchange.max_in_flight == 2
+    assert exchange.calls["price"] == 0
+    assert exchange.placed[0].price.last == Decimal("1.2") * Decimal("1.001")
+
+
+@pytest.mark.asyncio
+async def test_allocation_falls_back_to_ticker_when_book_is_one_sided() -> None:
+    exchange = FakeExchange(OrderBook(bids=[DepthLevel(Decimal("1.0"), Decimal("50"))]))
+
+    result = await AllocationUseCase(lambda: exchange).execute()
+
+    assert exchange.calls["price"] == 1
+    assert result.reason == "Price unavailable"
@@ -0,0 +1,46 @@
+from decimal import Decimal
+
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.adapters.depth_mapper import depth_batch_proto_to_domain
+from src.app.infrastructure.exchange.mexc.adapters.mini_ticker_mapper import (
+    mini_tickers_proto_to_domain,
+)
+from src.app.infrastructure.exchange.mexc.generated import (
+    PublicIncreaseDepthsBatchV3Api_pb2,
+    PublicMiniTickersV3Api_pb2,
+)
+from src.app.infrastructure.exchange.mexc.local_order_book import LocalOrderBook
+
+SYMBOL = Symbol("QRLUSDT")
+
+
+def test_depth_batch_is_applied_as_one_diff_spanning_all_versions() -> None:
+    batch = PublicIncreaseDepthsBatchV3Api_pb2.PublicIncreaseDepthsBatchV3Api(eventType="depth")
+    for version, bid_quantity in (("11", "3"), ("12", "0"), ("13", "7")):
+        item = batch.items.add(version=version)
+        item.bids.add(price="1.0", quantity=bid_quantity)
+    batch.items[1].asks.add(price="1.2", quantity="4")
+
+    event = depth_batch_proto_to_domain(SYMBOL, batch)
+    book = LocalOrderBook(SYMBOL, gateway=None, rest_client=None)
+    book.reset({"lastUpdateId": 10, "bids": [["1.0", "5"]], "asks": [["1.1", "2"]]})
+
+    assert (event.from_version, event.to_version) == ("11", "13")
+    assert book.apply(event)
+    assert book.version == 13
+    view = book.order_book()
+    assert [(level.price, level.quantity) for level in view.bids] == [(Decimal("1.0"), Decimal("7"))]
+    assert [level.price for level in view.asks] == [Decimal("1.1"), Decimal("1.2")]
+
+
+def test_mini_tickers_map_every_market_in_one_pass() -> None:
+    batch = PublicMiniTickersV3Api_pb2.PublicMiniTickersV3Api()
+    batch.items.add(symbol="QRLUSDT", price="0.5", rate="0.01", high="0.6", low="0.4")
+    batch.items.add(symbol="BTCUSDT", price="60000", zonedRate="-0.02")
+
+    events = mini_tickers_proto_to_domain(batch)
+
+    assert [(e.symbol, e.price, e.rate) for e in events] == [
+        ("QRLUSDT", Decimal("0.5"), Decimal("0.01")),
+        ("BTCUSDT", Decimal("60000"), Decimal("-0.02")),
+    ]
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from src.app.infrastructure.streaming.broadcast_hub import (
+    BroadcastHub,
+    OverflowPolicy,
+    SlowConsumerError,
+)
+
+
+class CountingSource:
+    """Upstream feed that counts how often it is opened and yields on demand."""
+
+    def __init__(self):
+        self.opened = 0
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def __call__(self):
+        self.opened += 1
+        while True:
+            yield await self.queue.get()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_one_upstream_serves_all_subscribers_and_slow_ones_only_lose_their_own() -> None:
+    source = CountingSource()
+    hub = BroadcastHub(queue_size=2)
+    fast = hub.subscribe("ticker", source)
+    slow = hub.subscribe("ticker", source, policy=OverflowPolicy.CONFLATE)
+    first = asyncio.create_task(anext(fast))
+    slow_first = asyncio.create_task(anext(slow))
+    await _settle()
+
+    source.queue.put_nowait(0)
+    assert await first == 0 and await slow_first == 0
+    received = []
+    for item in range(1, 6):
+        source.queue.put_nowait(item)
+        await _settle()
+        received.append(await anext(fast))
+
+    assert source.opened == 1
+    assert received == [1, 2, 3, 4, 5]
+    # The slow subscriber never read, so only the newest item is pending.
+    assert await anext(slow) == 5
+    assert hub.stats()["ticker"]["subscribers"] == 2
+
+    await fast.aclose()
+    await slow.aclose()
+    await _settle()
+    assert hub.keys == []
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_fails_only_the_lagging_subscriber() -> None:
+    source = CountingSource()
+    hub = BroadcastHub(queue_size=1, policy=OverflowPolicy.DISCONNECT)
+    lagging = hub.subscribe("orders", source)
+    healthy = hub.subscribe("orders", source, policy=OverflowPolicy.DROP_OLDEST)
+    lagging_first = asyncio.create_task(anext(lagging))
+    healthy_first = asyncio.create_task(anext(healthy))
+    await _settle()
+
+    for item in range(3):
+        source.queue.put_nowait(item)
+        await _settle()
+
+    assert await lagging_first == 0 and await healthy_first == 0
+    with pytest.raises(SlowConsumerError):
+        await anext(lagging)
+    assert await anext(healthy) == 2
+
+    await healthy.aclose()
+    await hub.close()
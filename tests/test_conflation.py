@@ -0,0 +1,60 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from src.app.domain.events.market_depth_event import MarketDepthEvent
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.local_order_book import LocalOrderBook
+from src.app.infrastructure.streaming.conflation import LatestValueMailbox
+
+SYMBOL = Symbol("QRLUSDT")
+
+
+@pytest.mark.asyncio
+async def test_burst_keeps_one_value_per_key_and_wakes_consumer_once() -> None:
+    mailbox: LatestValueMailbox[tuple, int] = LatestValueMailbox()
+    wakeups = 0
+
+    async def consume() -> dict:
+        nonlocal wakeups
+        batch = await mailbox.get_all()
+        wakeups += 1
+        return batch
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    for value in range(1000):
+        mailbox.put(("book_ticker", "QRLUSDT"), value)
+        mailbox.put(("ticker", "QRLUSDT"), -value)
+
+    assert mailbox.pending == 2
+    assert await consumer == {("book_ticker", "QRLUSDT"): 999, ("ticker", "QRLUSDT"): -999}
+    assert wakeups == 1
+    assert mailbox.conflated == 1998
+
+
+@pytest.mark.asyncio
+async def test_local_book_watchers_get_the_current_top_levels_once_per_burst() -> None:
+    book = LocalOrderBook(SYMBOL, gateway=None, rest_client=None)
+    book.reset({"lastUpdateId": 1, "bids": [["1.0", "5"]], "asks": [["1.1", "2"]]})
+    updates = book.watch(limit=1)
+
+    first = await anext(updates)
+    for version in range(2, 50):
+        book.apply(
+            MarketDepthEvent(
+                symbol=SYMBOL,
+                bids=[(Decimal("1.0"), Decimal(version))],
+                asks=[],
+                event_type=None,
+                from_version=str(version),
+                to_version=str(version),
+            )
+        )
+    latest = await anext(updates)
+    await updates.aclose()
+
+    assert first.bids[0].quantity == Decimal("5")
+    assert latest.bids[0].quantity == Decimal("49")
+    assert book._watchers == set()
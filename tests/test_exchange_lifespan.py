@@ -0,0 +1,32 @@
+import pytest
+from fastapi import FastAPI
+
+from src.app.infrastructure.exchange.mexc.settings import MexcSettings
+from src.app.interfaces.http import dependencies
+
+
+@pytest.mark.asyncio
+async def test_failed_startup_releases_what_was_already_opened(monkeypatch) -> None:
+    settings = MexcSettings(MEXC_API_KEY="key", MEXC_SECRET_KEY="secret")
+    monkeypatch.setattr(dependencies, "get_mexc_settings", lambda: settings)
+    closed: list[str] = []
+    aclose = dependencies.MexcRestClient.aclose
+
+    async def tracked_aclose(self) -> None:
+        closed.append("rest")
+        await aclose(self)
+
+    def broken_hub(**_) -> None:
+        raise ValueError("bad fan-out policy")
+
+    monkeypatch.setattr(dependencies.MexcRestClient, "aclose", tracked_aclose)
+    monkeypatch.setattr(dependencies, "BroadcastHub", broken_hub)
+
+    with pytest.raises(ValueError):
+        async with dependencies.exchange_lifespan(FastAPI()):
+            pass
+
+    assert closed == ["rest"]
+    assert dependencies.get_shared_rest_client() is None
+    assert dependencies.get_stream_gateway("public") is None
+    assert dependencies.get_ws_stream_stats() == {}
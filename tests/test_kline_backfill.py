@@ -0,0 +1,49 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from src.app.infrastructure.exchange.mexc.kline_backfill import backfill_klines
+
+MINUTE = 60_000
+
+
+class FakeRest:
+    """1m candles for minutes 0-99 except 40-42; every page also repeats its predecessor."""
+
+    def __init__(self):
+        self.calls: list[tuple[int, int]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def klines(self, *, symbol, interval, limit=100, start_time=None, end_time=None):
+        self.calls.append((start_time, end_time))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later windows answer first, so ordering cannot come from completion order.
+        await asyncio.sleep(0.001 * (100 - start_time // MINUTE) / 10)
+        self.in_flight -= 1
+        first = max(start_time - MINUTE, 0)
+        return [
+            [t, str(t // MINUTE), str(t // MINUTE), str(t // MINUTE), str(t // MINUTE), "1"]
+            for t in range(first, min(end_time, 99 * MINUTE) + 1, MINUTE)
+            if not 40 <= t // MINUTE <= 42
+        ][:limit + 1]
+
+
+@pytest.mark.asyncio
+async def test_backfill_streams_windows_in_order_without_duplicates_or_gaps() -> None:
+    rest = FakeRest()
+    klines = [
+        kline
+        async for kline in backfill_klines(
+            rest, "QRLUSDT", "1m", 5 * MINUTE + 1, 95 * MINUTE, page_size=10, concurrency=3
+        )
+    ]
+
+    minutes = [int(k.timestamp.value.timestamp()) // 60 for k in klines]
+    assert minutes == list(range(6, 96))
+    assert [k.close for k in klines[33:37]] == [Decimal("39")] * 4
+    assert klines[34].volume == 0 and klines[37].close == Decimal("43")
+    assert len(rest.calls) == 9 and rest.max_in_flight == 3
+    assert rest.calls[0] == (6 * MINUTE, 16 * MINUTE - 1)
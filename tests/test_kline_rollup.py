@@ -0,0 +1,141 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from src.app.domain.events.trade_event import TradeEvent
+from src.app.domain.value_objects.price import Price
+from src.app.domain.value_objects.quantity import Quantity
+from src.app.domain.value_objects.kline_interval import interval_ms
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.domain.value_objects.trade_id import TradeId
+from src.app.infrastructure.exchange.mexc.kline_rollup import KlineRollup
+
+SYMBOL = Symbol("QRLUSDT")
+MINUTE = 60_000
+
+
+class FakeRest:
+    """Serves ten flat 1m candles at 1.0 and the matching higher-interval rows."""
+
+    async def klines(self, *, symbol, interval, limit=100, start_time=None, end_time=None):
+        step = interval_ms(interval)
+        count = max(10 * MINUTE // step, 1)
+        return [[i * step, "1.0", "1.0", "1.0", "1.0", "5"] for i in range(count)][-limit:]
+
+
+def _trade(minute: float, price: str, quantity: str) -> TradeEvent:
+    return TradeEvent(
+        trade_id=TradeId(str(minute)),
+        symbol=SYMBOL,
+        price=Price.from_single(Decimal(price)),
+        quantity=Quantity(Decimal(quantity)),
+        is_buyer_maker=False,
+        timestamp=int(minute * MINUTE),
+    )
+
+
+@pytest.mark.asyncio
+async def test_trades_update_every_interval_and_resampled_ones() -> None:
+    rollup = KlineRollup(SYMBOL, gateway=None, rest_client=FakeRest())
+    assert rollup.klines("1m", 1) is None
+
+    await rollup.refresh()
+    rollup.apply(_trade(9.5, "1.2", "2"))
+    rollup.apply(_trade(12.1, "0.8", "3"))
+
+    minutes = rollup.klines("1m", 4)
+    assert [str(k.close) for k in minutes] == ["1.2", "1.2", "1.2", "0.8"]
+    assert minutes[0].high == Decimal("1.2") and minutes[0].volume == Decimal("7")
+    assert minutes[1].volume == 0
+
+    five = rollup.klines("5m", 2)
+    assert [(k.high, k.low, k.volume) for k in five] == [
+        (Decimal("1.2"), Decimal("1.0"), Decimal("7")),
+        (Decimal("0.8"), Decimal("0.8"), Decimal("3")),
+    ]
+
+    three = rollup.klines("3m", 2)
+    assert [k.timestamp.value.minute for k in three] == [9, 12]
+    assert [(k.open, k.close, k.volume) for k in three] == [
+        (Decimal("1.0"), Decimal("1.2"), Decimal("7")),
+        (Decimal("0.8"), Decimal("0.8"), Decimal("3")),
+    ]
+    assert rollup.klines("7x", 1) is None
+
+
+class SlowRest(FakeRest):
+    """Holds every page until ``release`` is set, like a slow REST round trip."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    async def klines(self, **kwargs):
+        await self.release.wait()
+        return await super().klines(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_trades_seen_during_the_seed_are_not_counted_twice() -> None:
+    rest = SlowRest()
+    rollup = KlineRollup(SYMBOL, gateway=None, rest_client=rest)
+    refresh = asyncio.create_task(rollup.refresh())
+    await asyncio.sleep(0)
+
+    # The open 1m candle (minute 9) REST serves may already include this trade.
+    rollup.apply(_trade(9.5, "1.2", "2"))
+    rollup.apply(_trade(10.2, "0.9", "4"))
+    rest.release.set()
+    await refresh
+
+    minutes = rollup.klines("1m", 2)
+    assert [(k.close, k.volume) for k in minutes] == [
+        (Decimal("1.0"), Decimal("5")),
+        (Decimal("0.9"), Decimal("4")),
+    ]
+    five = rollup.klines("5m", 2)
+    assert [k.volume for k in five] == [Decimal("5"), Decimal("4")]
+    assert rollup.trades == 2
+
+
+class SettlingRest(SlowRest):
+    """Serves a candle asked for by ``start_time`` as final, with the seed-time trade in it."""
+
+    def __init__(self):
+        super().__init__()
+        self.settled: list[tuple[str, int]] = []
+
+    async def klines(self, *, symbol, interval, limit=100, start_time=None, end_time=None):
+        rows = await super().klines(symbol=symbol, interval=interval, limit=limit)
+        if start_time is None:
+            return rows
+        self.settled.append((interval, start_time))
+        return [[start_time, "1.0", "1.2", "1.0", "1.2", "7"]]
+
+
+@pytest.mark.asyncio
+async def test_candles_open_during_the_seed_are_fetched_again_once_closed() -> None:
+    rest, now = SettlingRest(), int(9.6 * MINUTE)
+    rollup = KlineRollup(SYMBOL, gateway=None, rest_client=rest, clock_ms=lambda: now)
+    refresh = asyncio.create_task(rollup.refresh())
+    await asyncio.sleep(0)
+    rollup.apply(_trade(9.5, "1.2", "2"))
+    rest.release.set()
+    await refresh
+
+    await rollup.settle()
+    assert rest.settled == []  # nothing has closed yet
+
+    now = 10 * MINUTE + 2_000
+    await rollup.settle()
+    rollup.apply(_trade(10.5, "1.1", "1"))
+
+    assert rest.settled == [("1m", 9 * MINUTE), ("5m", 5 * MINUTE)]
+    minutes = rollup.klines("1m", 2)
+    assert [(k.high, k.close, k.volume) for k in minutes] == [
+        (Decimal("1.2"), Decimal("1.2"), Decimal("7")),
+        (Decimal("1.1"), Decimal("1.1"), Decimal("1")),
+    ]
+    assert rollup.klines("5m", 2)[0].volume == Decimal("7")
+    # The 15m candle and longer ones settle when they close.
+    assert rollup._settle_timeout() == (15 * MINUTE + 2_000 - now) / 1000
@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+import pytest
+
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.kline_store import (
+    KlineStore,
+    KlineStoreExchangeService,
+)
+
+MINUTE = 60_000
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRest:
+    def __init__(self, closes: list[str]):
+        self.closes = closes
+        self.calls: list[dict] = []
+
+    async def klines(self, *, symbol, interval, limit=100, start_time=None, end_time=None):
+        self.calls.append({"limit": limit, "start_time": start_time})
+        rows = [
+            [i * MINUTE, close, close, close, close, "1"] for i, close in enumerate(self.closes)
+        ]
+        if start_time is not None:
+            rows = [row for row in rows if row[0] >= start_time]
+        return rows[-limit:]
+
+
+class FakeExchange:
+    def __init__(self):
+        self.kline_calls = 0
+
+    async def get_kline(self, symbol, interval, limit=100):
+        self.kline_calls += 1
+        return []
+
+
+@pytest.mark.asyncio
+async def test_store_fetches_only_new_candles_and_patches_the_open_one() -> None:
+    clock = FakeClock()
+    rest = FakeRest(["1", "2", "3"])
+    store = KlineStore(rest, capacity=4, refresh_interval=5.0, clock=clock)
+
+    assert [k.close for k in await store.get("QRLUSDT", "1m", 2)] == [Decimal("2"), Decimal("3")]
+    rest.closes[2] = "3.5"
+    rest.closes.append("4")
+    assert len(await store.get("QRLUSDT", "1m", 4)) == 3  # still fresh: memory only
+    assert len(rest.calls) == 1
+
+    clock.now = 6.0
+    rest.closes.append("5")
+    closes = [k.close for k in await store.get("QRLUSDT", "1m", 4)]
+
+    assert closes == [Decimal("2"), Decimal("3.5"), Decimal("4"), Decimal("5")]
+    assert rest.calls[1] == {"limit": 4, "start_time": 2 * MINUTE}
+    assert (store.full_loads, store.delta_fetches) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_decorator_passes_through_what_the_store_does_not_keep() -> None:
+    exchange = FakeExchange()
+    store = KlineStore(FakeRest(["1"]), capacity=10)
+    service = KlineStoreExchangeService(exchange, store)
+
+    await service.get_kline(Symbol("QRLUSDT"), "1m", 5)
+    await service.get_kline(Symbol("QRLUSDT"), "3m", 5)
+    await service.get_kline(Symbol("QRLUSDT"), "1m", 50)
+
+    assert exchange.kline_calls == 2
+    assert store.full_loads == 1
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from src.app.infrastructure.exchange.mexc.listen_key import ListenKeyManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRest:
+    def __init__(self):
+        self.created = 0
+        self.keepalives: list[str] = []
+        self.closed: list[str] = []
+        self.expired: set[str] = set()
+
+    async def create_listen_key(self) -> str:
+        self.created += 1
+        return f"key-{self.created}"
+
+    async def keepalive_listen_key(self, listen_key: str):
+        if listen_key in self.expired:
+            raise RuntimeError("listenKey does not exist")
+        self.keepalives.append(listen_key)
+        return {}
+
+    async def close_listen_key(self, listen_key: str):
+        self.closed.append(listen_key)
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_keepalive_then_rotation_hands_over_before_closing() -> None:
+    rest = FakeRest()
+    clock = FakeClock()
+    handed_over: list[tuple[str, list[str]]] = []
+
+    async def on_rotate(key: str) -> None:
+        handed_over.append((key, list(rest.closed)))
+
+    manager = ListenKeyManager(
+        rest, keepalive_interval=0.001, rotate_after=100.0, on_rotate=on_rotate, clock=clock
+    )
+    assert await manager.open() == "key-1"
+    await asyncio.sleep(0.01)
+    assert rest.keepalives and set(rest.keepalives) == {"key-1"}
+
+    clock.now = 100.0
+    await asyncio.sleep(0.01)
+    assert manager.listen_key == "key-2"
+    assert handed_over[0] == ("key-2", [])
+    assert rest.closed == ["key-1"]
+
+    rest.expired.add("key-2")
+    await asyncio.sleep(0.01)
+    assert manager.listen_key == "key-3"
+    assert manager.rotations == 2
+
+    await manager.close()
+    assert rest.closed[-1] == "key-3"
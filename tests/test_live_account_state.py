@@ -0,0 +1,140 @@
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.app.domain.entities.account import Account
+from src.app.domain.entities.order import Order
+from src.app.domain.events.balance_event import BalanceEvent
+from src.app.domain.events.order_event import OrderEvent
+from src.app.domain.value_objects.balance import Balance
+from src.app.domain.value_objects.order_id import OrderId
+from src.app.domain.value_objects.order_status import OrderStatus
+from src.app.domain.value_objects.order_type import OrderType
+from src.app.domain.value_objects.quantity import Quantity
+from src.app.domain.value_objects.side import Side
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.domain.value_objects.timestamp import Timestamp
+from src.app.infrastructure.exchange.mexc.live_account_state import (
+    LiveAccountExchangeService,
+    LiveAccountState,
+)
+
+SYMBOL = Symbol("QRLUSDT")
+
+
+def _now() -> Timestamp:
+    return Timestamp(datetime.now(timezone.utc))
+
+
+def _order(order_id: str) -> Order:
+    return Order(
+        order_id=OrderId(order_id),
+        symbol=SYMBOL,
+        side=Side("BUY"),
+        order_type=OrderType("LIMIT"),
+        status=OrderStatus("NEW"),
+        price=None,
+        quantity=Quantity(Decimal("10")),
+        created_at=_now(),
+    )
+
+
+def _order_event(order_id: str, status: str, executed: str | None = None) -> OrderEvent:
+    return OrderEvent(
+        order_id=OrderId(order_id),
+        symbol=SYMBOL,
+        price=None,
+        quantity=None,
+        status=OrderStatus(status),
+        timestamp=0,
+        executed_quantity=Decimal(executed) if executed else None,
+    )
+
+
+class FakeExchange:
+    def __init__(self):
+        self.account_calls = 0
+        self.usdt = Decimal("100")
+        self.orders = [_order("1"), _order("2")]
+        self.release: asyncio.Event | None = None
+
+    async def __aenter__(self) -> "FakeExchange":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    async def get_account(self):
+        self.account_calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        return Account(
+            can_trade=True,
+            update_time=_now(),
+            balances=[Balance("USDT", self.usdt, Decimal("0"))],
+        )
+
+    async def list_open_orders(self, symbol=None):
+        return list(self.orders)
+
+
+class IdleGateway:
+    async def _never(self):
+        await asyncio.Event().wait()
+        yield
+
+    subscribe_balances = subscribe_orders = subscribe_fills = _never
+
+
+@pytest.mark.asyncio
+async def test_pushes_update_memory_and_reads_skip_rest() -> None:
+    exchange = FakeExchange()
+    live = LiveAccountState(SYMBOL, IdleGateway(), lambda: exchange)
+    await live.refresh()
+    held = live.account()
+
+    live.apply(BalanceEvent("USDT", Decimal("60"), Decimal("40"), 1_700_000_000_000))
+    live.apply(_order_event("1", "PARTIALLY_FILLED", executed="4"))
+    live.apply(_order_event("2", "CANCELED"))
+
+    service = LiveAccountExchangeService(exchange, live)
+    account = await service.get_account()
+    orders = await service.list_open_orders(SYMBOL)
+
+    assert exchange.account_calls == 1
+    assert [(b.asset, b.free, b.locked) for b in account.balances] == [
+        ("USDT", Decimal("60"), Decimal("40"))
+    ]
+    assert [(o.order_id.value, o.status.value, o.executed_quantity) for o in orders] == [
+        ("1", "PARTIALLY_FILLED", Decimal("4"))
+    ]
+    # A reader holding the account from before the push still sees the old balances.
+    assert [(b.free, b.locked) for b in held.balances] == [(Decimal("100"), Decimal("0"))]
+
+
+@pytest.mark.asyncio
+async def test_pushes_during_reconciliation_are_replayed_on_the_snapshot() -> None:
+    exchange = FakeExchange()
+    live = LiveAccountState(SYMBOL, IdleGateway(), lambda: exchange)
+    await live.refresh()
+
+    exchange.release = asyncio.Event()
+    exchange.usdt = Decimal("90")
+    refresh = asyncio.create_task(live.refresh())
+    await asyncio.sleep(0)
+    live.apply(BalanceEvent("USDT", Decimal("70"), Decimal("0"), 0))
+    live.apply(_order_event("3", "NEW"))
+    exchange.release.set()
+    await refresh
+
+    assert live.account().balances[0].free == Decimal("70")
+    assert live.drift_corrections == 0
+    # An order unknown to the snapshot asks for another reconciliation.
+    assert live._reconcile_requested.is_set()
+
+    exchange.usdt = Decimal("50")
+    await live.refresh()
+    assert live.account().balances[0].free == Decimal("50")
+    assert live.drift_corrections == 1
@@ -0,0 +1,133 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from src.app.domain.events.market_depth_event import MarketDepthEvent
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.local_order_book import (
+    DepthVersionGap,
+    LocalOrderBook,
+)
+
+SYMBOL = Symbol("QRLUSDT")
+
+
+def _diff(from_version: int, to_version: int, bids=(), asks=()) -> MarketDepthEvent:
+    return MarketDepthEvent(
+        symbol=SYMBOL,
+        bids=[(Decimal(p), Decimal(q)) for p, q in bids],
+        asks=[(Decimal(p), Decimal(q)) for p, q in asks],
+        event_type=None,
+        from_version=str(from_version),
+        to_version=str(to_version),
+    )
+
+
+class FakeGateway:
+    def __init__(self):
+        self.streams: dict[str, asyncio.Queue] = {}
+        self.events = self.stream("100ms")
+
+    def stream(self, interval: str) -> asyncio.Queue:
+        return self.streams.setdefault(interval, asyncio.Queue())
+
+    async def subscribe_market_depth(self, symbol, interval="100ms"):
+        queue = self.stream(interval)
+        while True:
+            yield await queue.get()
+
+
+class FakeRest:
+    def __init__(self, snapshots):
+        self.snapshots = list(snapshots)
+        self.calls = 0
+
+    async def depth(self, *, symbol: str, limit: int = 50):
+        self.calls += 1
+        return self.snapshots.pop(0)
+
+
+def _snapshot(version: int, bids, asks) -> dict:
+    return {"lastUpdateId": version, "bids": bids, "asks": asks}
+
+
+def test_apply_skips_stale_diffs_and_detects_gaps() -> None:
+    book = LocalOrderBook(SYMBOL, FakeGateway(), FakeRest([]))
+    book.reset(_snapshot(10, [["1.0", "5"], ["0.9", "1"]], [["1.1", "2"]]))
+
+    assert book.apply(_diff(5, 10, bids=[("1.0", "0")])) is False
+    assert book.apply(_diff(9, 12, bids=[("1.0", "0"), ("1.05", "3")], asks=[("1.2", "4")]))
+
+    view = book.order_book()
+    assert [(str(level.price), str(level.quantity)) for level in view.bids] == [
+        ("1.05", "3"),
+        ("0.9", "1"),
+    ]
+    assert [str(level.price) for level in view.asks] == ["1.1", "1.2"]
+    assert book.version == 12
+
+    with pytest.raises(DepthVersionGap):
+        book.apply(_diff(14, 15))
+
+
+@pytest.mark.asyncio
+async def test_run_resyncs_after_version_gap() -> None:
+    gateway = FakeGateway()
+    rest = FakeRest(
+        [
+            _snapshot(100, [["1.0", "1"]], [["1.1", "1"]]),
+            _snapshot(205, [["2.0", "1"]], [["2.1", "1"]]),
+        ]
+    )
+    book = LocalOrderBook(SYMBOL, gateway, rest, retry_delay=0)
+    book.start()
+
+    gateway.events.put_nowait(_diff(99, 101, bids=[("1.0", "2")]))
+    gateway.events.put_nowait(_diff(102, 102, asks=[("1.1", "0"), ("1.2", "7")]))
+    for _ in range(20):
+        await asyncio.sleep(0)
+    assert book.synced and book.version == 102
+    assert [str(level.price) for level in book.order_book().asks] == ["1.2"]
+
+    gateway.events.put_nowait(_diff(200, 201))
+    gateway.events.put_nowait(_diff(202, 206, asks=[("2.2", "3")]))
+    for _ in range(20):
+        await asyncio.sleep(0)
+    await book.stop()
+
+    assert rest.calls == 2
+    assert book.resyncs == 1
+    assert [str(level.price) for level in book.order_book(1).bids] == ["2.0"]
+    assert [str(level.price) for level in book.order_book().asks] == ["2.1", "2.2"]
+
+
+@pytest.mark.asyncio
+async def test_set_interval_switches_streams_without_losing_sync() -> None:
+    gateway = FakeGateway()
+    rest = FakeRest([_snapshot(100, [["1.0", "1"]], [["1.1", "1"]])])
+    book = LocalOrderBook(SYMBOL, gateway, rest, retry_delay=0)
+    book.start()
+    gateway.events.put_nowait(_diff(101, 102, bids=[("1.0", "2")]))
+    for _ in range(20):
+        await asyncio.sleep(0)
+    assert book.synced and book.version == 102
+
+    await book.set_interval("raw")
+    raw = gateway.stream("raw")
+    raw.put_nowait(_diff(102, 102))
+    raw.put_nowait(_diff(104, 104, asks=[("1.2", "3")]))
+    for _ in range(20):
+        await asyncio.sleep(0)
+    assert book.interval_switches == 0 and book.version == 102
+
+    gateway.events.put_nowait(_diff(103, 103, bids=[("0.9", "4")]))
+    raw.put_nowait(_diff(105, 105, asks=[("1.1", "0")]))
+    for _ in range(20):
+        await asyncio.sleep(0)
+    assert rest.calls == 1 and book.version == 105
+    await book.stop()
+
+    assert book.interval == "raw" and book.interval_switches == 1
+    assert [str(level.price) for level in book.order_book().bids] == ["1.0", "0.9"]
+    assert [str(level.price) for level in book.order_book().asks] == ["1.2"]
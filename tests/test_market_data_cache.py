@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.caching_service import (
+    CachePolicy,
+    CachingExchangeService,
+    MarketDataCache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeExchange:
+    def __init__(self):
+        self.ticker_calls = 0
+
+    async def __aenter__(self) -> "FakeExchange":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    async def get_ticker_24h(self, symbol):
+        self.ticker_calls += 1
+        return {"lastPrice": str(self.ticker_calls)}
+
+
+def _service(exchange: FakeExchange, cache: MarketDataCache) -> CachingExchangeService:
+    policies = {"get_ticker_24h": CachePolicy(ttl=1.0, stale_ttl=5.0)}
+    return CachingExchangeService(exchange, cache, policies, refresh_factory=lambda: exchange)
+
+
+@pytest.mark.asyncio
+async def test_fresh_then_stale_while_revalidate() -> None:
+    clock = FakeClock()
+    exchange = FakeExchange()
+    service = _service(exchange, MarketDataCache(clock=clock))
+    symbol = Symbol("QRLUSDT")
+
+    assert await service.get_ticker_24h(symbol) == {"lastPrice": "1"}
+    assert await service.get_ticker_24h(symbol) == {"lastPrice": "1"}
+    assert exchange.ticker_calls == 1
+
+    clock.now = 2.0
+    assert await service.get_ticker_24h(symbol) == {"lastPrice": "1"}
+    await asyncio.sleep(0)
+    assert exchange.ticker_calls == 2
+    assert await service.get_ticker_24h(symbol) == {"lastPrice": "2"}
+
+    clock.now = 20.0
+    assert await service.get_ticker_24h(symbol) == {"lastPrice": "3"}
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used() -> None:
+    cache = MarketDataCache(max_entries=2)
+    policy = CachePolicy(ttl=60.0)
+
+    async def load(value: int) -> int:
+        return value
+
+    await cache.get_or_load("a", policy, lambda: load(1))
+    await cache.get_or_load("b", policy, lambda: load(2))
+    await cache.get_or_load("a", policy, lambda: load(0))
+    await cache.get_or_load("c", policy, lambda: load(3))
+
+    assert len(cache) == 2
+    assert await cache.get_or_load("a", policy, lambda: load(0)) == 1
+    assert await cache.get_or_load("b", policy, lambda: load(20)) == 20
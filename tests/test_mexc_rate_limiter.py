@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from src.app.infrastructure.exchange.mexc.rate_limiter import (
+    RequestPriority,
+    WeightedRateLimiter,
+    request_priority,
+    request_weight,
+    used_weight_from_headers,
+)
+
+
+def test_request_weight_depends_on_depth_limit() -> None:
+    assert request_weight("GET", "/api/v3/depth", {"limit": 20}) == 1
+    assert request_weight("GET", "/api/v3/depth", {"limit": 500}) == 5
+    assert request_weight("GET", "/api/v3/depth", {"limit": 1000}) == 10
+    assert request_weight("GET", "/api/v3/myTrades", {}) == 10
+
+
+def test_order_entry_uses_trading_lane() -> None:
+    assert request_priority("POST", "/api/v3/order", True) is RequestPriority.TRADING
+    assert request_priority("GET", "/api/v3/order", True) is RequestPriority.ACCOUNT
+    assert request_priority("GET", "/api/v3/depth", False) is RequestPriority.MARKET_DATA
+
+
+@pytest.mark.asyncio
+async def test_trading_lane_skips_queued_market_data() -> None:
+    limiter = WeightedRateLimiter(capacity=10, interval=0.5, reserved=2)
+    await limiter.acquire(8, RequestPriority.MARKET_DATA)
+
+    order: list[str] = []
+
+    async def take(name: str, weight: int, priority: RequestPriority) -> None:
+        await limiter.acquire(weight, priority)
+        order.append(name)
+
+    market = asyncio.create_task(take("market", 5, RequestPriority.MARKET_DATA))
+    await asyncio.sleep(0)
+    await take("order", 2, RequestPriority.TRADING)
+    assert order == ["order"]
+
+    await market
+    assert order == ["order", "market"]
+
+
+@pytest.mark.asyncio
+async def test_penalize_blocks_until_retry_after() -> None:
+    limiter = WeightedRateLimiter(capacity=10, interval=1.0)
+    limiter.penalize(0.05)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    await limiter.acquire(1, RequestPriority.TRADING)
+
+    assert loop.time() - started >= 0.05
+
+
+def test_used_weight_is_scaled_from_the_server_window() -> None:
+    assert used_weight_from_headers({"x-mbx-used-weight-1m": "900"}) == (900, 60.0)
+    assert used_weight_from_headers({"x-mexc-used-weight": "30"}) == (30, None)
+
+    limiter = WeightedRateLimiter(capacity=100, interval=10)
+    # 900 of a one-minute budget of 600 is already over it.
+    limiter.observe_used_weight(900, 60.0)
+    assert limiter.available < 0
+
+    limiter = WeightedRateLimiter(capacity=100, interval=10)
+    # 300 of 600 per minute leaves more than one interval's bucket.
+    limiter.observe_used_weight(300, 60.0)
+    assert limiter.available == pytest.approx(100, abs=1)
+
+    limiter = WeightedRateLimiter(capacity=100, interval=10)
+    # Unsuffixed headers are taken to count the limiter's own interval.
+    limiter.observe_used_weight(30)
+    assert limiter.available == pytest.approx(70, abs=1)
@@ -0,0 +1,67 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.app.infrastructure.exchange.mexc.rest_client import MexcRestClient
+from src.app.infrastructure.exchange.mexc.settings import MexcSettings
+
+
+def _settings() -> MexcSettings:
+    return MexcSettings(MEXC_API_KEY="key", MEXC_SECRET_KEY="secret")
+
+
+def _transport(calls: list[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"serverTime": 1})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_nested_leases_share_one_pool() -> None:
+    calls: list[httpx.Request] = []
+    client = MexcRestClient(_settings(), transport=_transport(calls))
+
+    async with client:
+        pool = client._client
+        async with client:
+            assert client._client is pool
+            await client.get_server_time()
+        assert client.is_open
+
+    assert not client.is_open
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_pinned_client_survives_lease_release() -> None:
+    client = await MexcRestClient(_settings(), transport=_transport([])).open()
+
+    async with client:
+        pool = client._client
+    async with client:
+        assert client._client is pool
+
+    assert client.is_open
+    await client.aclose()
+    assert not client.is_open
+
+
+@pytest.mark.asyncio
+async def test_concurrent_public_reads_are_coalesced() -> None:
+    calls: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"bids": [], "asks": []})
+
+    async with MexcRestClient(_settings(), transport=httpx.MockTransport(handler)) as client:
+        results = await asyncio.gather(*(client.depth(symbol="QRLUSDT", limit=20) for _ in range(3)))
+        await asyncio.gather(client.get_account(), client.get_account())
+
+    assert results[0] is results[1] is results[2]
+    assert client.single_flight.coalesced == 2
+    assert [request.url.path for request in calls] == ["/api/v3/depth"] + ["/api/v3/account"] * 2
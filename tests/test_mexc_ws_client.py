@@ -0,0 +1,255 @@
+import asyncio
+import json
+
+import pytest
+import websockets
+
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.adapters.market_event_adapter import MexcExchangeGateway
+from src.app.infrastructure.exchange.mexc.generated import PushDataV3ApiWrapper_pb2
+from src.app.infrastructure.exchange.mexc.ws.mexc_ws_client import MexcWebSocketClient
+
+
+def _depth_frame(channel: str, version: str) -> bytes:
+    wrapper = PushDataV3ApiWrapper_pb2.PushDataV3ApiWrapper(channel=channel, symbol="QRLUSDT")
+    wrapper.publicAggreDepths.bids.add(price="0.5", quantity="10")
+    wrapper.publicAggreDepths.asks.add(price="0.6", quantity="0")
+    wrapper.publicAggreDepths.fromVersion = version
+    wrapper.publicAggreDepths.toVersion = version
+    return wrapper.SerializeToString()
+
+
+class LocalMexcServer:
+    """Stand-in MEXC endpoint: acks subscriptions and pushes one depth frame per stream."""
+
+    def __init__(self, drop_connections: int = 0):
+        self.requests: list[dict] = []
+        self.connections = 0
+        self.drop_connections = drop_connections
+
+    async def handler(self, websocket) -> None:
+        self.connections += 1
+        async for raw in websocket:
+            request = json.loads(raw)
+            if request["method"] == "PING":
+                await websocket.send(json.dumps({"id": 0, "code": 0, "msg": "PONG"}))
+                continue
+            self.requests.append(request)
+            stream = request["params"][0]
+            await websocket.send(json.dumps({"id": 0, "code": 0, "msg": stream}))
+            if request["method"] == "SUBSCRIPTION":
+                await websocket.send(b"\x00garbage")
+                await websocket.send(_depth_frame(stream, str(len(self.requests))))
+                if self.connections <= self.drop_connections:
+                    await websocket.close()
+
+
+@pytest.mark.asyncio
+async def test_channels_share_one_connection_and_yield_typed_messages() -> None:
+    server = LocalMexcServer()
+    async with websockets.serve(server.handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        client = MexcWebSocketClient(f"ws://127.0.0.1:{port}")
+
+        depth = client.subscribe("depth", "QRLUSDT")
+        raw = client.subscribe("spot@public.aggre.depth.v3.api.pb@10ms@QRLUSDT")
+        first = await asyncio.wait_for(anext(depth), 1)
+        second = await asyncio.wait_for(anext(raw), 1)
+        await depth.aclose()
+        await raw.aclose()
+        await client.close()
+
+    assert server.connections == 1
+    assert [request["method"] for request in server.requests] == [
+        "SUBSCRIPTION",
+        "SUBSCRIPTION",
+        "UNSUBSCRIPTION",
+        "UNSUBSCRIPTION",
+    ]
+    assert first.bids[0].price == "0.5"
+    assert second.toVersion == "2"
+
+
+@pytest.mark.asyncio
+async def test_gateway_maps_depth_frames_to_domain_events() -> None:
+    server = LocalMexcServer()
+    async with websockets.serve(server.handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        client = MexcWebSocketClient(f"ws://127.0.0.1:{port}")
+        events = MexcExchangeGateway(client).subscribe_market_depth(Symbol("QRLUSDT"))
+
+        event = await asyncio.wait_for(anext(events), 1)
+        await events.aclose()
+        await client.close()
+
+    assert str(event.bids[0][0]) == "0.5"
+    assert event.asks[0][1] == 0
+    assert event.to_version == "1"
+
+
+@pytest.mark.asyncio
+async def test_gateway_resubscribes_a_silent_market_stream() -> None:
+    server = LocalMexcServer()
+    async with websockets.serve(server.handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        client = MexcWebSocketClient(f"ws://127.0.0.1:{port}", watchdog_interval=0.01)
+        gateway = MexcExchangeGateway(client, stale_after=0.05)
+        events = gateway.subscribe_market_depth(Symbol("QRLUSDT"))
+
+        # The server pushes once per SUBSCRIPTION, so a second event needs a resubscribe.
+        first = await asyncio.wait_for(anext(events), 1)
+        second = await asyncio.wait_for(anext(events), 1)
+        stats = client.stats()
+        await events.aclose()
+        await client.close()
+
+    assert server.connections == 1
+    assert [request["method"] for request in server.requests[:3]] == [
+        "SUBSCRIPTION",
+        "UNSUBSCRIPTION",
+        "SUBSCRIPTION",
+    ]
+    assert (first.to_version, second.to_version) == ("1", "3")
+    assert stats["streams"]["spot@public.aggre.depth.v3.api.pb@100ms@QRLUSDT"]["gaps"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_switch_url_resubscribes_before_dropping_the_old_connection() -> None:
+    old_server, new_server = LocalMexcServer(), LocalMexcServer()
+    async with websockets.serve(old_server.handler, "127.0.0.1", 0) as old_ws, websockets.serve(
+        new_server.handler, "127.0.0.1", 0
+    ) as new_ws:
+        old_port = old_ws.sockets[0].getsockname()[1]
+        new_port = new_ws.sockets[0].getsockname()[1]
+        client = MexcWebSocketClient(f"ws://127.0.0.1:{old_port}")
+
+        stream = client.subscribe("depth", "QRLUSDT")
+        first = await asyncio.wait_for(anext(stream), 1)
+        await client.switch_url(f"ws://127.0.0.1:{new_port}")
+        second = await asyncio.wait_for(anext(stream), 1)
+        await stream.aclose()
+        await client.close()
+
+    assert first.toVersion == "1" and second.toVersion == "1"
+    assert [request["method"] for request in new_server.requests] == [
+        "SUBSCRIPTION",
+        "UNSUBSCRIPTION",
+    ]
+    assert [request["method"] for request in old_server.requests] == ["SUBSCRIPTION"]
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection_is_reestablished_and_streams_resubscribed() -> None:
+    server = LocalMexcServer(drop_connections=1)
+    reconnected: list[int] = []
+    async with websockets.serve(server.handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        client = MexcWebSocketClient(f"ws://127.0.0.1:{port}", reconnect_delay=0.01)
+        client.add_reconnect_listener(lambda: reconnected.append(client.reconnects))
+
+        stream = client.subscribe("depth", "QRLUSDT")
+        first = await asyncio.wait_for(anext(stream), 1)
+        second = await asyncio.wait_for(anext(stream), 1)
+        stats = client.stats()
+        await stream.aclose()
+        await client.close()
+
+    assert server.connections == 2
+    assert (first.toVersion, second.toVersion) == ("1", "2")
+    assert reconnected == [1]
+    assert stats["streams"]["spot@public.aggre.depth.v3.api.pb@100ms@QRLUSDT"]["gaps"] == 1
+
+
+@pytest.mark.asyncio
+async def test_silent_connection_is_pinged_and_dropped_without_pong() -> None:
+    requests: list[str] = []
+
+    async def mute_handler(websocket) -> None:
+        async for raw in websocket:
+            requests.append(json.loads(raw)["method"])
+
+    async with websockets.serve(mute_handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        client = MexcWebSocketClient(
+            f"ws://127.0.0.1:{port}",
+            ping_interval=0.05,
+            pong_timeout=0.05,
+            watchdog_interval=0.01,
+            reconnect_delay=0.01,
+        )
+        consumer = asyncio.create_task(anext(client.subscribe("depth", "QRLUSDT")))
+        for _ in range(100):
+            if client.reconnects:
+                break
+            await asyncio.sleep(0.02)
+        consumer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await consumer
+        await client.close()
+
+    assert client.reconnects >= 1
+    assert "PING" in requests
+    assert requests.count("SUBSCRIPTION") >= 2
+
+
+@pytest.mark.asyncio
+async def test_thread_decoding_delivers_mapped_events_in_order() -> None:
+    server = LocalMexcServer()
+    async with websockets.serve(server.handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        client = MexcWebSocketClient(f"ws://127.0.0.1:{port}", decode_in_thread=True)
+        gateway = MexcExchangeGateway(client)
+        depth = gateway.subscribe_market_depth(Symbol("QRLUSDT"))
+        first = await asyncio.wait_for(anext(depth), 1)
+        raw = client.subscribe("spot@public.aggre.depth.v3.api.pb@10ms@QRLUSDT")
+        second = await asyncio.wait_for(anext(raw), 1)
+        stats = client.stats()
+        await depth.aclose()
+        await raw.aclose()
+        await client.close()
+
+    assert (first.to_version, second.toVersion) == ("1", "2")
+    assert stats["decode"]["frames"] >= 2
+    assert stats["decode"]["batches"] >= 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("decode_in_thread", [False, True])
+async def test_mapper_failure_drops_only_that_frame_for_that_stream(decode_in_thread) -> None:
+    connections = 0
+
+    async def handler(websocket) -> None:
+        nonlocal connections
+        connections += 1
+        async for raw in websocket:
+            request = json.loads(raw)
+            if request["method"] != "SUBSCRIPTION":
+                continue
+            stream = request["params"][0]
+            for version in ("1", "2", "3"):
+                await websocket.send(_depth_frame(stream, version))
+
+    def mapper(body) -> list[str]:
+        if body.toVersion == "2":
+            raise ArithmeticError("bad frame")
+        return [body.toVersion]
+
+    async with websockets.serve(handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        client = MexcWebSocketClient(
+            f"ws://127.0.0.1:{port}", decode_in_thread=decode_in_thread
+        )
+        mapped = client.subscribe("depth", "QRLUSDT", mapper=mapper)
+        mapped_items = [await asyncio.wait_for(anext(mapped), 1) for _ in range(2)]
+        raw = client.subscribe("depth", "QRLUSDT", interval="10ms")
+        raw_items = [(await asyncio.wait_for(anext(raw), 1)).toVersion for _ in range(3)]
+        stats = client.stats()
+        await mapped.aclose()
+        await raw.aclose()
+        await client.close()
+
+    assert mapped_items == ["1", "3"]
+    assert raw_items == ["1", "2", "3"]
+    assert connections == 1 and stats["reconnects"] == 0
+    stream = stats["streams"]["spot@public.aggre.depth.v3.api.pb@100ms@QRLUSDT"]
+    assert stream["mapping_errors"] == 1
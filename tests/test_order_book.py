@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+from src.app.domain.services.depth_calculator import DepthCalculator
+from src.app.domain.value_objects.order_book import DepthLevel, OrderBook, OrderBookSide
+from src.app.domain.value_objects.quantity import Quantity
+from src.app.domain.value_objects.side import Side
+
+
+def _book() -> OrderBook:
+    return OrderBook(
+        bids=[DepthLevel(Decimal("0.9"), Decimal("1")), DepthLevel(Decimal("1.0"), Decimal("2"))],
+        asks=[DepthLevel(Decimal("1.2"), Decimal("3")), DepthLevel(Decimal("1.1"), Decimal("1"))],
+    )
+
+
+def test_sides_are_ordered_best_first_with_constant_time_best_prices() -> None:
+    book = _book()
+
+    assert book.best_bid == Decimal("1.0")
+    assert book.best_ask == Decimal("1.1")
+    assert book.mid_price == Decimal("1.05")
+    assert [level.price for level in book.bids] == [Decimal("1.0"), Decimal("0.9")]
+    assert [level.price for level in book.asks] == [Decimal("1.1"), Decimal("1.2")]
+
+
+def test_updates_insert_replace_and_delete_levels() -> None:
+    book = _book()
+    bid = OrderBookSide("BID")
+    ask = OrderBookSide("ASK")
+
+    book.update(bid, Decimal("1.05"), Decimal("4"))
+    book.update(bid, Decimal("0.9"), Decimal("5"))
+    book.update(ask, Decimal("1.1"), Decimal("0"))
+    book.update(ask, Decimal("1.3"), Decimal("0"))
+
+    assert book.bid_side.prices() == [Decimal("1.05"), Decimal("1.0"), Decimal("0.9")]
+    assert book.bid_side.quantities() == [Decimal("4"), Decimal("2"), Decimal("5")]
+    assert book.ask_side.prices() == [Decimal("1.2")]
+
+    top = book.top(1)
+    book.update(bid, Decimal("1.05"), Decimal("0"))
+    assert top.bids == [DepthLevel(Decimal("1.05"), Decimal("4"))]
+    assert book.best_bid == Decimal("1.0")
+
+
+def test_depth_calculator_walks_sorted_levels() -> None:
+    filled, vwap = DepthCalculator().compute(_book(), Side("BUY"), Quantity(Decimal("2")))
+
+    assert filled == Decimal("2")
+    assert vwap == Decimal("1.15")
+
+
+def test_cumulative_depth_answers_many_sizes_by_binary_search() -> None:
+    depth = _book().ask_side.cumulative()
+
+    partial, exact, beyond = depth.fills([Decimal("0.5"), Decimal("4"), Decimal("10")])
+
+    assert (partial.filled, partial.vwap, partial.levels) == (Decimal("0.5"), Decimal("1.1"), 1)
+    assert exact.complete and exact.worst_price == Decimal("1.2")
+    assert exact.vwap == Decimal("4.7") / Decimal("4")
+    assert not beyond.complete
+    assert beyond.filled == depth.total_quantity == Decimal("4")
+    assert beyond.slippage_pct == (exact.vwap - Decimal("1.1")) / Decimal("1.1") * 100
+
+
+def test_non_positive_fill_target_fills_nothing() -> None:
+    estimate = _book().ask_side.cumulative().fill(Decimal("0"))
+
+    assert (estimate.filled, estimate.vwap, estimate.levels) == (Decimal("0"), Decimal("0"), 0)
@@ -0,0 +1,79 @@
+import pytest
+from google.protobuf.message import DecodeError
+
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.adapters.market_event_adapter import _map_fill, _map_order
+from src.app.infrastructure.exchange.mexc.generated import PushDataV3ApiWrapper_pb2
+from src.app.infrastructure.exchange.mexc.ws.mexc_ws_client import MexcWebSocketClient
+from src.app.infrastructure.exchange.mexc.ws.push_frame import PushFrame, peek_channel
+
+BOOK_TICKER = "spot@public.aggre.bookTicker.v3.api.pb@100ms@QRLUSDT"
+
+
+def _book_ticker_frame(channel: str = BOOK_TICKER) -> bytes:
+    wrapper = PushDataV3ApiWrapper_pb2.PushDataV3ApiWrapper(
+        channel=channel, symbol="QRLUSDT", sendTime=1_700_000_000_123
+    )
+    ticker = wrapper.publicAggreBookTicker
+    ticker.bidPrice, ticker.bidQuantity = "0.51", "100"
+    ticker.askPrice, ticker.askQuantity = "0.52", "80"
+    return wrapper.SerializeToString()
+
+
+def test_frame_envelope_is_read_without_decoding_the_body() -> None:
+    data = _book_ticker_frame()
+    frame = PushFrame(data)
+
+    assert peek_channel(data) == BOOK_TICKER
+    assert (frame.channel, frame.symbol) == (BOOK_TICKER, "QRLUSDT")
+    assert frame.send_time == 1_700_000_000_123
+    assert frame.body_name == "publicAggreBookTicker"
+    assert frame._body is None
+    assert frame.select(("bidPrice", "askPrice", "missing")) == {
+        "bidPrice": "0.51",
+        "askPrice": "0.52",
+    }
+    with pytest.raises(DecodeError):
+        PushFrame(b"\x00garbage")
+
+
+def test_unsubscribed_channels_are_skipped_before_body_decoding() -> None:
+    client = MexcWebSocketClient()
+    client._dispatch(_book_ticker_frame("spot@public.aggre.bookTicker.v3.api.pb@100ms@BTCUSDT"))
+
+    assert client.skipped_frames == 1
+
+
+def _order_frame(symbol: str) -> bytes:
+    wrapper = PushDataV3ApiWrapper_pb2.PushDataV3ApiWrapper(
+        channel="spot@private.orders.v3.api.pb", symbol=symbol
+    )
+    order = wrapper.privateOrders
+    order.id, order.price, order.quantity, order.status = "C02", "0.5", "100", 1
+    return wrapper.SerializeToString()
+
+
+def test_order_pushes_take_their_symbol_from_the_wrapper() -> None:
+    (event,) = _map_order(None, PushFrame(_order_frame("QRLUSDT")))
+
+    assert event.symbol == Symbol("QRLUSDT")
+    assert event.order_id.value == "C02"
+    # Orders on other pairs of the account are not attributed to QRL/USDT.
+    assert _map_order(None, PushFrame(_order_frame("BTCUSDT"))) == []
+
+
+def _fill_frame(symbol: str) -> bytes:
+    wrapper = PushDataV3ApiWrapper_pb2.PushDataV3ApiWrapper(
+        channel="spot@private.deals.v3.api.pb", symbol=symbol
+    )
+    deal = wrapper.privateDeals
+    deal.tradeId, deal.orderId, deal.price, deal.quantity = "T7", "C02", "0.5", "10"
+    return wrapper.SerializeToString()
+
+
+def test_fill_pushes_take_their_symbol_from_the_wrapper() -> None:
+    (event,) = _map_fill(None, PushFrame(_fill_frame("QRLUSDT")))
+
+    assert event.symbol == Symbol("QRLUSDT")
+    assert event.trade_id.value == "T7"
+    assert _map_fill(None, PushFrame(_fill_frame("BTCUSDT"))) == []
@@ -0,0 +1,74 @@
+from collections import Counter
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.app.application.market.qrl.get_qrl_summary import GetQrlSummary
+from src.app.domain.entities.account import Account
+from src.app.domain.value_objects.balance import Balance
+from src.app.domain.value_objects.kline import KLine
+from src.app.domain.value_objects.order_book import DepthLevel, OrderBook
+from src.app.domain.value_objects.timestamp import Timestamp
+
+
+class FakeExchange:
+    def __init__(self):
+        self.calls: Counter[str] = Counter()
+        self.sessions = 0
+
+    async def __aenter__(self) -> "FakeExchange":
+        self.sessions += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    async def get_ticker_24h(self, symbol):
+        self.calls["ticker"] += 1
+        return {"bidPrice": "1.0", "askPrice": "1.2", "lastPrice": "1.1", "closeTime": 1}
+
+    async def get_kline(self, symbol, interval, limit=100):
+        self.calls["klines"] += 1
+        return [KLine.from_raw(*(Decimal("1"),) * 5, interval, 60_000)]
+
+    async def get_depth(self, symbol, limit=50):
+        self.calls["depth"] += 1
+        return OrderBook(
+            bids=[DepthLevel(Decimal("1.0"), Decimal("5"))],
+            asks=[DepthLevel(Decimal("1.2"), Decimal("5"))],
+        )
+
+    async def get_account(self):
+        self.calls["account"] += 1
+        return Account(
+            can_trade=True,
+            update_time=Timestamp(datetime.now(timezone.utc)),
+            balances=[Balance("QRL", Decimal("10"), Decimal("0"))],
+        )
+
+    async def list_open_orders(self, symbol=None):
+        self.calls["open_orders"] += 1
+        return []
+
+    async def list_trades(self, symbol):
+        self.calls["my_trades"] += 1
+        return []
+
+    async def get_market_trades(self, symbol, limit=50):
+        self.calls["trades"] += 1
+        return [{"id": i} for i in range(limit + 5)]
+
+
+@pytest.mark.asyncio
+async def test_summary_fetches_each_resource_once_over_one_session() -> None:
+    exchange = FakeExchange()
+
+    summary = await GetQrlSummary(lambda: exchange, trades_limit=3).execute()
+
+    assert exchange.sessions == 1
+    assert set(exchange.calls.values()) == {1}
+    assert len(exchange.calls) == 7
+    assert summary.price.last == "1.1000"
+    assert summary.balance["valuation"]["price_mid"] == "1.1"
+    assert len(summary.market_trades) == 3
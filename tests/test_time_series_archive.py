@@ -0,0 +1,237 @@
+import os
+from decimal import Decimal
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.app.domain.value_objects.order_book import DepthLevel, OrderBook
+from src.app.domain.value_objects.symbol import Symbol
+from src.app.infrastructure.exchange.mexc.archive_recorder import ArchiveRecorder
+from src.app.infrastructure.storage import time_series_archive
+from src.app.infrastructure.storage.time_series_archive import (
+    DAY_MS,
+    KLINE_LAYOUT,
+    TimeSeriesArchive,
+    default_layouts,
+    depth_row,
+)
+from src.app.interfaces.http.api import market_routes
+from src.app.interfaces.http.dependencies import get_time_series_archive
+
+MINUTE = 60_000
+
+
+def _candle(open_time: int, close: str, volume: str = "10") -> list[int]:
+    price = KLINE_LAYOUT.columns[1]
+    return [open_time] + [price.encode(Decimal(v)) for v in (close, close, close, close, volume)]
+
+
+@pytest.mark.asyncio
+async def test_archive_buffers_appends_and_reads_ranges_across_days(tmp_path) -> None:
+    archive = TimeSeriesArchive(tmp_path, default_layouts(2))
+    start = DAY_MS - 3 * MINUTE
+    for i in range(6):
+        archive.append("klines_1m", "QRLUSDT", _candle(start + i * MINUTE, f"0.{i + 1}"))
+
+    assert list(archive.read("klines_1m", "QRLUSDT", 0, 2 * DAY_MS)) == []
+    assert archive.pending_rows == 6
+    await archive.flush()
+
+    segments = list(archive.read("klines_1m", "QRLUSDT", start + MINUTE, start + 4 * MINUTE))
+    assert [len(segment) for segment in segments] == [2, 2]
+    assert list(segments[0].times) == [start + MINUTE, start + 2 * MINUTE]
+    assert segments[1].value("close", 1) == Decimal("0.5")
+    assert archive.last_time("klines_1m", "QRLUSDT") == start + 5 * MINUTE
+    assert (tmp_path / "klines_1m" / "QRLUSDT" / "1970-01-02" / "close.i64").exists()
+
+
+@pytest.mark.asyncio
+async def test_archive_resamples_klines_across_partitions(tmp_path) -> None:
+    archive = TimeSeriesArchive(tmp_path, default_layouts())
+    # 7m buckets do not divide a day: the one opening at minute 1435 ends on day two.
+    start = 1435 * MINUTE
+    for i, close in enumerate(["2", "3", "1", "4", "6", "5", "5", "9"]):
+        archive.append("klines_1m", "QRLUSDT", _candle(start + i * MINUTE, close, "1.5"))
+    await archive.flush()
+
+    klines = archive.klines("QRLUSDT", start - MINUTE, start + 7 * MINUTE, "7m")
+
+    assert len(klines) == 2
+    kline = klines[0]
+    assert (kline.open, kline.high, kline.low, kline.close) == (2, 6, 1, 5)
+    assert kline.volume == Decimal("10.5")
+    assert kline.interval == "7m"
+    assert klines[1].close == 9
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc/self/fd")
+async def test_long_range_reads_map_one_partition_at_a_time(tmp_path, monkeypatch) -> None:
+    archive = TimeSeriesArchive(tmp_path, default_layouts())
+    for day in range(40):
+        archive.append("klines_1m", "QRLUSDT", _candle(day * DAY_MS, "0.1"))
+    await archive.flush()
+    open_fds: list[int] = []
+    map_partition = TimeSeriesArchive._map
+
+    def counting_map(layout, path):
+        open_fds.append(len(os.listdir("/proc/self/fd")))
+        return map_partition(layout, path)
+
+    monkeypatch.setattr(TimeSeriesArchive, "_map", staticmethod(counting_map))
+    klines = archive.klines("QRLUSDT", 0, 40 * DAY_MS, "1d")
+
+    assert len(klines) == 40
+    # Each partition's six column mappings are released before the next is mapped.
+    assert max(open_fds) - min(open_fds) < len(KLINE_LAYOUT.columns)
+    (segment,) = archive.read("klines_1m", "QRLUSDT", 0, 0)
+    with segment:
+        assert list(segment.times) == [0]
+
+
+@pytest.mark.asyncio
+async def test_archive_realigns_torn_columns_and_bounds_the_buffer(tmp_path) -> None:
+    archive = TimeSeriesArchive(tmp_path, default_layouts(2), max_pending_rows=2)
+    book = OrderBook(
+        bids=[DepthLevel(price=Decimal("0.2"), quantity=Decimal("5"))],
+        asks=[DepthLevel(price=Decimal("0.3"), quantity=Decimal("7"))],
+    )
+    assert archive.append("depth_2", "QRLUSDT", depth_row(1, book, 2))
+    assert archive.append("depth_2", "QRLUSDT", depth_row(2, book, 2))
+    assert not archive.append("depth_2", "QRLUSDT", depth_row(3, book, 2))
+    assert archive.dropped == 1
+    await archive.flush()
+
+    # An interrupted write left one column a row ahead.
+    partition = tmp_path / "depth_2" / "QRLUSDT" / "1970-01-01"
+    with open(partition / "time.i64", "ab") as file:
+        file.write((99).to_bytes(8, "little", signed=True))
+    reopened = TimeSeriesArchive(tmp_path, default_layouts(2))
+    reopened.append("depth_2", "QRLUSDT", depth_row(4, book, 2))
+    await reopened.stop()
+
+    (segment,) = reopened.read("depth_2", "QRLUSDT", 0, 10)
+    assert list(segment.times) == [1, 2, 4]
+    assert segment.value("bid_price", 2) == [Decimal("0.2"), Decimal("0")]
+    assert segment.value("ask_quantity", 0) == [Decimal("7"), Decimal("0")]
+
+
+@pytest.mark.asyncio
+async def test_failed_write_mid_batch_keeps_columns_aligned(tmp_path, monkeypatch) -> None:
+    archive = TimeSeriesArchive(tmp_path, default_layouts())
+    archive.append("klines_1m", "QRLUSDT", _candle(0, "0.1"))
+    archive.append("klines_1m", "QRLUSDT", _candle(MINUTE, "0.2"))
+    await archive.flush()
+
+    def open_or_fail(file, mode="r", *args, **kwargs):
+        if str(file).endswith("close.i64"):
+            raise OSError("disk full")
+        return open(file, mode, *args, **kwargs)
+
+    # The time, open, high and low columns get the row; close and volume do not.
+    monkeypatch.setattr(time_series_archive, "open", open_or_fail, raising=False)
+    archive.append("klines_1m", "QRLUSDT", _candle(2 * MINUTE, "0.3"))
+    with pytest.raises(OSError):
+        await archive.flush()
+    monkeypatch.undo()
+    archive.append("klines_1m", "QRLUSDT", _candle(3 * MINUTE, "0.4"))
+    await archive.flush()
+
+    (segment,) = archive.read("klines_1m", "QRLUSDT", 0, DAY_MS)
+    assert list(segment.times) == [0, MINUTE, 3 * MINUTE]
+    prices = [Decimal(v) for v in ("0.1", "0.2", "0.4")]
+    assert [segment.value("open", i) for i in range(3)] == prices
+    assert [segment.value("close", i) for i in range(3)] == prices
+    partition = tmp_path / "klines_1m" / "QRLUSDT" / "1970-01-01"
+    assert {(partition / f"{c.name}.i64").stat().st_size for c in KLINE_LAYOUT.columns} == {24}
+
+
+class FakeRest:
+    def __init__(self, candles: int):
+        self.candles = candles
+        self.starts: list[int | None] = []
+
+    async def klines(self, *, symbol, interval, limit=100, start_time=None, end_time=None):
+        self.starts.append(start_time)
+        first = (start_time or 0) // MINUTE
+        return [
+            [t * MINUTE, "0.1", "0.2", "0.1", "0.2", "3"]
+            for t in range(first, self.candles)
+        ][:limit]
+
+
+@pytest.mark.asyncio
+async def test_recorder_archives_closed_candles_and_resumes_after_restart(tmp_path) -> None:
+    rest = FakeRest(candles=5)
+    now = 4 * MINUTE + 30_000  # the fifth candle is still open
+
+    def recorder(archive: TimeSeriesArchive) -> ArchiveRecorder:
+        return ArchiveRecorder(Symbol("QRLUSDT"), archive, None, rest, clock_ms=lambda: now)
+
+    archive = TimeSeriesArchive(tmp_path, default_layouts())
+    assert await recorder(archive).record_klines() == 4
+    await archive.flush()
+
+    rest.candles, now = 7, 7 * MINUTE
+    restarted = TimeSeriesArchive(tmp_path, default_layouts())
+    assert await recorder(restarted).record_klines() == 3
+    await restarted.flush()
+
+    assert rest.starts == [None, 4 * MINUTE]
+    (segment,) = restarted.read("klines_1m", "QRLUSDT", 0, DAY_MS)
+    assert list(segment.times) == [t * MINUTE for t in range(7)]
+
+
+@pytest.mark.asyncio
+async def test_recorder_keeps_its_cursor_when_the_flush_fails(tmp_path, monkeypatch) -> None:
+    rest = FakeRest(candles=5)
+    archive = TimeSeriesArchive(tmp_path, default_layouts())
+    recorder = ArchiveRecorder(
+        Symbol("QRLUSDT"), archive, None, rest, clock_ms=lambda: 4 * MINUTE + 30_000
+    )
+
+    def broken_write(batch) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(archive, "_write", broken_write)
+    with pytest.raises(OSError):
+        await recorder.record_klines()
+    monkeypatch.undo()
+    assert await recorder.record_klines() == 4
+
+    assert rest.starts == [None, None]
+    assert archive.last_time("klines_1m", "QRLUSDT") == 3 * MINUTE
+
+
+@pytest.mark.asyncio
+async def test_archived_klines_route_serves_resampled_history(tmp_path) -> None:
+    archive = TimeSeriesArchive(tmp_path, default_layouts())
+    for i, close in enumerate(["2", "3", "1", "4", "6"]):
+        archive.append("klines_1m", "QRLUSDT", _candle(i * MINUTE, close))
+    await archive.flush()
+    app = FastAPI()
+    app.include_router(market_routes.router, prefix="/api/market")
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        app.dependency_overrides[get_time_series_archive] = lambda: archive
+        response = await client.get(
+            "/api/market/archive/klines",
+            params={"start_time": 0, "end_time": 4 * MINUTE, "interval": "5m"},
+        )
+        too_long = await client.get(
+            "/api/market/archive/klines", params={"start_time": 0, "end_time": DAY_MS}
+        )
+        app.dependency_overrides[get_time_series_archive] = lambda: None
+        disabled = await client.get(
+            "/api/market/archive/klines", params={"start_time": 0, "end_time": MINUTE}
+        )
+
+    assert response.status_code == 200
+    (kline,) = response.json()
+    prices = [Decimal(kline[key]) for key in ("open", "high", "low", "close")]
+    assert prices == [Decimal("2"), Decimal("6"), Decimal("1"), Decimal("6")]
+    assert Decimal(kline["volume"]) == Decimal("50")
+    assert too_long.status_code == 422
+    assert disabled.status_code == 404